@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""Micro-benchmark: streaming [Desktop Entry] parser vs. configparser.
+
+Generates a corpus of realistic .desktop files (dozens of localised keys and
+several ``[Desktop Action …]`` groups each) in a temporary directory, then
+times ``AppDiscovery._parse_desktop_file`` against the previous
+``configparser.RawConfigParser`` implementation and checks both yield the
+same entries.
+
+Usage:
+    python scripts/bench_desktop_parser.py [--files 1500] [--repeat 5]
+"""
+
+import argparse
+import configparser
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from modules.app_discovery import AppDiscovery, AppEntry  # noqa: E402
+
+_LOCALES = [
+    "ar",
+    "de",
+    "es",
+    "fr",
+    "it",
+    "ja",
+    "ko",
+    "nl",
+    "pl",
+    "pt_BR",
+    "ru",
+    "sv",
+    "uk",
+    "zh_CN",
+]
+
+
+def _desktop_text(i: int) -> str:
+    lines = ["[Desktop Entry]", "Version=1.0", "Type=Application", f"Name=Application {i}"]
+    for loc in _LOCALES:
+        lines.append(f"Name[{loc}]=Application {i} ({loc})")
+        lines.append(f"GenericName[{loc}]=Generic tool {i} ({loc})")
+        lines.append(f"Comment[{loc}]=Does useful things number {i} ({loc})")
+        lines.append(f"Keywords[{loc}]=tool;utility;app{i};")
+    lines += [
+        f"Exec=app{i} %U",
+        f"Icon=app{i}",
+        "Terminal=false",
+        "Categories=Utility;Development;",
+        "StartupNotify=true",
+        "Actions=new-window;preferences;",
+        "",
+    ]
+    for action in ("new-window", "preferences", "quit"):
+        lines.append(f"[Desktop Action {action}]")
+        lines.append(f"Name={action}")
+        lines += [f"Name[{loc}]={action} ({loc})" for loc in _LOCALES]
+        lines.append(f"Exec=app{i} --{action}")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def _configparser_parse(path: Path) -> AppEntry | None:
+    """The pre-streaming implementation, kept here as the baseline."""
+    parser = configparser.RawConfigParser(strict=False)
+    parser.optionxform = str
+    try:
+        parser.read(str(path), encoding="utf-8")
+    except Exception:
+        return None
+    section = "Desktop Entry"
+    if not parser.has_section(section):
+        return None
+
+    def get(key, fallback=""):
+        return parser.get(section, key, fallback=fallback)
+
+    def getbool(key, fallback=False):
+        try:
+            return parser.getboolean(section, key, fallback=fallback)
+        except Exception:
+            return fallback
+
+    if get("Type") != "Application" or getbool("NoDisplay") or getbool("Hidden"):
+        return None
+    name, exec_cmd = get("Name"), get("Exec")
+    if not name or not exec_cmd:
+        return None
+    raw = get("Categories")
+    return AppEntry(
+        name=name,
+        exec_cmd=exec_cmd,
+        icon_name=get("Icon"),
+        categories=[c.strip() for c in raw.split(";") if c.strip()] if raw else [],
+        terminal=getbool("Terminal"),
+    )
+
+
+def _time(parse, files, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for path in files:
+            parse(path)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--files", type=int, default=1500, help="corpus size (default 1500)")
+    ap.add_argument("--repeat", type=int, default=5, help="timing runs, best is kept")
+    args = ap.parse_args()
+
+    # Skip the background icon-index thread; only the parser is measured.
+    discovery = AppDiscovery.__new__(AppDiscovery)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        files = []
+        for i in range(args.files):
+            path = Path(tmp) / f"app{i}.desktop"
+            path.write_text(_desktop_text(i), encoding="utf-8")
+            files.append(path)
+
+        mismatches = sum(discovery._parse_desktop_file(p) != _configparser_parse(p) for p in files)
+        old = _time(_configparser_parse, files, args.repeat)
+        new = _time(discovery._parse_desktop_file, files, args.repeat)
+
+    print(f"{args.files} files, best of {args.repeat}")
+    print(f"  configparser : {old * 1000:8.1f} ms  ({old / args.files * 1e6:6.1f} µs/file)")
+    print(f"  streaming    : {new * 1000:8.1f} ms  ({new / args.files * 1e6:6.1f} µs/file)")
+    print(f"  speed-up     : {old / new:8.1f}x")
+    if mismatches:
+        print(f"  WARNING: {mismatches} files parsed differently")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""Benchmark: PBKDF2 key derivation vs. file processing in encryption runs.
+
+Times one ``_derive_key`` call at the current iteration
+count against encrypting and decrypting a folder of generated files, then
+runs a decrypt → re-encrypt → decrypt cycle with and without the session
+key cache to show how much of a bulk workflow the KDF accounts for.
+
+Usage:
+    python scripts/bench_kdf.py [--files 200] [--size 65536] [--repeat 3]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import modules.file_encryptor as fe  # noqa: E402
+from modules.file_encryptor import _PBKDF2_ITERATIONS, EncryptionWorker  # noqa: E402
+
+_PASSWORD = "benchmark-password"  # noqa: S105 — throwaway files only
+
+
+def _worker(operation: str, folder: str) -> EncryptionWorker:
+    worker = EncryptionWorker(operation, folder, _PASSWORD, is_folder=True)
+    # Signals are only connected inside the Qt event loop; record nothing.
+    for signal in (
+        "finished_signal",
+        "progress_updated",
+        "status_updated",
+        "bytes_progress",
+        "rate_updated",
+        "legacy_detected",
+    ):
+        setattr(worker, signal, MagicMock())
+    return worker
+
+
+def _run(operation: str, folder: str) -> float:
+    worker = _worker(operation, folder)
+    start = time.perf_counter()
+    worker.run()
+    elapsed = time.perf_counter() - start
+    ok, message = worker.finished_signal.emit.call_args.args
+    if not ok:
+        sys.exit(f"{operation} failed: {message}")
+    return elapsed
+
+
+def _timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def _cycle(folder: str) -> float:
+    """Time decrypt → encrypt → decrypt → encrypt of an encrypted folder."""
+    return sum(_run(op, folder) for op in ("decrypt", "encrypt", "decrypt", "encrypt"))
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--files", type=int, default=200, help="files in the folder (default 200)")
+    ap.add_argument("--size", type=int, default=64 * 1024, help="bytes per file (default 64 KiB)")
+    ap.add_argument("--repeat", type=int, default=3, help="KDF timing runs, best is kept")
+    args = ap.parse_args()
+
+    salt = os.urandom(16)
+    kdf = min(
+        _timed(lambda: fe._derive_key(_PASSWORD, salt, _PBKDF2_ITERATIONS))
+        for _ in range(args.repeat)
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = os.path.join(tmp, "data")
+        os.mkdir(folder)
+        for i in range(args.files):
+            Path(folder, f"file{i}.bin").write_bytes(os.urandom(args.size))
+
+        fe.key_cache.configure(0)
+        encrypt = _run("encrypt", folder)
+        decrypt = _run("decrypt", folder)
+        _run("encrypt", folder)
+        uncached = _cycle(folder)
+
+        fe.key_cache.configure(600)
+        cached = _cycle(folder)
+        fe.key_cache.configure(0)
+
+    total_mb = args.files * args.size / 1e6
+    print(
+        f"{args.files} files x {args.size} B ({total_mb:.1f} MB), {_PBKDF2_ITERATIONS} iterations"
+    )
+    print(f"  PBKDF2 derive    : {kdf * 1000:8.1f} ms (best of {args.repeat})")
+    print(f"  encrypt folder   : {encrypt * 1000:8.1f} ms  (KDF {kdf / encrypt:5.1%})")
+    print(f"  decrypt folder   : {decrypt * 1000:8.1f} ms  (KDF {kdf / decrypt:5.1%})")
+    print(f"  4-step cycle     : {uncached * 1000:8.1f} ms  without key cache")
+    print(f"  4-step cycle     : {cached * 1000:8.1f} ms  with key cache")
+    print(f"  saved            : {(uncached - cached) * 1000:8.1f} ms  ({uncached / cached:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
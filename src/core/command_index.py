@@ -0,0 +1,180 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Flattened, immutable index of every runnable command.
+
+The command tree in ``commands.json`` is nested (groups → subgroups →
+commands), but the palette, search dialog, quick-launch bar, favorites picker
+and tray tooltip all want a flat list.  ``ConfigManager`` builds one
+:class:`CommandIndex` per loaded tree and shares it via ``AppServices`` so
+those consumers no longer re-walk the tree on every keystroke.
+
+Records keep dict-style access (``record["label"]``, ``record.get("prompt")``)
+so existing call sites and ``QListWidgetItem`` payloads keep working.
+"""
+
+from collections.abc import Iterator
+from typing import Any
+
+GROUP_SEPARATOR = " → "
+
+
+class CommandRecord:
+    """One runnable command, flattened out of the command tree.
+
+    Attributes:
+        group: Display group, nested groups joined with ``" → "``.
+        label: Command label (the leaf key in the tree).
+        command: Shell command string.
+        confirm: Whether to ask for confirmation before running.
+        show_output: Whether to capture and show the command output.
+        prompt: Optional custom ``{promptInput}`` prompt.
+        path: Dotted path usable as a favorites/``ref`` target (``"Tools.Git.Status"``).
+        text: ``"<group> <label>"`` — the string fuzzy matching is scored against.
+        search_text: ``text`` lowercased, for substring matching.
+    """
+
+    __slots__ = (
+        "group",
+        "label",
+        "command",
+        "confirm",
+        "show_output",
+        "prompt",
+        "path",
+        "text",
+        "search_text",
+    )
+
+    # Dict keys of the flat command records modules read before the index.
+    _KEYS = {
+        "group": "group",
+        "label": "label",
+        "command": "command",
+        "confirm": "confirm",
+        "showOutput": "show_output",
+        "prompt": "prompt",
+        "path": "path",
+    }
+
+    def __init__(
+        self,
+        group: str,
+        label: str,
+        command: str,
+        confirm: bool = False,
+        show_output: bool = False,
+        prompt: str | None = None,
+    ):
+        self.group = group
+        self.label = label
+        self.command = command
+        self.confirm = confirm
+        self.show_output = show_output
+        self.prompt = prompt
+        parts = [p.strip() for p in group.split(GROUP_SEPARATOR) if p.strip()]
+        self.path = ".".join([*parts, label])
+        self.text = f"{group} {label}"
+        self.search_text = self.text.lower()
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, self._KEYS[key])
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._KEYS
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style lookup; returns *default* for unknown keys."""
+        attr = self._KEYS.get(key)
+        return default if attr is None else getattr(self, attr)
+
+    def to_row(self) -> tuple:
+        """Return the constructor arguments as a plain tuple (for snapshots)."""
+        return (
+            self.group,
+            self.label,
+            self.command,
+            self.confirm,
+            self.show_output,
+            self.prompt,
+        )
+
+    def __repr__(self) -> str:
+        return f"CommandRecord({self.path!r}, command={self.command!r})"
+
+
+class CommandIndex:
+    """Immutable, ordered sequence of :class:`CommandRecord` objects.
+
+    Iteration order matches the order commands appear in the tree.
+    """
+
+    __slots__ = ("_records", "_by_key", "_texts")
+
+    def __init__(self, records: tuple[CommandRecord, ...] = ()):
+        self._records = tuple(records)
+        self._by_key = {(r.group, r.label): r for r in self._records}
+        self._texts = tuple(r.text for r in self._records)
+
+    @property
+    def texts(self) -> tuple[str, ...]:
+        """Every record's ``text``, in order — the batch fuzzy-scoring choices."""
+        return self._texts
+
+    @classmethod
+    def from_commands(cls, commands: dict[str, Any]) -> "CommandIndex":
+        """Walk a validated command tree and index every command in it."""
+        records: list[CommandRecord] = []
+
+        def process_items(group_name: str, items: dict[str, Any]) -> None:
+            for label, item in items.items():
+                if label == "icon" or not isinstance(item, dict):
+                    continue
+                if "command" in item:
+                    records.append(
+                        CommandRecord(
+                            group_name,
+                            label,
+                            item["command"],
+                            item.get("confirm", False),
+                            item.get("showOutput", False),
+                            item.get("prompt"),
+                        )
+                    )
+                else:
+                    process_items(f"{group_name}{GROUP_SEPARATOR}{label}", item)
+
+        for group_name, items in commands.items():
+            if isinstance(items, dict):
+                process_items(group_name, items)
+        return cls(tuple(records))
+
+    @classmethod
+    def from_rows(cls, rows) -> "CommandIndex":
+        """Rebuild an index from :meth:`to_rows` output."""
+        return cls(tuple(CommandRecord(*row) for row in rows))
+
+    def to_rows(self) -> list[tuple]:
+        """Return plain tuples suitable for ``marshal``."""
+        return [r.to_row() for r in self._records]
+
+    def find(self, group: str, label: str) -> CommandRecord | None:
+        """Return the record for *group* / *label*, or None."""
+        return self._by_key.get((group, label))
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self) -> Iterator[CommandRecord]:
+        return iter(self._records)
+
+    def __getitem__(self, index):
+        return self._records[index]
+
+    def __bool__(self) -> bool:
+        return bool(self._records)
+
+    def __repr__(self) -> str:
+        return f"CommandIndex({len(self._records)} commands)"
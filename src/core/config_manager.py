@@ -10,14 +10,19 @@ It follows the singleton pattern to ensure only one instance manages the config.
 
 import copy
 import datetime
+import hashlib
 import json
 import logging
+import marshal
 import os
 import shutil
 import sys
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from core.command_index import CommandIndex
+
 APP_NAME = "py-tray-command-launcher"
 logger = logging.getLogger(__name__)
 
@@ -28,6 +33,169 @@ class ConfigurationError(Exception):
     pass
 
 
+@dataclass(frozen=True)
+class CommandsDiff:
+    """Top-level group changes between two command trees.
+
+    Groups are compared as whole subtrees; a group is ``changed`` when any
+    command, icon or nested subgroup inside it differs, or when it contains
+    a ``ref`` into a group that was added, removed or changed.
+    """
+
+    added: tuple[str, ...] = ()
+    removed: tuple[str, ...] = ()
+    changed: tuple[str, ...] = ()
+    reordered: bool = False
+
+    def is_empty(self) -> bool:
+        """Return True when the two trees are structurally identical."""
+        return not (self.added or self.removed or self.changed or self.reordered)
+
+
+def _referenced_groups(items: Any) -> set[str]:
+    """Return the top-level group names referenced by ``ref`` entries in *items*."""
+    groups: set[str] = set()
+    if not isinstance(items, dict):
+        return groups
+    for label, item in items.items():
+        if label == "icon" or not isinstance(item, dict):
+            continue
+        ref = item.get("ref")
+        if isinstance(ref, str) and "." in ref:
+            groups.add(ref.split(".", 1)[0])
+        elif "command" not in item:
+            groups |= _referenced_groups(item)
+    return groups
+
+
+def diff_command_groups(old: dict[str, Any], new: dict[str, Any]) -> CommandsDiff:
+    """Compute which top-level groups differ between *old* and *new*.
+
+    Args:
+        old: Previously loaded command tree.
+        new: Freshly loaded command tree.
+
+    Returns:
+        A :class:`CommandsDiff`; ``reordered`` is set when the surviving groups
+        appear in a different order, which callers treat as a full rebuild.
+    """
+    old = old if isinstance(old, dict) else {}
+    new = new if isinstance(new, dict) else {}
+
+    added = tuple(g for g in new if g not in old)
+    removed = tuple(g for g in old if g not in new)
+    changed = {g for g in new if g in old and new[g] != old[g]}
+
+    touched = set(added) | set(removed) | changed
+    if touched:
+        for group, items in new.items():
+            if group not in changed and group not in added and _referenced_groups(items) & touched:
+                changed.add(group)
+
+    surviving_old = [g for g in old if g in new]
+    surviving_new = [g for g in new if g in old]
+    return CommandsDiff(
+        added=added,
+        removed=removed,
+        changed=tuple(g for g in new if g in changed),
+        reordered=surviving_old != surviving_new,
+    )
+
+
+class _SchemaValidatorCache:
+    """Process-wide cache of compiled JSON-schema validators.
+
+    ``jsonschema.validate`` re-checks the schema and builds a fresh validator on
+    every call, which dominated config load time.  Here each schema file is
+    loaded, checked and compiled once per process (re-compiled only when its
+    mtime changes), and the content digest of the last document that passed
+    validation is remembered so an unchanged file skips validation entirely.
+
+    Kept at module level rather than on ``ConfigManager`` so the cache is shared
+    by every instance, including those tests build via ``__new__``.
+    """
+
+    def __init__(self):
+        # schema path -> (mtime_ns, validator or None when the schema is invalid)
+        self._validators: dict[str, tuple[int, Any]] = {}
+        # schema path -> (mtime_ns, digest of the last document that validated)
+        self._validated: dict[str, tuple[int, str]] = {}
+
+    @staticmethod
+    def _mtime_ns(schema_path: Path) -> int | None:
+        try:
+            return schema_path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def get(self, schema_path: Path):
+        """Return a compiled validator for *schema_path*.
+
+        Returns ``None`` when the schema is missing, invalid, or jsonschema is
+        not installed; callers should then skip validation.
+        """
+        mtime = self._mtime_ns(schema_path)
+        if mtime is None:
+            return None
+        key = str(schema_path)
+        cached = self._validators.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        try:
+            import jsonschema  # optional dependency
+        except ImportError:
+            logger.debug("jsonschema not installed; skipping %s validation", schema_path.name)
+            return None
+
+        validator = None
+        try:
+            with open(schema_path, encoding="utf-8") as f:
+                schema = json.load(f)
+            validator_cls = jsonschema.validators.validator_for(schema)
+            validator_cls.check_schema(schema)
+            validator = validator_cls(schema)
+        except jsonschema.SchemaError as exc:
+            logger.warning(
+                "%s is invalid; skipping schema validation: %s", schema_path.name, exc.message
+            )
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.warning("Could not load %s; skipping schema validation: %s", schema_path, exc)
+        self._validators[key] = (mtime, validator)
+        self._validated.pop(key, None)
+        return validator
+
+    def is_known_valid(self, schema_path: Path, digest: str | None) -> bool:
+        """Return True if *digest* already passed validation against the current schema."""
+        if digest is None:
+            return False
+        last = self._validated.get(str(schema_path))
+        return last is not None and last == (self._mtime_ns(schema_path), digest)
+
+    def mark_valid(self, schema_path: Path, digest: str | None) -> None:
+        """Remember *digest* as the last document that validated against *schema_path*."""
+        mtime = self._mtime_ns(schema_path)
+        if digest is not None and mtime is not None:
+            self._validated[str(schema_path)] = (mtime, digest)
+
+    def clear(self) -> None:
+        """Drop all compiled validators and remembered digests."""
+        self._validators.clear()
+        self._validated.clear()
+
+
+_schema_validators = _SchemaValidatorCache()
+
+
+def _content_digest(data: bytes) -> str:
+    """Return a short, fast digest of raw config file contents."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+# Bump whenever the snapshot payload or CommandRecord rows change shape.
+_SNAPSHOT_VERSION = 2
+
+
 def _get_base_dir() -> Path:
     """Return the application base directory for both dev and packaged modes.
 
@@ -77,6 +245,10 @@ class ConfigManager:
         self.history_file = self.config_dir / "history.json"
         self.favorites_file = self.config_dir / "favorites.json"
         self.settings_file = self.config_dir / "settings.json"
+        self.frecency_file = self.config_dir / "frecency.json"
+
+        # Regenerable data (command snapshot); created on first write
+        self.cache_dir = self._get_user_cache_dir()
 
         # Cache for loaded configurations
         self._commands_cache = None
@@ -85,6 +257,9 @@ class ConfigManager:
         self._settings_cache = None
         self._is_windows = os.name == "nt"
 
+        # Content digest of the commands file as last loaded or written by us
+        self._commands_digest: str | None = None
+
         # Mark as initialized
         self._initialized = True
 
@@ -157,6 +332,14 @@ class ConfigManager:
             "hotkey": "ctrl+shift+b",
         },
         "icon_cache_ttl_days": 7,
+        "commands_snapshot": True,
+        "auto_reload_commands": True,
+        "lazy_menus": False,
+        "app_discovery_workers": 4,
+        "app_icon_cache_mb": 16,
+        "encryption_workers": 4,
+        "encryption_key_cache_minutes": 0,
+        "encryption_sync_batch": 1,
     }
 
     @staticmethod
@@ -174,7 +357,7 @@ class ConfigManager:
                 result[key] = value
         return result
 
-    def _write_json_atomic(self, file_path: Path, data: Any) -> None:
+    def _write_json_atomic(self, file_path: Path, data: Any) -> str:
         """Write *data* as JSON to *file_path* atomically.
 
         Writes to a sibling ``.tmp`` file first, then uses :func:`os.replace`
@@ -187,20 +370,25 @@ class ConfigManager:
             file_path: Destination path.
             data: JSON-serialisable object to write.
 
+        Returns:
+            Content digest of the bytes written.
+
         Raises:
             OSError: If the write or rename fails.
         """
         file_path.parent.mkdir(parents=True, exist_ok=True)
         tmp_path = file_path.with_suffix(file_path.suffix + ".tmp")
         try:
+            payload = json.dumps(data, indent=4).encode("utf-8")
             if os.name != "nt":
                 fd = os.open(str(tmp_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
-                with os.fdopen(fd, "w", encoding="utf-8") as f:
-                    json.dump(data, f, indent=4)
+                with os.fdopen(fd, "wb") as f:
+                    f.write(payload)
             else:
-                with open(tmp_path, "w", encoding="utf-8") as f:
-                    json.dump(data, f, indent=4)
+                with open(tmp_path, "wb") as f:
+                    f.write(payload)
             os.replace(tmp_path, file_path)
+            return _content_digest(payload)
         except (OSError, TypeError, ValueError):
             try:
                 if tmp_path.exists():
@@ -213,9 +401,12 @@ class ConfigManager:
         """Get application settings from settings.json, deep-merged with defaults."""
         if self._settings_cache is None or refresh:
             try:
+                digest = None
                 if self.settings_file.exists():
-                    with open(self.settings_file, encoding="utf-8") as f:
-                        settings = json.load(f)
+                    with open(self.settings_file, "rb") as f:
+                        raw = f.read()
+                    digest = _content_digest(raw)
+                    settings = json.loads(raw.decode("utf-8"))
                     if not isinstance(settings, dict):
                         logger.warning(
                             "settings.json root is not a dict (got %s); resetting to defaults",
@@ -225,7 +416,7 @@ class ConfigManager:
                 else:
                     settings = {}
 
-                if not self._validate_settings_schema(settings):
+                if not self._validate_settings_schema(settings, content_digest=digest):
                     settings = {}
                 # Deep-merge so partial nested dicts (e.g. quick_launch_bar, output_font,
                 # logging) retain their default sub-keys when the user only overrides some.
@@ -233,7 +424,7 @@ class ConfigManager:
             except json.JSONDecodeError as e:
                 logger.warning("settings.json is corrupted (%s); falling back to defaults", str(e))
                 self._settings_cache = copy.deepcopy(self._SETTINGS_DEFAULTS)
-            except OSError as e:
+            except (OSError, UnicodeDecodeError) as e:
                 logger.warning("Failed to load settings (I/O error), using defaults: %s", e)
                 self._settings_cache = copy.deepcopy(self._SETTINGS_DEFAULTS)
 
@@ -321,26 +512,149 @@ class ConfigManager:
                     logger.warning(f"Commands file {config_file} not found. Creating default.")
                     self._create_default_commands(config_file)
 
-                with open(config_file, encoding="utf-8") as f:
-                    commands = json.load(f)
+                with open(config_file, "rb") as f:
+                    raw = f.read()
+                digest = _content_digest(raw)
+
+                snapshot_key = self._commands_snapshot_key(config_file, len(raw), digest)
+                snapshot = self._load_commands_snapshot(snapshot_key)
+                if snapshot is not None:
+                    commands, index = snapshot
+                    self._commands_cache = commands
+                    self._command_index_cache = (commands, index)
+                    self._commands_digest = digest
+                    logger.info(f"Commands loaded from snapshot for {config_file}")
+                    return self._commands_cache
+
+                commands = json.loads(raw.decode("utf-8"))
 
                 # Validate the configuration
                 self._validate_commands(commands)
-                self._validate_commands_schema(commands)
+                self._validate_commands_schema(commands, content_digest=digest)
 
                 self._commands_cache = commands
+                self._command_index_cache = None
+                self._commands_digest = digest
+                self._save_commands_snapshot(snapshot_key, commands)
                 logger.info(f"Commands loaded successfully from {config_file}")
             except json.JSONDecodeError as e:
                 error_msg = f"Invalid JSON in {config_file}: {str(e)}"
                 logger.error(error_msg)
                 raise ConfigurationError(error_msg) from e
-            except (OSError, ConfigurationError) as e:
+            except (OSError, UnicodeDecodeError, ConfigurationError) as e:
                 error_msg = f"Failed to load commands from {config_file}: {e}"
                 logger.error(error_msg)
                 raise ConfigurationError(error_msg) from e
 
         return self._commands_cache
 
+    def commands_changed_on_disk(self) -> bool:
+        """Return True if the active commands file differs from what we last loaded or wrote.
+
+        Lets a file watcher ignore the notifications caused by this process's
+        own saves and restores instead of parsing the file a second time.
+        """
+        try:
+            with open(self._get_commands_file_for_read(), "rb") as f:
+                digest = _content_digest(f.read())
+        except OSError:
+            return True
+        return digest != getattr(self, "_commands_digest", None)
+
+    def get_command_index(self, refresh: bool = False) -> CommandIndex:
+        """Return the flat :class:`CommandIndex` for the current command tree.
+
+        The index is rebuilt only when the command cache changes (load,
+        save or snapshot restore) and is shared by all callers.
+
+        Raises:
+            ConfigurationError: If loading the configuration fails
+        """
+        commands = self.get_commands(refresh=refresh)
+        cached = getattr(self, "_command_index_cache", None)
+        if cached is None or cached[0] is not commands:
+            cached = (commands, CommandIndex.from_commands(commands))
+            self._command_index_cache = cached
+        return cached[1]
+
+    # ------------------------------------------------------------------
+    # Command tree snapshot
+    # ------------------------------------------------------------------
+
+    def _commands_snapshot_file(self) -> Path | None:
+        """Return the snapshot path, or None when snapshots are disabled."""
+        cache_dir = getattr(self, "cache_dir", None)
+        if cache_dir is None or not self.get_settings().get("commands_snapshot", True):
+            return None
+        return cache_dir / "commands.snapshot"
+
+    def _commands_snapshot_key(self, config_file: Path, size: int, digest: str) -> tuple | None:
+        """Build the key a snapshot must match to stand in for *config_file*.
+
+        Covers the source path, size, mtime and content digest plus the
+        commands schema mtime, so a schema update also forces revalidation.
+        """
+        if self._commands_snapshot_file() is None:
+            return None
+        try:
+            mtime_ns = config_file.stat().st_mtime_ns
+        except OSError:
+            return None
+        schema_path = self.defaults_dir / "commands.schema.json"
+        try:
+            schema_mtime_ns = schema_path.stat().st_mtime_ns
+        except OSError:
+            schema_mtime_ns = 0
+        return (
+            _SNAPSHOT_VERSION,
+            str(config_file.resolve()),
+            size,
+            mtime_ns,
+            digest,
+            schema_mtime_ns,
+        )
+
+    def _load_commands_snapshot(self, key: tuple | None) -> tuple[dict, CommandIndex] | None:
+        """Return ``(commands, command_index)`` from the snapshot if *key* matches."""
+        if key is None:
+            return None
+        snapshot_file = self._commands_snapshot_file()
+        try:
+            with open(snapshot_file, "rb") as f:
+                # Snapshot lives in the user's own cache dir and is written by us.
+                stored_key, commands, rows = marshal.load(f)  # noqa: S302
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, ValueError, TypeError) as e:
+            logger.debug("Ignoring unreadable commands snapshot %s: %s", snapshot_file, e)
+            return None
+        if stored_key != key or not isinstance(commands, dict) or not isinstance(rows, list):
+            return None
+        try:
+            return commands, CommandIndex.from_rows(rows)
+        except TypeError as e:
+            logger.debug("Ignoring malformed commands snapshot %s: %s", snapshot_file, e)
+            return None
+
+    def _save_commands_snapshot(self, key: tuple | None, commands: dict[str, Any]) -> None:
+        """Write a snapshot of the validated *commands* tree; failures are logged only."""
+        if key is None:
+            return
+        snapshot_file = self._commands_snapshot_file()
+        rows = self.get_command_index().to_rows()
+        tmp_file = snapshot_file.with_suffix(".tmp")
+        try:
+            snapshot_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, "wb") as f:
+                marshal.dump((key, commands, rows), f)
+            os.replace(tmp_file, snapshot_file)
+        except (OSError, ValueError) as e:
+            logger.debug("Could not write commands snapshot %s: %s", snapshot_file, e)
+            try:
+                tmp_file.unlink()
+            except OSError:
+                pass
+
     def save_commands(self, commands: dict[str, dict[str, Any]]) -> None:
         """
         Save command configuration to file.
@@ -362,10 +676,11 @@ class ConfigManager:
             config_file = self._get_commands_file_for_write()
 
             # Save the configuration atomically
-            self._write_json_atomic(config_file, commands)
+            self._commands_digest = self._write_json_atomic(config_file, commands)
 
-            # Update the cache
+            # Update the cache (the caller may have mutated the same dict in place)
             self._commands_cache = commands
+            self._command_index_cache = None
             logger.info(f"Commands saved successfully to {config_file}")
         except ConfigurationError:
             raise
@@ -471,6 +786,30 @@ class ConfigManager:
 
         return self._favorites_cache
 
+    def load_frecency(self) -> dict[str, Any] | None:
+        """Load launch frecency stats from frecency.json.
+
+        Returns:
+            The stored data, or ``None`` when the file does not exist yet (or
+            is unreadable) so the caller can seed it from history.
+        """
+        try:
+            with open(self.frecency_file, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError, ValueError) as e:
+            logger.warning("Failed to load frecency stats, starting fresh: %s", e)
+            return None
+        return data if isinstance(data, dict) else None
+
+    def save_frecency(self, data: dict[str, Any]) -> None:
+        """Save launch frecency stats to frecency.json; failures are logged only."""
+        try:
+            self._write_json_atomic(self.frecency_file, data)
+        except (OSError, TypeError, ValueError) as e:
+            logger.error("Failed to save frecency stats: %s", e)
+
     def save_favorites(self, favorites: dict[str, Any]) -> None:
         """
         Save favorites to file.
@@ -570,8 +909,10 @@ class ConfigManager:
             # Copy the backup file to the commands file
             shutil.copy2(backup_file, config_file)
 
-            # Invalidate the cache
+            # Invalidate the cache and remember what we wrote
             self._commands_cache = None
+            with open(config_file, "rb") as f:
+                self._commands_digest = _content_digest(f.read())
 
             logger.info(f"Successfully restored from {backup_file} to {config_file}")
             return True
@@ -834,66 +1175,58 @@ class ConfigManager:
                             f"prompt in '{group_name}.{item_name}' must be a string"
                         )
 
-    def _validate_settings_schema(self, settings: dict[str, Any]) -> bool:
+    def _validate_settings_schema(
+        self, settings: dict[str, Any], content_digest: str | None = None
+    ) -> bool:
         """Validate *settings* against settings.schema.json if available and jsonschema is installed.
 
-        Logs a warning on validation failure; never raises.
+        When *content_digest* matches the last settings file that validated,
+        validation is skipped.  Logs a warning on validation failure; never raises.
         """
         schema_path = self.defaults_dir / "settings.schema.json"
-        if not schema_path.exists():
+        if _schema_validators.is_known_valid(schema_path, content_digest):
             return True
-        try:
-            import jsonschema  # optional dependency
-        except ImportError:
-            logger.debug("jsonschema not installed; skipping settings.json schema validation")
+        validator = _schema_validators.get(schema_path)
+        if validator is None:
             return True
-        try:
-            with open(schema_path, encoding="utf-8") as f:
-                schema = json.load(f)
-            jsonschema.validate(instance=settings, schema=schema)
-        except jsonschema.ValidationError as exc:
-            path = " → ".join(str(p) for p in exc.absolute_path) or "(root)"
+        from jsonschema.exceptions import best_match
+
+        error = best_match(validator.iter_errors(settings))
+        if error is not None:
+            path = " → ".join(str(p) for p in error.absolute_path) or "(root)"
             logger.warning(
                 "settings.json validation error at %s: %s",
                 path,
-                exc.message,
+                error.message,
             )
             return False
-        except jsonschema.SchemaError as exc:
-            logger.warning(
-                "settings.schema.json is invalid; skipping schema validation: %s",
-                exc.message,
-            )
+        _schema_validators.mark_valid(schema_path, content_digest)
         return True
 
-    def _validate_commands_schema(self, commands: dict[str, Any]) -> None:
+    def _validate_commands_schema(
+        self, commands: dict[str, Any], content_digest: str | None = None
+    ) -> None:
         """Validate *commands* against commands.schema.json if available and jsonschema is installed.
 
+        When *content_digest* matches the last commands file that validated,
+        validation is skipped.
+
         Raises:
             ConfigurationError: When the commands data does not match the schema.
         """
         schema_path = self.defaults_dir / "commands.schema.json"
-        if not schema_path.exists():
+        if _schema_validators.is_known_valid(schema_path, content_digest):
             return
-        try:
-            import jsonschema  # optional dependency
-        except ImportError:
-            logger.debug("jsonschema not installed; skipping commands.json schema validation")
+        validator = _schema_validators.get(schema_path)
+        if validator is None:
             return
-        try:
-            with open(schema_path, encoding="utf-8") as f:
-                schema = json.load(f)
-            jsonschema.validate(instance=commands, schema=schema)
-        except jsonschema.ValidationError as exc:
-            path = " → ".join(str(p) for p in exc.absolute_path) or "(root)"
-            raise ConfigurationError(
-                f"commands.json validation error at {path}:\n{exc.message}"
-            ) from exc
-        except jsonschema.SchemaError as exc:
-            logger.warning(
-                "commands.schema.json is invalid; skipping schema validation: %s",
-                exc.message,
-            )
+        from jsonschema.exceptions import best_match
+
+        error = best_match(validator.iter_errors(commands))
+        if error is not None:
+            path = " → ".join(str(p) for p in error.absolute_path) or "(root)"
+            raise ConfigurationError(f"commands.json validation error at {path}:\n{error.message}")
+        _schema_validators.mark_valid(schema_path, content_digest)
 
     def _create_default_commands(self, config_file: Path) -> None:
         """
@@ -960,6 +1293,16 @@ class ConfigManager:
         base = Path(os.environ.get("XDG_CONFIG_HOME", Path.home() / ".config"))
         return base / APP_NAME
 
+    def _get_user_cache_dir(self) -> Path:
+        """Return OS-appropriate user cache directory for this app."""
+        if os.name == "nt":
+            base = Path(os.environ.get("LOCALAPPDATA", Path.home() / "AppData" / "Local"))
+            return base / APP_NAME / "cache"
+        if sys.platform == "darwin":
+            return Path.home() / "Library" / "Caches" / APP_NAME
+        base = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+        return base / APP_NAME
+
     def _legacy_config_dirs(self) -> list[Path]:
         """Return legacy config directories that may still contain user data."""
         candidates: list[Path] = []
@@ -0,0 +1,162 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+DebouncedFileWatcher — thin wrapper around ``QFileSystemWatcher``.
+
+Editors rarely write a file in a single operation.  Most save by writing a
+temporary file and renaming it over the original, which silently drops the
+original path from ``QFileSystemWatcher``'s watch list, and many emit several
+change notifications for one save.  This wrapper:
+
+* coalesces a burst of notifications into one callback after a quiet period;
+* re-arms watches on files that were replaced or briefly removed by watching
+  their parent directory as well.
+
+Directories can be watched too (:meth:`DebouncedFileWatcher.watch_directory`);
+they are reported when an entry is added, removed or renamed inside them.
+"""
+
+import logging
+import os
+
+from PyQt6.QtCore import QFileSystemWatcher, QTimer
+
+logger = logging.getLogger(__name__)
+
+
+class DebouncedFileWatcher:
+    """Watch files and invoke *callback* once per burst of changes.
+
+    Args:
+        callback: Called with the ``set`` of changed paths once the burst settles.
+        delay_ms: Quiet period (milliseconds) required after the last notification.
+    """
+
+    def __init__(self, callback, delay_ms: int = 250):
+        self._callback = callback
+        self._files: set[str] = set()
+        self._dirs: set[str] = set()
+        self._pending: set[str] = set()
+        # Paths currently registered with Qt; kept here so membership checks
+        # do not rebuild QFileSystemWatcher.files()/directories() lists.
+        self._armed_files: set[str] = set()
+        self._armed_dirs: set[str] = set()
+
+        self._watcher = QFileSystemWatcher()
+        self._watcher.fileChanged.connect(self._on_file_changed)
+        self._watcher.directoryChanged.connect(self._on_directory_changed)
+
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay_ms)
+        self._timer.timeout.connect(self._flush)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def watch_file(self, path) -> None:
+        """Start watching *path* (the file need not exist yet)."""
+        path = os.path.abspath(str(path))
+        self._files.add(path)
+        self._arm_file(path)
+        logger.debug("Watching %s for changes", path)
+
+    def watch_files(self, paths) -> None:
+        """Start watching every file in *paths*, registering them in one batch.
+
+        Files that are already watched are left as they are.
+        """
+        new_files: list[str] = []
+        new_dirs: list[str] = []
+        for path in paths:
+            path = os.path.abspath(str(path))
+            self._files.add(path)
+            parent = os.path.dirname(path)
+            if parent and parent not in self._armed_dirs and os.path.isdir(parent):
+                self._armed_dirs.add(parent)
+                new_dirs.append(parent)
+            if path not in self._armed_files and os.path.exists(path):
+                self._armed_files.add(path)
+                new_files.append(path)
+        if new_dirs or new_files:
+            self._watcher.addPaths(new_dirs + new_files)
+            logger.debug("Watching %d more files for changes", len(new_files))
+
+    def watch_directory(self, path) -> bool:
+        """Start watching the contents of directory *path*.
+
+        Returns ``False`` if *path* is not an existing directory.
+        """
+        path = os.path.abspath(str(path))
+        if not os.path.isdir(path):
+            return False
+        self._dirs.add(path)
+        if path not in self._armed_dirs:
+            self._armed_dirs.add(path)
+            self._watcher.addPath(path)
+        return True
+
+    def stop(self) -> None:
+        """Stop watching everything and drop any pending notification."""
+        self._timer.stop()
+        self._pending.clear()
+        watched = [*self._armed_files, *self._armed_dirs]
+        if watched:
+            self._watcher.removePaths(watched)
+        self._armed_files.clear()
+        self._armed_dirs.clear()
+        self._files.clear()
+        self._dirs.clear()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _arm_file(self, path: str) -> None:
+        """(Re-)add a watch on *path* and its parent directory."""
+        parent = os.path.dirname(path)
+        if parent and parent not in self._armed_dirs and os.path.isdir(parent):
+            self._armed_dirs.add(parent)
+            self._watcher.addPath(parent)
+        if not os.path.exists(path):
+            # Qt drops the watch on a removed file by itself.
+            self._armed_files.discard(path)
+            return
+        # An atomic rename replaces the inode; a stale entry would never fire again.
+        if path in self._armed_files:
+            self._watcher.removePath(path)
+        self._watcher.addPath(path)
+        self._armed_files.add(path)
+
+    def _on_file_changed(self, path: str) -> None:
+        if path not in self._files:
+            return
+        self._arm_file(path)
+        self._schedule(path)
+
+    def _on_directory_changed(self, directory: str) -> None:
+        if directory in self._dirs:
+            self._schedule(directory)
+        # Otherwise only interesting when a watched file was recreated inside it.
+        for path in self._files:
+            if os.path.dirname(path) != directory:
+                continue
+            if path not in self._armed_files and os.path.exists(path):
+                self._arm_file(path)
+                self._schedule(path)
+            elif path in self._armed_files and not os.path.exists(path):
+                self._armed_files.discard(path)
+
+    def _schedule(self, path: str) -> None:
+        self._pending.add(path)
+        self._timer.start()
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        changed, self._pending = self._pending, set()
+        try:
+            self._callback(changed)
+        except Exception:
+            logger.exception("File watcher callback failed for %s", ", ".join(sorted(changed)))
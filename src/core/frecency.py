@@ -0,0 +1,213 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Frecency store — how often and how recently each command or app was launched.
+
+Each launch target keeps a single exponentially-decayed launch count and the
+time of the last launch.  Recording a launch decays the stored count to *now*
+and adds one, so updates are O(1) and nothing is ever recomputed from
+``history.json``.  The count halves every :data:`HALF_LIFE_DAYS` days.
+
+The stats persist in ``frecency.json`` in the config directory.  Launches
+are written back after a short delay (:data:`SAVE_DELAY_SECONDS`) so a burst
+of launches costs one write; :meth:`FrecencyStore.flush` saves any pending
+change at shutdown.  On first use the store is seeded once from the existing
+command history.
+
+Public API
+----------
+``frecency_store``
+    Module-level singleton used by :mod:`core.ranking`.
+``command_key(label, command)`` / ``app_key(name)``
+    Stable keys for the two kinds of launch targets.
+"""
+
+import datetime
+import logging
+import math
+import threading
+import time
+
+from core.config_manager import config_manager
+
+logger = logging.getLogger(__name__)
+
+HALF_LIFE_DAYS = 10.0
+# Entries beyond this are dropped lowest-score first when saving.
+MAX_ENTRIES = 1000
+# Launches within this many seconds of each other are persisted together.
+SAVE_DELAY_SECONDS = 5.0
+_FORMAT_VERSION = 1
+_KEY_SEP = "\x1f"
+
+
+def command_key(label: str, command: str) -> str:
+    """Return the frecency key for a configured command."""
+    return f"cmd{_KEY_SEP}{label}{_KEY_SEP}{command}"
+
+
+def app_key(name: str) -> str:
+    """Return the frecency key for an installed application."""
+    return f"app{_KEY_SEP}{name}"
+
+
+class FrecencyStore:
+    """Incrementally-updated, persisted frecency stats.
+
+    Args:
+        half_life_days: Time for a launch's weight to halve.
+        clock: Returns the current time in seconds (injectable for tests).
+        save_delay: Seconds to wait after a change before writing the stats.
+    """
+
+    def __init__(
+        self,
+        half_life_days: float = HALF_LIFE_DAYS,
+        clock=time.time,
+        save_delay: float = SAVE_DELAY_SECONDS,
+    ):
+        self._decay_per_second = math.log(2) / (half_life_days * 86400.0)
+        self._clock = clock
+        self._save_delay = save_delay
+        # Guards _entries against the delayed save running on its timer thread.
+        self._lock = threading.RLock()
+        # key -> [decayed count at last_ts, last_ts]
+        self._entries: dict[str, list[float]] | None = None
+        self._save_timer: threading.Timer | None = None
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def record(self, key: str, when: float | None = None) -> None:
+        """Record a launch of *key*; the stats are persisted shortly after."""
+        with self._lock:
+            self._bump(self._load(), key, self._clock() if when is None else when)
+            self._schedule_save()
+
+    def score(self, key: str, now: float | None = None) -> float:
+        """Return the decayed launch count for *key* (0.0 if never launched)."""
+        entry = self._load().get(key)
+        if entry is None:
+            return 0.0
+        now = self._clock() if now is None else now
+        return entry[0] * self._decay(now - entry[1])
+
+    def scores(self) -> dict[str, float]:
+        """Return decayed scores for every known key at the current time.
+
+        Safe to call from the search worker thread: the first call loads
+        (and if needed seeds) the stats under the store's lock, and the
+        entries are copied under it before iterating.
+        """
+        with self._lock:
+            entries = [(k, v[0], v[1]) for k, v in self._load().items()]
+        now = self._clock()
+        return {k: count * self._decay(now - ts) for k, count, ts in entries}
+
+    def forget(self, key: str) -> None:
+        """Drop *key* from the stats."""
+        with self._lock:
+            if self._load().pop(key, None) is not None:
+                self._schedule_save()
+
+    def flush(self) -> None:
+        """Write any change still waiting for the delayed save (e.g. at shutdown)."""
+        with self._lock:
+            if self._save_timer is None:
+                return
+            self._save_timer.cancel()
+            self._save_timer = None
+        self._save()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _decay(self, elapsed: float) -> float:
+        return math.exp(-self._decay_per_second * max(elapsed, 0.0))
+
+    def _bump(self, entries: dict[str, list[float]], key: str, when: float) -> None:
+        entry = entries.get(key)
+        if entry is None:
+            entries[key] = [1.0, when]
+        elif when >= entry[1]:
+            entries[key] = [entry[0] * self._decay(when - entry[1]) + 1.0, when]
+        else:
+            # Out-of-order launch (history seeding): decay it to the stored time.
+            entry[0] += self._decay(entry[1] - when)
+
+    def _load(self) -> dict[str, list[float]]:
+        """Return the entries, reading (or seeding) them on first use.
+
+        The table is built in a local dict and published only once complete,
+        under the lock, so other threads never see a half-seeded store.
+        """
+        if self._entries is not None:
+            return self._entries
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._read_entries()
+            return self._entries
+
+    def _read_entries(self) -> dict[str, list[float]]:
+        data = config_manager.load_frecency()
+        entries: dict[str, list[float]] = {}
+        if data is not None and data.get("version") == _FORMAT_VERSION:
+            for key, value in (data.get("entries") or {}).items():
+                if not isinstance(value, list) or len(value) != 2:
+                    continue
+                try:
+                    entry = [float(value[0]), float(value[1])]
+                except (TypeError, ValueError):
+                    logger.debug("Skipping corrupt frecency entry %r: %r", key, value)
+                    continue
+                if all(map(math.isfinite, entry)):
+                    entries[key] = entry
+        else:
+            self._seed_from_history(entries)
+            self._schedule_save()
+        return entries
+
+    def _seed_from_history(self, entries: dict[str, list[float]]) -> None:
+        """Populate the empty *entries* from existing history entries (one-off)."""
+        seeded = 0
+        for item in config_manager.get_history():
+            title, command = item.get("title"), item.get("command")
+            if not title or not command:
+                continue
+            try:
+                when = datetime.datetime.fromisoformat(item.get("timestamp", "")).timestamp()
+            except (TypeError, ValueError):
+                when = self._clock()
+            self._bump(entries, command_key(title, command), when)
+            seeded += 1
+        if seeded:
+            logger.info("Seeded frecency stats from %d history entries", seeded)
+
+    def _schedule_save(self) -> None:
+        """Start the delayed save unless one is already pending."""
+        if self._save_timer is not None:
+            return
+        self._save_timer = threading.Timer(self._save_delay, self._on_save_timer)
+        self._save_timer.daemon = True
+        self._save_timer.start()
+
+    def _on_save_timer(self) -> None:
+        with self._lock:
+            self._save_timer = None
+        self._save()
+
+    def _save(self) -> None:
+        with self._lock:
+            entries = self._entries or {}
+            if len(entries) > MAX_ENTRIES:
+                keep = sorted(entries, key=self.score, reverse=True)[:MAX_ENTRIES]
+                entries = self._entries = {k: entries[k] for k in keep}
+            snapshot = {k: [round(v[0], 4), round(v[1], 1)] for k, v in entries.items()}
+            # Held while writing so flush() at shutdown waits for a save in flight.
+            config_manager.save_frecency({"version": _FORMAT_VERSION, "entries": snapshot})
+
+
+# Singleton instance
+frecency_store = FrecencyStore()
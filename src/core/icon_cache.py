@@ -0,0 +1,172 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Process-wide, size-bounded cache of decoded icon images.
+
+The tray menu, favorites menu, quick-launch bar and tray badge all show the
+same handful of image files.  Constructing ``QIcon(path)`` / ``QPixmap(path)``
+at every call site decodes each file again; routing them through the
+``icon_cache`` singleton decodes each (path, size) once and evicts the least
+recently used images when the decoded bytes exceed the budget.
+
+Icons without a fixed size, and scalable (SVG) icons at any size, are cached
+as ``QIcon(path)`` so Qt keeps rendering them per device pixel ratio and
+requested size; only fixed-size raster icons are built from a cached pixmap.
+
+Qt pixmaps must only be touched from the GUI thread, so the cache is not
+thread-safe.
+"""
+
+import logging
+import os
+from collections import OrderedDict
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QIcon, QPixmap
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+# Formats QIcon renders at any size without a fixed-resolution bitmap.
+SCALABLE_SUFFIXES = (".svg", ".svgz")
+# Estimated cost of a file-backed QIcon: Qt renders it on demand, typically
+# a few 32-64 px pixmaps for menu and toolbar sizes at high DPI.
+FILE_ICON_BYTES = 64 * 64 * 4
+
+_PIXMAP = "pixmap"
+_ICON = "icon"
+
+
+def pixmap_bytes(pixmap) -> int:
+    """Approximate decoded size of *pixmap* in bytes."""
+    try:
+        return max(int(pixmap.width() * pixmap.height() * pixmap.depth() // 8), 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+class IconCache:
+    """LRU cache of ``QPixmap``/``QIcon`` objects keyed by resolved path and size.
+
+    Pixmaps and icons share one recency order and one byte budget.  A
+    file-backed ``QIcon`` is decoded lazily by Qt, so it is costed at
+    :data:`FILE_ICON_BYTES`; an icon built from a cached pixmap costs nothing
+    extra and is dropped together with that pixmap.
+
+    Args:
+        max_bytes: Budget for decoded pixel data; older entries are evicted
+            once the total exceeds it.  The most recent entry is always kept.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        # (kind, path, size) -> (pixmap or icon, cost_bytes); ordered oldest → newest
+        self._entries: OrderedDict[tuple[str, str, int | None], tuple[object, int]] = OrderedDict()
+        # given path string -> resolved path, so realpath() runs once per path
+        self._resolved: dict[str, str] = {}
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, kind: str, path, size: int | None) -> tuple[str, str, int | None]:
+        path = str(path)
+        resolved = self._resolved.get(path)
+        if resolved is None:
+            try:
+                resolved = os.path.realpath(path)
+            except (OSError, ValueError):
+                resolved = path
+            self._resolved[path] = resolved
+        return kind, resolved, size
+
+    def _lookup(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def _store(self, key, value, cost: int) -> None:
+        self._entries[key] = (value, cost)
+        self._bytes += cost
+        self._evict()
+
+    def pixmap(self, path, size: int | None = None) -> QPixmap:
+        """Return the decoded image at *path*, optionally scaled to *size* px.
+
+        The returned pixmap is shared with the cache — copy it with
+        ``QPixmap(pixmap)`` before painting on it.  Missing or unreadable
+        files yield a (cached) null pixmap.
+        """
+        key = self._key(_PIXMAP, path, size)
+        pixmap = self._lookup(key)
+        if pixmap is not None:
+            return pixmap
+
+        self.misses += 1
+        pixmap = QPixmap(key[1])
+        if size and not pixmap.isNull():
+            pixmap = pixmap.scaled(
+                size,
+                size,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation,
+            )
+        self._store(key, pixmap, pixmap_bytes(pixmap))
+        return pixmap
+
+    def icon(self, path, size: int | None = None) -> QIcon:
+        """Return a cached ``QIcon`` for *path*.
+
+        Without a *size*, or for scalable formats, the icon is built from the
+        file itself so Qt renders it at whatever size and device pixel ratio
+        it is shown at.  A fixed *size* for a raster image reuses the cached
+        pixmap scaled to that size.
+        """
+        scalable = str(path).lower().endswith(SCALABLE_SUFFIXES)
+        from_file = size is None or scalable
+        key = self._key(_ICON, path, None if scalable else size)
+        icon = self._lookup(key)
+        if icon is not None:
+            backing = (_PIXMAP, *key[1:])
+            if not from_file and backing in self._entries:
+                # Keep the backing pixmap as recent as the icon using it.
+                self._entries.move_to_end(backing)
+            return icon
+        if from_file:
+            self.misses += 1
+            icon = QIcon(key[1])
+            self._store(key, icon, FILE_ICON_BYTES)
+        else:
+            icon = QIcon(self.pixmap(path, size))
+            self._store(key, icon, 0)
+        return icon
+
+    def clear(self) -> None:
+        """Drop every cached image (e.g. after icons changed on disk)."""
+        self._entries.clear()
+        self._resolved.clear()
+        self._bytes = 0
+
+    @property
+    def total_bytes(self) -> int:
+        """Decoded bytes currently held (file-backed icons at their estimate)."""
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict(self) -> None:
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            key, (_value, cost) = self._entries.popitem(last=False)
+            self._bytes -= cost
+            if key[0] == _PIXMAP:
+                # An icon built from this pixmap would keep it alive.
+                self._entries.pop((_ICON, *key[1:]), None)
+            logger.debug("Evicted %s %s (%d bytes) from cache", key[0], key[1], cost)
+
+
+# Singleton instance
+icon_cache = IconCache()
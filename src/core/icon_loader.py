@@ -0,0 +1,128 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Background icon decoding for the app launcher.
+
+Resolving an app icon can read and rasterise an SVG from disk, which stalls
+the GUI thread when a result list first paints.  ``IconLoader`` does that
+work on a daemon thread instead: callers :meth:`IconLoader.request` an icon
+name and size, show a placeholder, and swap in the real icon when
+``loaded`` fires.
+
+Only ``QImage`` is touched off the GUI thread — unlike ``QPixmap`` and
+``QIcon`` it is safe to use from any thread.  The receiver converts the
+image with ``QPixmap.fromImage``.  Requests are served newest first, so rows
+that were just painted (the visible ones) load before rows that have since
+scrolled away; :meth:`IconLoader.clear_pending` drops requests for results
+that are no longer shown.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+
+from PyQt6.QtCore import QObject, Qt, pyqtSignal
+from PyQt6.QtGui import QImage, QImageReader
+
+logger = logging.getLogger(__name__)
+
+
+def load_image(path: str, size: int) -> QImage | None:
+    """Decode the image at *path* to fit a *size* × *size* square.
+
+    Scalable images are rendered at the target size rather than scaled
+    afterwards.  Returns ``None`` if the file cannot be decoded.
+    """
+    reader = QImageReader(path)
+    native = reader.size()
+    if native.isValid() and (
+        native.width() > size or native.height() > size or path.endswith(".svg")
+    ):
+        reader.setScaledSize(native.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio))
+    image = reader.read()
+    if image.isNull():
+        logger.debug("Could not decode icon %s: %s", path, reader.errorString())
+        return None
+    if image.width() > size or image.height() > size:
+        image = image.scaled(
+            size,
+            size,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation,
+        )
+    return image
+
+
+class IconLoader(QObject):
+    """Resolve and decode icons on a background thread, newest request first.
+
+    Args:
+        resolve: Returns the image file for an icon name, or ``None``.  Called
+            on the loader thread, so it must not touch ``QPixmap``/``QIcon``.
+
+    Signals:
+        loaded(str, int, object): Icon name, size and decoded ``QImage``, or
+            ``None`` when the name did not resolve to a decodable file.
+    """
+
+    loaded = pyqtSignal(str, int, object)
+
+    def __init__(self, resolve, parent=None):
+        super().__init__(parent)
+        self._resolve = resolve
+        self._cond = threading.Condition()
+        # (name, size) waiting to load; ordered oldest → newest
+        self._pending: OrderedDict[tuple[str, int], None] = OrderedDict()
+        self._running: tuple[str, int] | None = None
+        self._stopped = False
+        self._thread: threading.Thread | None = None
+
+    def request(self, name: str, size: int) -> None:
+        """Queue *name* at *size*; a repeated request moves it to the front."""
+        key = (name, size)
+        with self._cond:
+            if self._stopped or key == self._running:
+                return
+            self._pending[key] = None
+            self._pending.move_to_end(key)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True, name="icon-loader")
+                self._thread.start()
+            self._cond.notify()
+
+    def clear_pending(self) -> None:
+        """Drop every request that has not started loading."""
+        with self._cond:
+            self._pending.clear()
+
+    def pending(self) -> list[tuple[str, int]]:
+        """Return the queued requests, next to load first."""
+        with self._cond:
+            return list(reversed(self._pending))
+
+    def stop(self) -> None:
+        """Drop queued requests and let the loader thread exit."""
+        with self._cond:
+            self._pending.clear()
+            self._stopped = True
+            self._cond.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._stopped:
+                    self._cond.wait()
+                if self._stopped:
+                    return
+                key, _ = self._pending.popitem(last=True)
+                self._running = key
+            name, size = key
+            try:
+                path = self._resolve(name)
+                image = load_image(path, size) if path else None
+            except Exception:
+                logger.exception("Loading icon %r failed", name)
+                image = None
+            with self._cond:
+                self._running = None
+            self.loaded.emit(name, size, image)
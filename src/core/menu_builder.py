@@ -12,9 +12,10 @@ import logging
 import os
 from functools import partial
 
-from PyQt6.QtGui import QAction, QIcon
+from PyQt6.QtGui import QAction
 from PyQt6.QtWidgets import QMenu
 
+from core.icon_cache import icon_cache
 from utils.dialogs import show_error_and_raise
 
 logger = logging.getLogger(__name__)
@@ -28,15 +29,22 @@ class MenuBuilder:
     - Resolve command references
     - Handle icon resolution and fallback
     - Create menu actions with proper signal connections
+
+    In lazy mode, group submenus are created empty and filled the first time
+    they emit ``aboutToShow``.  Nested groups are deferred the same way, and
+    top-level group icons are resolved when the root menu is first shown, so
+    building the menu costs the same regardless of how many commands exist.
     """
 
-    def __init__(self, tray_app):
+    def __init__(self, tray_app, lazy: bool = False):
         """Initialize MenuBuilder with reference to parent TrayApp.
 
         Args:
             tray_app: The parent TrayApp instance providing context and methods
+            lazy: Defer submenu contents and icons until a menu is first shown
         """
         self.tray_app = tray_app
+        self.lazy = lazy
 
     def build(self, menu, command_menu):
         """Build the complete tray menu from command configuration.
@@ -52,35 +60,31 @@ class MenuBuilder:
             )
 
         # Iterate over the commands and create menu items
+        group_menus = {}
+        pending_icons = []
         for group, items in command_menu.items():
-            # Check if each group is a dictionary
-            if not isinstance(items, dict):
-                show_error_and_raise(
-                    f"Invalid command group format: {group}. Each group must be a dictionary."
-                )
-
-            # Resolve the icon path correctly
-            icon_path = self._get_item_icon_path(items.get("icon"), self.tray_app.icon_file)
-
-            # Create a submenu for each group
-            submenu = QMenu(group, menu)
-            submenu.setIcon(QIcon(icon_path))
-
-            # Recursively add items to the submenu
-            self._add_menu_items(submenu, items, icon_path)
-
+            submenu = self._create_group_menu(menu, group, items, defer_icon=self.lazy)
             menu.addMenu(submenu)
+            group_menus[group] = submenu
+            if self.lazy:
+                pending_icons.append((submenu, items.get("icon")))
+        self.tray_app._group_menus = group_menus
+        self.tray_app._pending_group_icons = pending_icons
+        if pending_icons and getattr(self.tray_app, "_group_icon_hook_menu", None) is not menu:
+            # Connected once per root menu; rebuilds just replace the pending list.
+            menu.aboutToShow.connect(self._apply_pending_group_icons)
+            self.tray_app._group_icon_hook_menu = menu
 
         # Add favorites menu
         favorites_menu = QMenu("Favorites", menu)
-        favorites_menu.setIcon(QIcon(self.tray_app.icon_file))
+        favorites_menu.setIcon(icon_cache.icon(self.tray_app.icon_file))
         self.tray_app.favorites.populate_favorites_menu(favorites_menu)
         self.tray_app.favorites_menu = favorites_menu
         menu.addMenu(favorites_menu)
 
         # Add history menu
         history_menu = QMenu("Recent Commands", menu)
-        history_menu.setIcon(QIcon(self.tray_app.icon_file))
+        history_menu.setIcon(icon_cache.icon(self.tray_app.icon_file))
         menu.addMenu(history_menu)
         self.tray_app.history_menu = history_menu
         self.tray_app.reload_history_commands()
@@ -90,7 +94,7 @@ class MenuBuilder:
 
         # Commands group
         commands_menu = QMenu("Commands", menu)
-        commands_menu.setIcon(QIcon(self.tray_app.icon_file))
+        commands_menu.setIcon(icon_cache.icon(self.tray_app.icon_file))
         commands_menu.addAction("Quick Launch (Palette)", self.tray_app.palette.show_palette)
         commands_menu.addAction("App Launcher", self.tray_app.palette.show_app_launcher)
         commands_menu.addAction("Search Commands", self.tray_app.search.show_dialog)
@@ -105,11 +109,11 @@ class MenuBuilder:
 
         # Tools group
         tools_menu = QMenu("Tools", menu)
-        tools_menu.setIcon(QIcon(self.tray_app.icon_file))
+        tools_menu.setIcon(icon_cache.icon(self.tray_app.icon_file))
 
         # Import/Export submenu
         import_export_menu = QMenu("Import/Export", tools_menu)
-        import_export_menu.setIcon(QIcon(self.tray_app.icon_file))
+        import_export_menu.setIcon(icon_cache.icon(self.tray_app.icon_file))
         import_export_menu.addAction(
             "Import Command Group", self.tray_app.importExport.import_command_group
         )
@@ -120,20 +124,22 @@ class MenuBuilder:
 
         # Backup/Restore submenu
         backup_restore_menu = QMenu("Backup/Restore", tools_menu)
-        backup_restore_menu.setIcon(QIcon(self.tray_app.icon_file))
+        backup_restore_menu.setIcon(icon_cache.icon(self.tray_app.icon_file))
         backup_restore_menu.addAction("Backup Commands", self.tray_app.backup.backup_commands)
         backup_restore_menu.addAction("Restore Commands", self.tray_app.backup.restore_commands)
         tools_menu.addMenu(backup_restore_menu)
 
         # Encryption submenu
         encryption_menu = QMenu("Encrypt/Decrypt", tools_menu)
-        encryption_menu.setIcon(QIcon(self.tray_app.icon_file))
+        encryption_menu.setIcon(icon_cache.icon(self.tray_app.icon_file))
         encryption_menu.addAction(
             "Encrypt File/Folder", self.tray_app.file_encryptor.encrypt_file_or_folder
         )
         encryption_menu.addAction(
             "Decrypt File/Folder", self.tray_app.file_encryptor.decrypt_file_or_folder
         )
+        encryption_menu.addSeparator()
+        encryption_menu.addAction("Forget Cached Keys", self.tray_app.file_encryptor.forget_keys)
         tools_menu.addMenu(encryption_menu)
 
         # Add Create Schedule option
@@ -157,6 +163,129 @@ class MenuBuilder:
         menu.addAction("Restart App", self.tray_app.restart_app)
         menu.addAction("Exit", self.tray_app.confirm_exit)
 
+    def apply_diff(self, menu, command_menu, diff) -> bool:
+        """Patch the group submenus of an already-built *menu* in place.
+
+        Only the top-level groups named in *diff* are rebuilt; untouched groups
+        keep their existing ``QMenu`` objects.  Favorites, history and the
+        static Commands/Tools entries are left alone.
+
+        Args:
+            menu: The root tray QMenu previously populated by :meth:`build`.
+            command_menu: The freshly loaded command tree.
+            diff: A :class:`core.config_manager.CommandsDiff` against the tree
+                the menu was built from.
+
+        Returns:
+            ``False`` when the change cannot be applied incrementally (groups
+            were reordered or the menu was not built by :meth:`build`); the
+            caller should fall back to a full rebuild.
+        """
+        group_menus = getattr(self.tray_app, "_group_menus", None)
+        favorites_menu = getattr(self.tray_app, "favorites_menu", None)
+        if diff.reordered or group_menus is None or favorites_menu is None:
+            return False
+
+        for group in diff.removed:
+            old = group_menus.pop(group, None)
+            if old is not None:
+                menu.removeAction(old.menuAction())
+                old.deleteLater()
+
+        groups = list(command_menu)
+        for index, group in enumerate(groups):
+            if group in diff.changed and group in group_menus:
+                old = group_menus[group]
+                submenu = self._create_group_menu(menu, group, command_menu[group])
+                menu.insertMenu(old.menuAction(), submenu)
+                menu.removeAction(old.menuAction())
+                old.deleteLater()
+                group_menus[group] = submenu
+            elif group in diff.added or group not in group_menus:
+                anchor = favorites_menu.menuAction()
+                for following in groups[index + 1 :]:
+                    if following in group_menus:
+                        anchor = group_menus[following].menuAction()
+                        break
+                submenu = self._create_group_menu(menu, group, command_menu[group])
+                menu.insertMenu(anchor, submenu)
+                group_menus[group] = submenu
+
+        logger.info(
+            "Applied command changes incrementally (added=%d, removed=%d, changed=%d)",
+            len(diff.added),
+            len(diff.removed),
+            len(diff.changed),
+        )
+        return True
+
+    def _create_group_menu(self, menu, group, items, defer_icon=False):
+        """Create the submenu for top-level *group* without attaching it to *menu*.
+
+        With *defer_icon* the group icon is left for
+        :meth:`_apply_pending_group_icons`; nested items still inherit the
+        resolved group icon once the submenu is populated.
+        """
+        # Check if each group is a dictionary
+        if not isinstance(items, dict):
+            show_error_and_raise(
+                f"Invalid command group format: {group}. Each group must be a dictionary."
+            )
+
+        # Create a submenu for each group
+        submenu = QMenu(group, menu)
+
+        if defer_icon:
+            self._defer_menu_items(submenu, items, None)
+            return submenu
+
+        # Resolve the icon path correctly
+        icon_path = self._get_item_icon_path(items.get("icon"), self.tray_app.icon_file)
+        submenu.setIcon(icon_cache.icon(icon_path))
+
+        if self.lazy:
+            self._defer_menu_items(submenu, items, icon_path)
+            return submenu
+
+        # Recursively add items to the submenu
+        self._add_menu_items(submenu, items, icon_path)
+        return submenu
+
+    def _defer_menu_items(self, submenu, items, parent_icon_path, group_name=""):
+        """Populate *submenu* from *items* the first time it is about to show.
+
+        A ``None`` *parent_icon_path* marks a top-level group whose icon has
+        not been resolved yet; it is resolved at population time.
+        """
+        populated = False
+
+        def populate():
+            nonlocal populated
+            if populated:
+                return
+            populated = True
+            icon_path = parent_icon_path
+            if icon_path is None:
+                icon_path = self._get_item_icon_path(items.get("icon"), self.tray_app.icon_file)
+            self._add_menu_items(submenu, items, icon_path, group_name)
+
+        submenu.aboutToShow.connect(populate)
+
+    def _apply_pending_group_icons(self):
+        """Resolve and set icons for top-level group menus built lazily."""
+        pending = getattr(self.tray_app, "_pending_group_icons", None)
+        if not pending:
+            return
+        self.tray_app._pending_group_icons = []
+        # Skip menus that an incremental reload has since replaced or removed.
+        live = {id(m) for m in (getattr(self.tray_app, "_group_menus", None) or {}).values()}
+        for submenu, icon_spec in pending:
+            if id(submenu) not in live:
+                continue
+            submenu.setIcon(
+                icon_cache.icon(self._get_item_icon_path(icon_spec, self.tray_app.icon_file))
+            )
+
     def _add_menu_items(self, menu, items, parent_icon_path, group_name=""):
         """Recursively add items to the menu.
 
@@ -177,9 +306,12 @@ class MenuBuilder:
                 icon_path = self._get_item_icon_path(item.get("icon"), parent_icon_path)
 
                 submenu = QMenu(label, menu)
-                submenu.setIcon(QIcon(icon_path))
+                submenu.setIcon(icon_cache.icon(icon_path))
                 new_group = label if not group_name else f"{group_name} → {label}"
-                self._add_menu_items(submenu, item, icon_path, new_group)
+                if self.lazy:
+                    self._defer_menu_items(submenu, item, icon_path, new_group)
+                else:
+                    self._add_menu_items(submenu, item, icon_path, new_group)
                 menu.addMenu(submenu)
 
             # Handle command case (direct commands or references)
@@ -267,7 +399,7 @@ class MenuBuilder:
                 prompt = resolved_item.get("prompt", None)
 
                 # Create action with reference indicator
-                action = QAction(QIcon(icon_path), f"{label}", menu)
+                action = QAction(icon_cache.icon(icon_path), f"{label}", menu)
 
                 # Connect the action to execute command
                 action.triggered.connect(
@@ -304,7 +436,7 @@ class MenuBuilder:
         show_output = item.get("showOutput", False)
         confirm = item.get("confirm", False)
         prompt = item.get("prompt", None)
-        action = QAction(QIcon(icon_path), label, menu)
+        action = QAction(icon_cache.icon(icon_path), label, menu)
 
         # Connect the action to execute command
         action.triggered.connect(
@@ -0,0 +1,349 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Search ranking shared by the command palette, search dialog and app launcher.
+
+A candidate's rank blends its fuzzy match score (``rapidfuzz.fuzz.WRatio``,
+0–100) with a frecency boost from :mod:`core.frecency`, so commands you
+launch often and recently float to the top of otherwise similar matches.
+With an empty query candidates are ordered by frecency alone, keeping their
+original order among equals.
+
+Scoring is batched: candidate texts are handed to
+``rapidfuzz.process.extract`` in one call (C loop, ``score_cutoff`` applied
+before results are materialised) instead of calling the scorer per item from
+Python.  A pure-Python :func:`extract` with the same signature and result
+shape is used for the substring fallback when rapidfuzz is unavailable.
+
+Callers keep a :class:`SearchSession` per candidate list
+(:func:`command_session`, :func:`app_session`).  It scores only what can
+reach the requested top-N and caches recent query scores so each keystroke
+only rescores the previous query's matches.
+"""
+
+import logging
+from bisect import bisect_right
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Sequence
+from itertools import accumulate
+from typing import TypeVar
+
+from core.frecency import app_key, command_key, frecency_store
+
+logger = logging.getLogger(__name__)
+
+try:
+    from rapidfuzz import fuzz as _fuzz
+    from rapidfuzz import process as _process
+
+    _FUZZY_AVAILABLE = True
+except ImportError:
+    _FUZZY_AVAILABLE = False
+    logger.warning("rapidfuzz not available; falling back to substring search")
+
+T = TypeVar("T")
+
+# Fuzzy scores at or below this are dropped unless the query is a substring.
+MATCH_THRESHOLD = 30
+# Maximum number of points frecency can add to a fuzzy score.
+FRECENCY_WEIGHT = 25.0
+# Joins candidate texts for the batched substring search; never typed.
+_SEPARATOR = "\x00"
+
+
+def fuzzy_score(query: str, text: str) -> float:
+    """Return a match score 0–100 for *query* against *text*."""
+    if _FUZZY_AVAILABLE:
+        return _fuzz.WRatio(query, text)
+    return 100.0 if query.lower() in text.lower() else 0.0
+
+
+def _substring_extract(query, choices, *, score_cutoff=0, limit=None):
+    needle = query.lower()
+    matches = [
+        (choice, 100.0, index)
+        for index, choice in enumerate(choices)
+        if 100.0 >= score_cutoff and needle in choice.lower()
+    ]
+    return matches if limit is None else matches[:limit]
+
+
+def extract(
+    query: str,
+    choices: Sequence[str],
+    *,
+    score_cutoff: float = 0,
+    limit: int | None = None,
+) -> list[tuple[str, float, int]]:
+    """Score *query* against every string in *choices* in one batch.
+
+    Returns ``(choice, score, index)`` tuples with ``score >= score_cutoff``,
+    best first and in *choices* order among equal scores, truncated to
+    *limit* entries.  Same contract as ``rapidfuzz.process.extract``.
+    """
+    if _FUZZY_AVAILABLE:
+        return _process.extract(
+            query,
+            choices,
+            scorer=_fuzz.WRatio,
+            processor=None,
+            score_cutoff=score_cutoff,
+            limit=limit,
+        )
+    return _substring_extract(query, choices, score_cutoff=score_cutoff, limit=limit)
+
+
+def frecency_boost(frecency: float) -> float:
+    """Map a decayed launch count onto ``0 … FRECENCY_WEIGHT`` points.
+
+    Saturating, so a handful of recent launches matter but a command run a
+    thousand times cannot outrank a much better textual match.
+    """
+    if frecency <= 0:
+        return 0.0
+    return FRECENCY_WEIGHT * frecency / (frecency + 3.0)
+
+
+def _order(
+    items: Sequence[T],
+    matched: dict[int, float],
+    scores: dict[str, float],
+    key: Callable[[T], str],
+    limit: int | None = None,
+) -> list[T]:
+    """Sort matched item indices by fuzzy score plus frecency boost."""
+    ranked = [
+        (score + frecency_boost(scores.get(key(items[index]), 0.0)) if scores else score, index)
+        for index, score in matched.items()
+    ]
+    ranked.sort(key=lambda entry: (-entry[0], entry[1]))
+    if limit is not None:
+        del ranked[limit:]
+    return [items[index] for _score, index in ranked]
+
+
+class SearchSession:
+    """Typed-ahead search over one fixed candidate list.
+
+    Keeps the fuzzy scores of recent queries in a small LRU.  When a new
+    query extends a cached one (``"dock"`` → ``"docke"``), only that query's
+    matches are rescored instead of the whole catalogue; backspacing to a
+    cached query reuses its scores outright.  Frecency is applied at sort
+    time, so recent launches are always reflected.
+
+    A query with no cached prefix and a ``limit`` is scored top-N only:
+    ``extract`` returns at most *limit* fuzzy matches, candidates with a
+    frecency boost are rescored as a batch since only they can overtake
+    that top-N, and substring-only matches are looked up only while it is
+    not full.  Such partial results are not cached for narrowing unless
+    they turned out to hold every match.  Substring matches are found with
+    one pass over all candidate texts joined into a single string.
+
+    Narrowing assumes a candidate that failed a query also fails its
+    extensions.  That is exact for substring matches, but fuzzy scores are
+    not strictly monotonic: a weak match that only clears the threshold for
+    the longer query (``"d"`` vs ``"tool"`` fails, ``"do"`` passes) is not
+    picked up.  Strong matches are unaffected.
+
+    Args:
+        items: Candidates; must not change for the session's lifetime.
+        text: Returns the text fuzzy matching is scored against.
+        key: Returns the candidate's frecency key.
+        substring_text: Returns lowercased text that, if it contains the
+            query, keeps a candidate regardless of its fuzzy score.  Defaults
+            to ``text(item).lower()``.
+        choices: Pre-built ``text(item)`` for every item, in order; built on
+            the fly when omitted.
+        max_queries: Number of recent queries whose scores are kept.
+        store: Frecency store; defaults to the shared ``frecency_store``.
+    """
+
+    def __init__(
+        self,
+        items: Iterable[T],
+        *,
+        text: Callable[[T], str],
+        key: Callable[[T], str],
+        substring_text: Callable[[T], str] | None = None,
+        choices: Sequence[str] | None = None,
+        max_queries: int = 32,
+        store=None,
+    ):
+        self.items = items
+        self._items = items if isinstance(items, Sequence) else list(items)
+        self._key = key
+        self._substring_text = substring_text
+        self._choices = choices if choices is not None else [text(item) for item in self._items]
+        self._store = store
+        self._max_queries = max_queries
+        # query -> {index: fuzzy score} holding every match; oldest → newest
+        self._cache: OrderedDict[str, dict[int, float]] = OrderedDict()
+        # Substring texts joined by _SEPARATOR, and where each one starts
+        self._haystack: str | None = None
+        self._starts: list[int] = []
+        # frecency key -> item indices; built on first use
+        self._by_key: dict[str, list[int]] | None = None
+
+    def search(self, query: str, limit: int | None = None) -> list[T]:
+        """Return items matching *query*, best first.
+
+        A blank query returns every item, most frecent first and otherwise
+        in their original order.  *limit* caps the number of matches for a
+        non-blank query.
+        """
+        store = frecency_store if self._store is None else self._store
+        scores = store.scores()
+        q = query.strip()
+        if not q:
+            if not scores:
+                return list(self._items)
+            return sorted(self._items, key=lambda item: -scores.get(self._key(item), 0.0))
+        return _order(self._items, self._matches(q, limit, scores), scores, self._key, limit)
+
+    def _matches(self, q: str, limit: int | None, scores: dict[str, float]) -> dict[int, float]:
+        matched = self._cache.get(q)
+        if matched is not None:
+            self._cache.move_to_end(q)
+            return matched
+
+        # Narrow from the longest cached query that this one extends.
+        base = max((p for p in self._cache if q.startswith(p)), key=len, default=None)
+        if base is not None:
+            matched = self._score(q, sorted(self._cache[base]))
+        elif limit is None:
+            matched = self._score(q)
+        else:
+            matched, complete = self._top(q, limit, scores)
+            if not complete:
+                return matched
+
+        self._cache[q] = matched
+        while len(self._cache) > self._max_queries:
+            self._cache.popitem(last=False)
+        return matched
+
+    def _score(self, q: str, candidates: list[int] | None = None) -> dict[int, float]:
+        """Return ``{index: fuzzy score}`` for every item matching *q*.
+
+        Only the item indices in *candidates* (ascending) are scored when
+        given.
+        """
+        if candidates is None:
+            matched = {
+                index: score
+                for _choice, score, index in extract(q, self._choices, score_cutoff=MATCH_THRESHOLD)
+                if score > MATCH_THRESHOLD
+            }
+        else:
+            subset = [self._choices[i] for i in candidates]
+            matched = {
+                candidates[pos]: score
+                for _choice, score, pos in extract(q, subset, score_cutoff=MATCH_THRESHOLD)
+                if score > MATCH_THRESHOLD
+            }
+        # Substring hits of an extension are always among the base's matches.
+        self._add_substring_matches(q, matched)
+        return matched
+
+    def _top(self, q: str, limit: int, scores: dict[str, float]) -> tuple[dict[int, float], bool]:
+        """Score only what can reach the top *limit*; also return whether that is every match."""
+        matched = {
+            index: score
+            for _choice, score, index in extract(
+                q, self._choices, score_cutoff=MATCH_THRESHOLD, limit=limit
+            )
+            if score > MATCH_THRESHOLD
+        }
+        if len(matched) < limit:
+            # Every fuzzy match is in; with the substring-only ones the set is complete.
+            self._add_substring_matches(q, matched)
+            return matched, True
+
+        # Substring-only matches score at most MATCH_THRESHOLD, below the full
+        # fuzzy top-N; only a frecency boost can lift another item into it.
+        boosted = sorted(
+            {
+                index
+                for key, score in scores.items()
+                if score > 0
+                for index in self._indices_for(key)
+                if index not in matched
+            }
+        )
+        if boosted:
+            needle = q.lower()
+            for _choice, score, pos in extract(q, [self._choices[i] for i in boosted]):
+                index = boosted[pos]
+                if score > MATCH_THRESHOLD or needle in self._substring(index):
+                    matched[index] = score
+        return matched, False
+
+    def _add_substring_matches(self, q: str, matched: dict[int, float]) -> None:
+        """Add items containing *q* that fuzzy matching dropped, with their fuzzy score."""
+        missing = [index for index in self._substring_hits(q.lower()) if index not in matched]
+        if missing:
+            for _choice, score, pos in extract(q, [self._choices[i] for i in missing]):
+                matched[missing[pos]] = score
+
+    def _substring_hits(self, needle: str) -> list[int]:
+        """Return the indices of items whose substring text contains *needle*, ascending."""
+        if self._haystack is None:
+            texts = [self._substring(i) for i in range(len(self._items))]
+            self._starts = list(accumulate((len(t) + 1 for t in texts[:-1]), initial=0))
+            self._haystack = _SEPARATOR.join(texts)
+        if _SEPARATOR in needle:
+            return []
+        haystack, starts = self._haystack, self._starts
+        hits = []
+        pos = haystack.find(needle)
+        while pos != -1:
+            index = bisect_right(starts, pos) - 1
+            hits.append(index)
+            if index + 1 >= len(starts):
+                break
+            # Continue from the next item; one hit per item is enough.
+            pos = haystack.find(needle, starts[index + 1])
+        return hits
+
+    def _substring(self, index: int) -> str:
+        if self._substring_text is not None:
+            return self._substring_text(self._items[index])
+        return self._choices[index].lower()
+
+    def _indices_for(self, key: str) -> list[int]:
+        if self._by_key is None:
+            self._by_key = {}
+            for index, item in enumerate(self._items):
+                self._by_key.setdefault(self._key(item), []).append(index)
+        return self._by_key.get(key, [])
+
+
+def command_session(records: Iterable, store=None) -> SearchSession:
+    """Return a :class:`SearchSession` over :class:`core.command_index.CommandRecord` objects.
+
+    A :class:`core.command_index.CommandIndex` supplies its pre-built
+    ``texts`` as the scoring choices.
+    """
+    return SearchSession(
+        records,
+        text=lambda c: c.text,
+        key=lambda c: command_key(c.label, c.command),
+        substring_text=lambda c: c.search_text,
+        choices=getattr(records, "texts", None),
+        store=store,
+    )
+
+
+def app_session(apps: Iterable, store=None) -> SearchSession:
+    """Return a :class:`SearchSession` over :class:`modules.app_discovery.AppEntry` objects.
+
+    Apps are fuzzy-matched on name plus categories; the substring fallback
+    only looks at the name.
+    """
+    return SearchSession(
+        apps,
+        text=lambda a: f"{a.name} {a.categories_str}",
+        key=lambda a: app_key(a.name),
+        substring_text=lambda a: a.name.lower(),
+        store=store,
+    )
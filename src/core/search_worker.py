@@ -0,0 +1,92 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Background search worker shared by the command palette and search dialog.
+
+Ranking thousands of commands or apps on every keystroke blocks the Qt main
+thread.  ``SearchWorker`` runs search callables on one daemon thread
+instead.  Every :meth:`SearchWorker.submit` starts a new *generation*; a
+query still waiting when a newer one arrives is dropped without running, and
+results from a superseded generation are never posted.  Finished results
+reach the GUI thread through the ``results_ready`` signal (queued across
+threads by Qt), where receivers should still check :meth:`is_current` since
+a newer keystroke may have arrived in the meantime.
+"""
+
+import logging
+import threading
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+logger = logging.getLogger(__name__)
+
+
+class SearchWorker(QObject):
+    """Run the most recent search job on a background thread.
+
+    Signals:
+        results_ready(int, object): Generation number and results of a
+            search that was still current when it finished.
+    """
+
+    results_ready = pyqtSignal(int, object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._cond = threading.Condition()
+        # (generation, fn, args, kwargs) waiting to run, newest only
+        self._job: tuple | None = None
+        self._generation = 0
+        self._stopped = False
+        self._thread: threading.Thread | None = None
+
+    def submit(self, fn, *args, **kwargs) -> int:
+        """Queue ``fn(*args, **kwargs)``, replacing any job not yet started.
+
+        Returns the generation number the results will be posted with.
+        """
+        with self._cond:
+            self._generation += 1
+            self._job = (self._generation, fn, args, kwargs)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True, name="search")
+                self._thread.start()
+            self._cond.notify()
+            return self._generation
+
+    def cancel(self) -> None:
+        """Drop the pending job and suppress results of the running one."""
+        with self._cond:
+            self._generation += 1
+            self._job = None
+
+    def is_current(self, generation: int) -> bool:
+        """Return True if *generation* is the most recently submitted query."""
+        return generation == self._generation
+
+    def stop(self) -> None:
+        """Cancel outstanding work and let the worker thread exit."""
+        with self._cond:
+            self._generation += 1
+            self._job = None
+            self._stopped = True
+            self._cond.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._job is None and not self._stopped:
+                    self._cond.wait()
+                if self._stopped:
+                    return
+                generation, fn, args, kwargs = self._job
+                self._job = None
+            try:
+                results = fn(*args, **kwargs)
+            except Exception:
+                logger.exception("Background search failed")
+                continue
+            if self.is_current(generation):
+                self.results_ready.emit(generation, results)
+            else:
+                logger.debug("Dropped results of stale search generation %d", generation)
@@ -14,6 +14,7 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from core.command_index import CommandIndex
     from core.config_manager import ConfigManager
 
 
@@ -25,7 +26,7 @@ class AppServices:
     execute: Callable[[str, str, bool, bool, str | None], None]
     reload_commands: Callable[..., None]
     show_output: Callable[[str, str], None]
-    get_all_commands: Callable[[], list]
+    get_command_index: Callable[[], CommandIndex]
     save_commands: Callable[[dict], None]
     reload_history_commands: Callable[[], None]
     reload_favorites_commands: Callable[[], None]
@@ -8,15 +8,19 @@ import subprocess
 import sys
 import weakref
 
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QColor, QFont, QIcon, QPainter, QPixmap
+from PyQt6.QtCore import QTimer
 from PyQt6.QtWidgets import QInputDialog, QMenu, QSystemTrayIcon
 
-from core.config_manager import ConfigurationError, config_manager
+from core.command_index import CommandIndex
+from core.config_manager import ConfigurationError, config_manager, diff_command_groups
+from core.file_watcher import DebouncedFileWatcher
+from core.frecency import command_key, frecency_store
+from core.icon_cache import icon_cache
 from core.icon_resolver import IconResolver
 from core.menu_builder import MenuBuilder
 from core.services import AppServices
 from core.theme_manager import ThemeManager
+from core.tray_badge import TrayBadgeRenderer
 from modules.backup_restore import BackupRestore
 from modules.command_creator import CommandCreator
 from modules.command_executor import CommandExecutor
@@ -36,6 +40,9 @@ from utils.dialogs import confirm_execute, confirm_exit, show_error_and_raise
 
 logger = logging.getLogger(__name__)
 
+# ~one frame at 60 Hz
+_BADGE_REPAINT_INTERVAL_MS = 16
+
 
 class TrayApp:
     """Main tray application class that manages the system tray icon and menu."""
@@ -48,11 +55,11 @@ class TrayApp:
 
           _setup_paths()       — base_dir, icon_file
           _setup_theme()       — ThemeManager, apply theme from settings
-          _setup_tray_icon()   — QSystemTrayIcon, quit-on-close behaviour
+          _setup_tray_icon()   — QSystemTrayIcon, badge renderer, quit-on-close behaviour
           _build_services()    — AppServices dataclass
           _build_modules()     — feature module instances
           _build_ui()          — UI widget instances and hotkeys
-          _build_menu()        — tray context menu
+          _build_menu()        — tray context menu and commands file watcher
         """
         self.app = app
         self.instance_checker = instance_checker
@@ -97,7 +104,7 @@ class TrayApp:
         self.app.aboutToQuit.connect(self.cleanup)
         self.app.setQuitOnLastWindowClosed(False)
 
-        tray_qicon = QIcon(self.icon_file)
+        tray_qicon = icon_cache.icon(self.icon_file)
         self.tray_icon = QSystemTrayIcon(tray_qicon)
         self.tray_icon.setIcon(tray_qicon)
         self.tray_icon.setVisible(True)
@@ -107,6 +114,14 @@ class TrayApp:
         self._running_processes: dict = {}
         self._running_action = None
 
+        # Badge repaints are coalesced to at most one per frame.
+        self._badge_renderer = TrayBadgeRenderer(self.icon_file)
+        self._badge_count = 0
+        self._badge_timer = QTimer()
+        self._badge_timer.setSingleShot(True)
+        self._badge_timer.setInterval(_BADGE_REPAINT_INTERVAL_MS)
+        self._badge_timer.timeout.connect(self._repaint_tray_badge)
+
     def _build_services(self) -> None:
         """Construct the AppServices dataclass and load the initial command menu."""
         try:
@@ -120,7 +135,7 @@ class TrayApp:
             execute=self.execute,
             reload_commands=self.reload_commands,
             show_output=self.show_command_output,
-            get_all_commands=self.get_all_commands,
+            get_command_index=self.get_command_index,
             save_commands=self.save_commands,
             reload_history_commands=self.reload_history_commands,
             reload_favorites_commands=self.reload_favorites_commands,
@@ -156,12 +171,38 @@ class TrayApp:
         self.quick_launch_bar.register_hotkey(bar_hotkey)
 
     def _build_menu(self) -> None:
-        """Build the tray context menu and attach it to the tray icon."""
-        self.reload_commands()
-        MenuBuilder(self).build(self.menu, self.command_menu)
+        """Build the tray context menu and attach it to the tray icon.
+
+        Uses the commands :meth:`_build_services` just loaded rather than
+        reading the commands file a second time at startup.
+        """
+        self._menu_builder().build(self.menu, self.command_menu)
         self.tray_icon.setContextMenu(self.menu)
         self.tray_icon.show()
         self._update_tray_tooltip()
+        self._setup_commands_watcher()
+
+    def _setup_commands_watcher(self) -> None:
+        """Watch the active commands file so external edits apply incrementally.
+
+        Safe to call repeatedly: the watch follows the ``auto_reload_commands``
+        setting and whichever commands file is currently active, and is only
+        re-armed when either of them changed.
+        """
+        target = None
+        if config_manager.get_settings().get("auto_reload_commands", True):
+            target = os.path.abspath(config_manager.get_active_commands_file())
+        if target == getattr(self, "_watched_commands_file", None):
+            return
+        self._watched_commands_file = target
+        watcher = getattr(self, "_commands_watcher", None)
+        if watcher is not None:
+            watcher.stop()
+        if target is None:
+            return
+        if watcher is None:
+            watcher = self._commands_watcher = DebouncedFileWatcher(self._on_commands_file_changed)
+        watcher.watch_file(target)
 
     # ------------------------------------------------------------------ #
     # Icon path resolution (thin proxy to IconResolver)                   #
@@ -178,7 +219,7 @@ class TrayApp:
     def _update_tray_tooltip(self) -> None:
         """Set the tray tooltip to show the app name and the number of loaded commands."""
         try:
-            count = len(self.get_all_commands())
+            count = len(self.get_command_index())
             self.tray_icon.setToolTip(f"py-tray-command-launcher — {count} command(s) loaded")
         except Exception:
             self.tray_icon.setToolTip("py-tray-command-launcher")
@@ -187,10 +228,15 @@ class TrayApp:
     # Command execution                                                    #
     # ------------------------------------------------------------------ #
 
+    def _menu_builder(self) -> MenuBuilder:
+        """Return a MenuBuilder configured from the current settings."""
+        lazy = config_manager.get_settings().get("lazy_menus", False) is True
+        return MenuBuilder(self, lazy=lazy)
+
     def load_tray_menu(self):
         """Load commands into the tray menu."""
         self.reload_commands()
-        MenuBuilder(self).build(self.menu, self.command_menu)
+        self._menu_builder().build(self.menu, self.command_menu)
 
     def execute(self, title, command, confirm, show_output, prompt):
         """Execute a command with optional confirmation and input prompt."""
@@ -203,6 +249,7 @@ class TrayApp:
             "timestamp": datetime.datetime.now().isoformat(),
         }
         config_manager.add_to_history(history_entry)
+        frecency_store.record(command_key(title, command))
 
         if confirm:
             if not confirm_execute(command):
@@ -306,7 +353,7 @@ class TrayApp:
             pass
 
     def _update_tray_badge(self):
-        """Repaint the tray icon with a badge showing running process count."""
+        """Update the running-count menu entry and schedule a badge repaint."""
         count = len(self._running_processes)
 
         if self._running_action is not None:
@@ -316,33 +363,20 @@ class TrayApp:
             else:
                 self._running_action.setVisible(False)
 
-        base = QPixmap(self.icon_file)
-        if base.isNull():
-            return
+        # A burst of starts/finishes within one frame results in a single repaint.
+        if not self._badge_timer.isActive():
+            self._badge_timer.start()
 
-        if count == 0:
-            self.tray_icon.setIcon(QIcon(base))
+    def _repaint_tray_badge(self):
+        """Set the tray icon for the current running-process count."""
+        count = len(self._running_processes)
+        if count == self._badge_count:
             return
-
-        badge_size = max(base.width() // 3, 12)
-        painter = QPainter(base)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
-        bx = base.width() - badge_size - 1
-        by = base.height() - badge_size - 1
-        painter.setBrush(QColor("#e64553"))
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawEllipse(bx, by, badge_size, badge_size)
-
-        font = QFont()
-        font.setPixelSize(max(badge_size - 4, 8))
-        font.setBold(True)
-        painter.setFont(font)
-        painter.setPen(QColor("white"))
-        painter.drawText(bx, by, badge_size, badge_size, Qt.AlignmentFlag.AlignCenter, str(count))
-        painter.end()
-
-        self.tray_icon.setIcon(QIcon(base))
+        icon = self._badge_renderer.icon(count)
+        if icon is None:
+            return
+        self._badge_count = count
+        self.tray_icon.setIcon(icon)
 
     # ------------------------------------------------------------------ #
     # Utility / reload methods                                             #
@@ -355,37 +389,13 @@ class TrayApp:
         except ConfigurationError as e:
             show_error_and_raise(f"Failed to save commands: {str(e)}")
 
-    def get_all_commands(self):
-        """Get all commands from the configuration."""
+    def get_command_index(self) -> CommandIndex:
+        """Return the shared flat index of all configured commands."""
         try:
-            commands = config_manager.get_commands()
-            result = []
-
-            def process_items(group_name, items):
-                for label, item in items.items():
-                    if isinstance(item, dict) and "command" in item and label != "icon":
-                        result.append(
-                            {
-                                "group": group_name,
-                                "label": label,
-                                "command": item["command"],
-                                "confirm": item.get("confirm", False),
-                                "showOutput": item.get("showOutput", False),
-                                "prompt": item.get("prompt"),
-                            }
-                        )
-                    elif isinstance(item, dict) and "command" not in item and label != "icon":
-                        new_group = f"{group_name} → {label}"
-                        process_items(new_group, item)
-
-            for group_name, items in commands.items():
-                if isinstance(items, dict):
-                    process_items(group_name, items)
-
-            return result
+            return config_manager.get_command_index()
         except ConfigurationError as e:
             show_error_and_raise(f"Failed to get commands: {str(e)}")
-            return []
+            return CommandIndex()
 
     def open_commands_json(self):
         """Open the active commands file with the default text editor."""
@@ -417,8 +427,14 @@ class TrayApp:
                 command_paths["config_dir"],
             )
             self.command_menu = config_manager.get_commands(refresh=True)
+            if getattr(self, "_watched_commands_file", None) is not None:
+                # Restores and imports may have switched the active file.
+                self._setup_commands_watcher()
 
             if rebuild_menu:
+                # Pick up icon files that changed on disk since the last build.
+                icon_cache.clear()
+                self._badge_renderer.clear()
                 self.menu.clear()
                 self.load_tray_menu()
                 self.tray_icon.setContextMenu(self.menu)
@@ -427,6 +443,46 @@ class TrayApp:
             show_error_and_raise(f"Failed to reload commands: {str(e)}")
             self.command_menu = {}
 
+    def _on_commands_file_changed(self, _paths=None) -> None:
+        """Re-read the commands file after an external edit and patch the menu.
+
+        Only the top-level groups that differ from the currently loaded tree
+        are rebuilt.  A file that fails to parse or validate (e.g. saved
+        mid-edit) is reported via a tray notification and the current menu
+        is kept.
+        """
+        commands_file = config_manager.get_active_commands_file()
+        if not os.path.exists(commands_file):
+            # Mid-save gap: the watcher re-arms once the file is recreated.
+            return
+        if not config_manager.commands_changed_on_disk():
+            # Our own save or restore; whoever wrote it already reloaded.
+            logger.debug("Ignoring change to %s written by this process", commands_file)
+            return
+        previous = self.command_menu
+        try:
+            updated = config_manager.get_commands(refresh=True)
+        except ConfigurationError as e:
+            logger.warning("Ignoring change to %s: %s", commands_file, e)
+            self.notify_user("Commands not reloaded", str(e))
+            return
+
+        diff = diff_command_groups(previous, updated)
+        self.command_menu = updated
+        if diff.is_empty():
+            logger.debug("Commands file changed on disk but the command tree is identical")
+            return
+
+        if not self._menu_builder().apply_diff(self.menu, updated, diff):
+            self.menu.clear()
+            self._menu_builder().build(self.menu, updated)
+            self.tray_icon.setContextMenu(self.menu)
+        else:
+            # Favorites may reference commands inside the changed groups
+            self.reload_favorites_commands()
+        self.quick_launch_bar.refresh()
+        self._update_tray_tooltip()
+
     def reload_history_commands(self):
         """Reload the history commands."""
         self.history.populate_menu(self.history_menu)
@@ -484,6 +540,7 @@ class TrayApp:
             app_launcher_hotkey_callback=self._reregister_app_launcher_hotkey,
         )
         dlg.exec()
+        self._setup_commands_watcher()
 
     # ------------------------------------------------------------------ #
     # Hotkey re-registration                                               #
@@ -532,11 +589,15 @@ class TrayApp:
     def cleanup(self):
         """Perform cleanup before quitting."""
         logger.info("Cleaning up before exit")
+        if getattr(self, "_commands_watcher", None) is not None:
+            self._commands_watcher.stop()
         for window in self.output_windows:
             window.close()
         self.palette.unregister_hotkey()
         self.quick_launch_bar.unregister_hotkey()
         self.quick_launch_bar.close()
+        self.file_encryptor.forget_keys()
+        frecency_store.flush()
         self.instance_checker.cleanup()
 
     def run(self):
@@ -0,0 +1,98 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Tray icon badge rendering.
+
+The tray icon shows a red badge with the number of running ``showOutput``
+commands.  Firing many short-lived commands used to reload the base icon and
+repaint the badge with ``QPainter`` on every start/finish.  ``TrayBadgeRenderer``
+keeps the base pixmap and memoises one rendered icon per badge label
+(``"1"`` … ``"99"``, ``"99+"``), so each label is painted at most once.
+"""
+
+import logging
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor, QFont, QIcon, QPainter, QPixmap
+
+from core.icon_cache import icon_cache
+
+logger = logging.getLogger(__name__)
+
+BADGE_MAX_COUNT = 99
+BADGE_COLOR = "#e64553"
+
+
+def badge_text(count: int) -> str:
+    """Return the label drawn in the badge for *count* running processes."""
+    return f"{BADGE_MAX_COUNT}+" if count > BADGE_MAX_COUNT else str(count)
+
+
+class TrayBadgeRenderer:
+    """Render and memoise badged tray icons for a base icon file.
+
+    Args:
+        icon_file: Path to the tray icon image.
+    """
+
+    def __init__(self, icon_file: str):
+        self._icon_file = icon_file
+        self._base: QPixmap | None = None
+        self._icons: dict[str, QIcon] = {}
+
+    def icon(self, count: int) -> QIcon | None:
+        """Return the tray icon for *count* running processes.
+
+        Returns the plain icon for ``count <= 0`` and ``None`` when the base
+        icon cannot be loaded.
+        """
+        base = self._base_pixmap()
+        if base.isNull():
+            return None
+        if count <= 0:
+            return icon_cache.icon(self._icon_file)
+
+        text = badge_text(count)
+        icon = self._icons.get(text)
+        if icon is None:
+            icon = QIcon(self._render(base, text))
+            self._icons[text] = icon
+        return icon
+
+    def clear(self) -> None:
+        """Forget the base pixmap and every rendered badge (e.g. icon changed)."""
+        self._base = None
+        self._icons.clear()
+
+    def _base_pixmap(self) -> QPixmap:
+        if self._base is None:
+            self._base = icon_cache.pixmap(self._icon_file)
+        return self._base
+
+    @staticmethod
+    def _render(base: QPixmap, text: str) -> QPixmap:
+        """Paint a badge with *text* onto a copy of *base*."""
+        pixmap = QPixmap(base)
+
+        badge_size = max(pixmap.width() // 3, 12)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        bx = pixmap.width() - badge_size - 1
+        by = pixmap.height() - badge_size - 1
+        painter.setBrush(QColor(BADGE_COLOR))
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.drawEllipse(bx, by, badge_size, badge_size)
+
+        font = QFont()
+        # Shrink the font for three-character labels ("99+") so they fit.
+        pixel_size = max(badge_size - 4, 8) if len(text) < 3 else max(badge_size // 2, 6)
+        font.setPixelSize(pixel_size)
+        font.setBold(True)
+        painter.setFont(font)
+        painter.setPen(QColor("white"))
+        painter.drawText(bx, by, badge_size, badge_size, Qt.AlignmentFlag.AlignCenter, text)
+        painter.end()
+
+        logger.debug("Rendered tray badge %r", text)
+        return pixmap
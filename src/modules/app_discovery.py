@@ -10,45 +10,73 @@ Public API
     Module-level singleton.  Call ``app_discovery.get_all()`` to obtain the
     cached list of :class:`AppEntry` objects, or ``app_discovery.search(query)``
     for a scored, filtered subset.
+
+Parsed ``.desktop`` entries are kept in ``desktop_index.json`` in the user
+cache dir, keyed per directory and per file (mtime + size).  Every file is
+compared against its indexed mtime and size, so only new or changed files
+are parsed again — including files edited in place, which do not touch the
+directory's own mtime.
+
+New and changed files are parsed on a thread pool (``app_discovery_workers``
+setting).  ``load_in_background()`` runs the whole scan off the GUI thread;
+``get_all()`` then returns the apps parsed so far and progress listeners are
+told whenever more arrive.  ``_apps`` is only assigned once the scan is
+complete.
+
+Icon names are resolved through an index of the active icon theme, its
+``Inherits=`` chain and ``hicolor``, with each theme's application
+directories ordered by their ``index.theme`` size metadata.  Directory
+listings persist in ``icon_index.json`` and are reused while the
+directory's mtime is unchanged; ``icon_index_stats`` reports how long the
+last build took.
 """
 
-import configparser
+import dataclasses
 import functools
+import json
 import logging
 import os
 import re
 import shlex
 import shutil
+import stat
 import sys
 import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from pathlib import Path
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import QObject, Qt, pyqtSignal
 from PyQt6.QtGui import QIcon, QPixmap
 
+from core.config_manager import config_manager
+from core.icon_cache import pixmap_bytes
+from core.ranking import app_session
+
 logger = logging.getLogger(__name__)
 
 IS_WINDOWS = sys.platform == "win32"
 
-try:
-    from rapidfuzz import fuzz as _fuzz
-
-    _FUZZY_AVAILABLE = True
-except ImportError:
-    _FUZZY_AVAILABLE = False
-
-
-def _score(query: str, text: str) -> float:
-    if _FUZZY_AVAILABLE:
-        return _fuzz.WRatio(query, text)
-    return 100.0 if query.lower() in text.lower() else 0.0
-
-
 # Preferred icon sizes to try when scanning icon theme directories
 _PREFERRED_SIZES = ("48x48", "32x32", "64x64", "scalable", "24x24", "22x22", "16x16")
 _ICON_EXTS = (".png", ".svg", ".xpm")
 
+_DESKTOP_INDEX_VERSION = 2
+_ICON_INDEX_VERSION = 1
+# Catch-all icon directory for older packages, searched last.
+_PIXMAPS_DIR = Path("/usr/share/pixmaps")
+# Icon sizes in preference order; "scalable" directories rank after 64 px.
+_PREFERRED_PX = (48, 32, 64, None, 24, 22, 16)
+# Files parsed per pool task, and the fewest stale files worth a pool for.
+_PARSE_CHUNK = 32
+_PARALLEL_MIN_FILES = 64
+# Default budget for decoded app icons (app_icon_cache_mb setting)
+_PIXMAP_CACHE_MB = 16
+# Seconds a failed icon lookup is remembered before it is retried
+_NEGATIVE_TTL = 10.0
+
 # Terminal emulators to try (in preference order)
 _TERMINAL_EMULATORS = [
     "x-terminal-emulator",
@@ -78,6 +106,225 @@ def _find_terminal_emulator() -> str | None:
     return None
 
 
+def _read_index_theme(path: Path) -> tuple[list[str], list[tuple[str, dict[str, str]]]] | None:
+    """Parse an icon theme's ``index.theme``.
+
+    Returns ``(inherits, subdirs)`` where *subdirs* lists ``(subdir, keys)``
+    for every directory named in ``Directories=``/``ScaledDirectories=``, or
+    ``None`` if the file is missing, unreadable or has no ``[Icon Theme]``.
+    """
+    groups: dict[str, dict[str, str]] = {}
+    current: dict[str, str] | None = None
+    try:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line or line[0] in "#;":
+                    continue
+                if line[0] == "[" and line[-1] == "]":
+                    current = groups.setdefault(line[1:-1], {})
+                elif current is not None:
+                    key, sep, value = line.partition("=")
+                    if sep:
+                        current[key.rstrip()] = value.lstrip()
+    except (OSError, UnicodeDecodeError):
+        return None
+    theme = groups.get("Icon Theme")
+    if theme is None:
+        return None
+
+    def split(value: str) -> list[str]:
+        return [part.strip() for part in value.split(",") if part.strip()]
+
+    inherits = split(theme.get("Inherits", ""))
+    names = split(theme.get("Directories", "")) + split(theme.get("ScaledDirectories", ""))
+    return inherits, [(name, groups.get(name, {})) for name in dict.fromkeys(names)]
+
+
+def _find_index_theme(bases: list[Path], theme: str):
+    """Return :func:`_read_index_theme` for the first *theme* found in *bases*."""
+    for base in bases:
+        info = _read_index_theme(base / theme / "index.theme")
+        if info is not None:
+            return info
+    return None
+
+
+def _is_app_icon_dir(subdir: str, keys: dict[str, str]) -> bool:
+    """True for theme directories that hold application icons."""
+    context = keys.get("Context", "").lower()
+    if context:
+        return context in ("applications", "apps")
+    return Path(subdir).name in ("apps", "applications")
+
+
+def _icon_dir_rank(keys: dict[str, str]) -> tuple[int, int, int]:
+    """Sort key for a theme directory from its ``Size=``/``Scale=``/``Type=`` keys."""
+    try:
+        scale = int(keys.get("Scale", "1"))
+    except ValueError:
+        scale = 1
+    if keys.get("Type", "").lower() == "scalable":
+        return _PREFERRED_PX.index(None), 0, scale
+    try:
+        size = int(keys.get("Size", "0"))
+    except ValueError:
+        size = 0
+    rank = _PREFERRED_PX.index(size) if size in _PREFERRED_PX else len(_PREFERRED_PX)
+    return rank, abs(size - 48), scale
+
+
+# [Desktop Entry] keys AppEntry is built from; everything else is skipped.
+_DESKTOP_ENTRY_KEYS = frozenset(
+    {"Type", "Name", "Exec", "Icon", "Terminal", "Categories", "NoDisplay", "Hidden"}
+)
+# Same spellings configparser's getboolean() accepts as true.
+_TRUE_VALUES = frozenset({"1", "yes", "true", "on"})
+
+
+def _read_desktop_entry(path: Path) -> dict[str, str] | None:
+    """Return the ``[Desktop Entry]`` keys in :data:`_DESKTOP_ENTRY_KEYS`.
+
+    Streams the file and stops at the group following ``[Desktop Entry]``,
+    so ``[Desktop Action …]`` blocks are never read; localised keys such as
+    ``Name[de]`` are skipped.  Returns ``None`` when the file has no
+    ``[Desktop Entry]`` group.  Later duplicates of a key win.
+
+    Raises:
+        OSError, UnicodeDecodeError: If the file cannot be read as UTF-8.
+    """
+    values: dict[str, str] = {}
+    in_entry = False
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line[0] in "#;":
+                continue
+            if line[0] == "[":
+                if in_entry:
+                    break
+                in_entry = line == "[Desktop Entry]"
+                continue
+            if in_entry:
+                key, sep, value = line.partition("=")
+                if sep:
+                    key = key.rstrip()
+                    if key in _DESKTOP_ENTRY_KEYS:
+                        values[key] = value.lstrip()
+    return values if in_entry else None
+
+
+class _PixmapCache:
+    """LRU of resolved app icon pixmaps bounded by decoded bytes.
+
+    Keys are ``"<icon name>\\x00<size>"``.  Failed lookups can be stored as
+    negative entries that expire after *negative_ttl* seconds, so an icon
+    that cannot be found is not searched for again on every keystroke.
+    Negative entries cost nothing against the byte budget.
+
+    Args:
+        max_bytes: Budget for decoded pixel data; least recently used
+            pixmaps are evicted beyond it.  The newest entry is always kept.
+        negative_ttl: Lifetime of a negative entry in seconds.
+        clock: Returns the current time in seconds (injectable for tests).
+    """
+
+    def __init__(self, max_bytes: int, negative_ttl: float = _NEGATIVE_TTL, clock=time.monotonic):
+        self.max_bytes = max_bytes
+        self.negative_ttl = negative_ttl
+        self._clock = clock
+        # key -> (pixmap, cost_bytes); ordered oldest → newest
+        self._pixmaps: OrderedDict[str, tuple[QPixmap, int]] = OrderedDict()
+        # key -> expiry time of a failed lookup
+        self._missing: dict[str, float] = {}
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.negative_hits = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> QPixmap | None:
+        """Return the cached pixmap for *key*, or ``None``."""
+        entry = self._pixmaps.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._pixmaps.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def is_missing(self, key: str) -> bool:
+        """True if a lookup for *key* failed less than ``negative_ttl`` ago."""
+        expires = self._missing.get(key)
+        if expires is None:
+            return False
+        if self._clock() >= expires:
+            self._missing.pop(key, None)
+            return False
+        self.negative_hits += 1
+        return True
+
+    def put(self, key: str, pixmap: QPixmap) -> None:
+        """Store *pixmap* under *key*, evicting older entries over budget."""
+        self._missing.pop(key, None)
+        old = self._pixmaps.pop(key, None)
+        if old is not None:
+            self._bytes -= old[1]
+        cost = pixmap_bytes(pixmap)
+        self._pixmaps[key] = (pixmap, cost)
+        self._bytes += cost
+        while self._bytes > self.max_bytes and len(self._pixmaps) > 1:
+            _key, (_pixmap, evicted) = self._pixmaps.popitem(last=False)
+            self._bytes -= evicted
+            self.evictions += 1
+
+    def put_missing(self, key: str) -> None:
+        """Remember that *key* could not be resolved."""
+        if self.negative_ttl > 0:
+            self._missing[key] = self._clock() + self.negative_ttl
+
+    def discard_names(self, names) -> None:
+        """Drop every entry, positive or negative, for the icon *names*."""
+        names = set(names)
+        for key in [k for k in self._pixmaps if k.split("\x00", 1)[0] in names]:
+            self._bytes -= self._pixmaps.pop(key)[1]
+        self._missing = {
+            k: v for k, v in self._missing.items() if k.split("\x00", 1)[0] not in names
+        }
+
+    def clear_missing(self) -> None:
+        """Forget every failed lookup (e.g. once the icon index is ready)."""
+        self._missing.clear()
+
+    @property
+    def total_bytes(self) -> int:
+        """Decoded bytes currently held."""
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._pixmaps)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._pixmaps
+
+    def stats(self) -> dict:
+        """Return the counters plus current size, for logging."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "negative_hits": self.negative_hits,
+            "evictions": self.evictions,
+            "entries": len(self._pixmaps),
+            "bytes": self._bytes,
+        }
+
+
+class _WatchBridge(QObject):
+    """Thread-safe bridge asking the GUI thread to update the file watches."""
+
+    sync_requested = pyqtSignal()
+
+
 @dataclass
 class AppEntry:
     """Represents a single installed application parsed from a .desktop file."""
@@ -96,32 +343,323 @@ class AppEntry:
 class AppDiscovery:
     """Discovers installed applications via XDG .desktop files."""
 
-    def __init__(self):
+    def __init__(self, index_file: Path | None = None, workers: int | None = None):
         self._apps: list[AppEntry] | None = None
+        # Persistent parsed-.desktop index; defaults to the user cache dir
+        self._index_file = index_file
+        # Parser pool size; None reads the app_discovery_workers setting
+        self._workers = workers
+        # Background loading: partial results published while parsing
+        self._load_lock = threading.Lock()
+        self._load_thread: threading.Thread | None = None
+        self._partial: list[AppEntry] | None = None
+        self._progress_listeners: list = []
+        # Per-directory state kept for incremental updates from the watcher
+        self._desktop_index: dict[str, dict] | None = None
+        self._icon_dir_files: dict[str, dict[str, str]] = {}
+        self._icon_dir_mtimes: dict[str, int] = {}
+        self._icon_index_stats: dict = {}
+        # Candidate icon directories in lookup order, as of the last index build
+        self._icon_dir_keys: list[str] = []
+        # Watcher state; only touched on the GUI thread
+        self._watcher = None
+        self._watch_bridge: _WatchBridge | None = None
+        self._watched_paths: set[str] = set()
+        self._missing_dirs: set[str] = set()
+        # Directories changed on disk, rescanned by the background loader
+        self._pending_changes: set[str] = set()
+        # Typed-ahead score cache over the current app list
+        self._search_session = None
         # icon_name → resolved absolute path; built once in a background thread
         self._icon_path_index: dict[str, str] = {}
-        # cache_key → QPixmap; eliminates repeated disk I/O on every keystroke
-        self._pixmap_cache: dict[str, QPixmap] = {}
+        # Resolved pixmaps and recent failed lookups; created on first use
+        self._pixmap_cache: _PixmapCache | None = None
+        # QIcon is GUI-thread only: read the theme here, not in the index thread.
+        self._icon_theme = "hicolor" if IS_WINDOWS else self._active_icon_theme()
         if not IS_WINDOWS:
-            threading.Thread(target=self._build_icon_index, daemon=True, name="icon-index").start()
+            threading.Thread(
+                target=self._build_icon_index,
+                args=(self._icon_theme,),
+                daemon=True,
+                name="icon-index",
+            ).start()
 
     # ------------------------------------------------------------------
     # Loading
     # ------------------------------------------------------------------
 
-    def load(self) -> None:
-        """Populate the internal cache; dispatches to the platform loader."""
+    def load(self, progress=None) -> None:
+        """Populate the internal cache; dispatches to the platform loader.
+
+        Args:
+            progress: Optional callable receiving partial, sorted app lists
+                while files are still being parsed.  Called on the loading
+                thread.
+        """
         if IS_WINDOWS:
             self._load_windows()
         else:
-            self._load_linux()
+            self._load_linux(progress)
+
+    def load_in_background(self) -> None:
+        """Start loading on a worker thread unless loaded or already loading.
+
+        While it runs, :meth:`get_all` returns the apps parsed so far and
+        progress listeners are notified after every chunk and at the end.
+        """
+        with self._load_lock:
+            if self._apps is not None or self._load_thread is not None:
+                return
+            self._load_thread = threading.Thread(
+                target=self._background_load, daemon=True, name="app-discovery"
+            )
+            self._load_thread.start()
+
+    def add_progress_listener(self, callback) -> None:
+        """Call *callback()* (from the loading thread) whenever more apps are available."""
+        self._progress_listeners.append(callback)
+
+    @property
+    def is_loading(self) -> bool:
+        """True while a background load is running."""
+        return self._load_thread is not None
+
+    def _background_load(self) -> None:
+        try:
+            self.load(progress=self._publish_partial)
+        except Exception:
+            logger.exception("Background application scan failed")
+        self._partial = None
+        self._drain_dir_changes()
+        self._notify_progress()
+
+    def _background_refresh(self) -> None:
+        if self._drain_dir_changes():
+            self._notify_progress()
+
+    def _drain_dir_changes(self) -> bool:
+        """Apply queued directory changes until none are left, then free the loader.
+
+        Returns True if the app list or icon index changed.
+        """
+        updated = False
+        while True:
+            with self._load_lock:
+                paths, self._pending_changes = self._pending_changes, set()
+                if not paths:
+                    self._load_thread = None
+                    break
+            try:
+                updated |= self._apply_dir_changes(paths)
+            except Exception:
+                logger.exception("Rescanning %s failed", ", ".join(sorted(paths)))
+        # New .desktop files and directories need watching.
+        self._request_watch_sync()
+        return updated
+
+    def _publish_partial(self, apps: list[AppEntry]) -> None:
+        self._partial = apps
+        self._notify_progress()
+
+    def _notify_progress(self) -> None:
+        for callback in list(self._progress_listeners):
+            try:
+                callback()
+            except Exception:
+                logger.debug("App discovery progress listener failed", exc_info=True)
+
+    # ------------------------------------------------------------------
+    # Live updates
+    # ------------------------------------------------------------------
+
+    def watch_for_changes(self) -> None:
+        """Watch the XDG application and icon directories for changes.
+
+        Must be called from the GUI thread.  Indexed ``.desktop`` files are
+        watched too, so edits made in place are noticed, and directories
+        that do not exist yet are covered by a watch on their nearest
+        existing ancestor.  Changes are rescanned on the background loader:
+        a changed applications directory is rescanned on its own — only new
+        or modified files are parsed — and the app list is rebuilt from the
+        in-memory index; a changed icon directory is relisted and merged
+        into the icon index.  Progress listeners are notified after each
+        update.  No-op on Windows and when already watching.
+        """
+        if IS_WINDOWS or self._watcher is not None:
+            return
+        from core.file_watcher import DebouncedFileWatcher
+
+        self._watcher = DebouncedFileWatcher(self._on_dirs_changed, delay_ms=500)
+        if self._watch_bridge is None:
+            self._watch_bridge = _WatchBridge()
+            self._watch_bridge.sync_requested.connect(
+                self._on_watch_sync_requested, Qt.ConnectionType.QueuedConnection
+            )
+        self._sync_watches()
+        logger.debug("AppDiscovery: watching %d paths for changes", len(self._watched_paths))
+
+    def stop_watching(self) -> None:
+        """Stop watching for application and icon changes."""
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
+        self._watched_paths.clear()
+        self._missing_dirs.clear()
+
+    def _sync_watches(self) -> set[str]:
+        """Watch every known directory and indexed ``.desktop`` file (GUI thread).
+
+        A missing directory is covered by a watch on its nearest existing
+        ancestor so its creation is noticed.  Returns the directories that
+        were missing on an earlier call and exist now.
+        """
+        watcher = self._watcher
+        if watcher is None:
+            return set()
+        appeared: set[str] = set()
+        for key in [*map(str, self._desktop_dirs()), *self._icon_dir_keys]:
+            if key in self._watched_paths:
+                continue
+            if watcher.watch_directory(key):
+                self._watched_paths.add(key)
+                if key in self._missing_dirs:
+                    self._missing_dirs.discard(key)
+                    appeared.add(key)
+                continue
+            self._missing_dirs.add(key)
+            ancestor = os.path.dirname(key)
+            while not os.path.isdir(ancestor) and os.path.dirname(ancestor) != ancestor:
+                ancestor = os.path.dirname(ancestor)
+            if ancestor not in self._watched_paths and watcher.watch_directory(ancestor):
+                self._watched_paths.add(ancestor)
+        new_files = [
+            path
+            for key, directory in (self._desktop_index or {}).items()
+            for path in (os.path.join(key, name) for name in directory["files"])
+            if path not in self._watched_paths
+        ]
+        if new_files:
+            watcher.watch_files(new_files)
+            self._watched_paths.update(new_files)
+        return appeared
+
+    def _request_watch_sync(self) -> None:
+        """Ask the GUI thread to run :meth:`_sync_watches` (any thread)."""
+        bridge = getattr(self, "_watch_bridge", None)
+        if bridge is not None:
+            bridge.sync_requested.emit()
+
+    def _on_watch_sync_requested(self) -> None:
+        appeared = self._sync_watches()
+        if appeared:
+            self._on_dirs_changed(appeared)
+
+    def _on_dirs_changed(self, paths: set[str]) -> None:
+        """Queue the changed *paths* for the background loader (GUI thread)."""
+        # A .desktop file edited in place: rescan the directory it lives in.
+        changed = {os.path.dirname(p) if p.endswith(".desktop") else p for p in paths}
+        changed |= self._sync_watches()
+        # Ancestors of missing directories only matter for _sync_watches().
+        changed &= {*map(str, self._desktop_dirs()), *self._icon_dir_keys}
+        if not changed:
+            return
+        with self._load_lock:
+            if self._apps is None and self._load_thread is None:
+                return  # not loaded yet — the first load will see it
+            self._pending_changes |= changed
+            if self._load_thread is not None:
+                return  # applied once the running load or rescan finishes
+            self._load_thread = threading.Thread(
+                target=self._background_refresh, daemon=True, name="app-discovery-refresh"
+            )
+            self._load_thread.start()
+
+    def _apply_dir_changes(self, paths: set[str]) -> bool:
+        """Rescan the changed directories in *paths*; returns True if anything changed."""
+        desktop_dirs = {str(d) for d in self._desktop_dirs()}
+        icon_dirs = set(self._icon_dir_keys)
+        changed_desktop = [p for p in paths if p in desktop_dirs]
+        changed_icons = [p for p in paths if p in icon_dirs]
+        updated = False
+        if changed_desktop:
+            updated |= self._refresh_desktop_dirs(changed_desktop)
+        if changed_icons:
+            updated |= self._refresh_icon_dirs(changed_icons)
+        return updated
+
+    def _refresh_desktop_dirs(self, changed: list[str]) -> bool:
+        """Rescan the *changed* applications directories; returns True if apps changed."""
+        index = self._desktop_index
+        if index is None or self._apps is None:
+            return False  # not loaded yet (or loading) — the load will see it
+
+        updated = dict(index)
+        stale: list = []
+        for key in changed:
+            directory = Path(key)
+            try:
+                dir_mtime_ns = directory.stat().st_mtime_ns
+            except OSError:
+                updated.pop(key, None)
+                continue
+            cached = (index.get(key) or {}).get("files") or {}
+            files = self._scan_desktop_dir(directory, cached, stale)
+            updated[key] = {"mtime_ns": dir_mtime_ns, "files": files}
+        self._parse_stale(stale)
+
+        # Keep XDG precedence order for first-wins de-duplication.
+        new_index = {str(d): updated[str(d)] for d in self._desktop_dirs() if str(d) in updated}
+        if new_index == index:
+            return False
+        self._save_desktop_index(new_index)
+        old_apps = self._apps
+        apps = self._collect_apps(new_index)
+        self._desktop_index = new_index
+        self._apps = apps
+        logger.info(
+            "AppDiscovery: applications changed — %d before, %d now (%d files parsed)",
+            len(old_apps),
+            len(apps),
+            len(stale),
+        )
+        return apps != old_apps
+
+    def _refresh_icon_dirs(self, changed: list[str]) -> bool:
+        """Relist the *changed* icon directories; returns True if the icon index changed."""
+        if not self._icon_path_index:
+            return False  # index still building
+        dir_files = dict(self._icon_dir_files)
+        for key in changed:
+            try:
+                st = os.stat(key)
+            except OSError:
+                dir_files.pop(key, None)
+                self._icon_dir_mtimes.pop(key, None)
+                continue
+            self._icon_dir_mtimes[key] = st.st_mtime_ns
+            dir_files[key] = self._list_icon_dir(Path(key))
+        # Keep lookup-priority order, including directories that just appeared.
+        self._icon_dir_files = {k: dir_files[k] for k in self._icon_dir_keys if k in dir_files}
+        old_index = self._icon_path_index
+        index = self._merge_icon_dirs()
+        if index == old_index:
+            return False
+        names = {n for n in index.keys() | old_index.keys() if index.get(n) != old_index.get(n)}
+        # Drop cached pixmaps and failed lookups for icons that moved,
+        # appeared or disappeared so they resolve again on next use.
+        self._pixmaps().discard_names(names)
+        self._icon_path_index = index
+        self._save_icon_index()
+        logger.info("AppDiscovery: %d icons changed", len(names))
+        return True
 
     # ------------------------------------------------------------------
     # Platform loaders
     # ------------------------------------------------------------------
 
-    def _load_linux(self) -> None:
-        """Scan XDG application directories (.desktop files)."""
+    @staticmethod
+    def _desktop_dirs() -> list[Path]:
+        """Return the XDG ``applications`` directories in precedence order."""
         search_dirs = []
 
         xdg_data_home = os.environ.get("XDG_DATA_HOME", str(Path.home() / ".local" / "share"))
@@ -131,22 +669,205 @@ class AppDiscovery:
         for d in xdg_data_dirs.split(":"):
             if d.strip():
                 search_dirs.append(Path(d.strip()) / "applications")
+        return search_dirs
 
-        apps: list[AppEntry] = []
-        seen_names: set = set()
-
+    def _load_linux(self, progress=None) -> None:
+        """Scan XDG application directories (.desktop files)."""
+        search_dirs = self._desktop_dirs()
+        index = self._load_desktop_index()
+        new_index: dict[str, dict] = {}
+        stale: list[tuple[dict, str, Path, os.stat_result]] = []
         for directory in search_dirs:
+            try:
+                dir_mtime_ns = directory.stat().st_mtime_ns
+            except OSError:
+                continue
             if not directory.is_dir():
                 continue
-            for desktop_file in sorted(directory.glob("*.desktop")):
-                entry = self._parse_desktop_file(desktop_file)
-                if entry is not None and entry.name not in seen_names:
-                    seen_names.add(entry.name)
-                    apps.append(entry)
+            key = str(directory)
+            cached = index.get(key)
+            cached_files = cached.get("files") if isinstance(cached, dict) else None
+            if not isinstance(cached_files, dict):
+                cached_files = {}
+            # Compare every file: in-place edits leave the directory mtime alone.
+            files = self._scan_desktop_dir(directory, cached_files, stale)
+            new_index[key] = {"mtime_ns": dir_mtime_ns, "files": files}
 
-        apps.sort(key=lambda a: a.name.lower())
+        publish = None
+        if progress is not None and stale:
+
+            def publish():
+                progress(self._collect_apps(new_index))
+
+            publish()  # entries from the index are available straight away
+        self._parse_stale(stale, publish)
+
+        if new_index != index:
+            self._save_desktop_index(new_index)
+
+        apps = self._collect_apps(new_index)
+        self._desktop_index = new_index
         self._apps = apps
-        logger.info("AppDiscovery (Linux): loaded %d applications", len(apps))
+        logger.info(
+            "AppDiscovery (Linux): loaded %d applications (%d .desktop files parsed)",
+            len(apps),
+            len(stale),
+        )
+
+    @staticmethod
+    def _collect_apps(dirs: dict[str, dict]) -> list[AppEntry]:
+        """Build the sorted app list from indexed directories.
+
+        *dirs* is in ``XDG_DATA_HOME``, ``XDG_DATA_DIRS`` order and the first
+        entry with a given name wins.  Files still waiting to be parsed
+        (``None`` records) are skipped.
+        """
+        apps: list[AppEntry] = []
+        seen_names: set = set()
+        for directory in dirs.values():
+            for record in directory["files"].values():
+                entry = record.get("entry") if isinstance(record, dict) else None
+                if entry is None or entry.get("name") in seen_names:
+                    continue
+                try:
+                    app = AppEntry(**entry)
+                except TypeError:
+                    continue
+                seen_names.add(app.name)
+                apps.append(app)
+        apps.sort(key=lambda a: a.name.lower())
+        return apps
+
+    def _scan_desktop_dir(self, directory: Path, cached: dict[str, dict], stale: list) -> dict:
+        """Index *directory*'s .desktop files, reusing unchanged *cached* records.
+
+        Returns a dict mapping file name (sorted) to ``{"mtime_ns", "size",
+        "entry"}`` where ``entry`` is the :class:`AppEntry` as a dict, or
+        ``None`` for hidden/invalid files.  New or changed files get a
+        ``None`` placeholder and are appended to *stale* as
+        ``(files, name, path, stat)`` for :meth:`_parse_stale`.
+        """
+        files: dict[str, dict | None] = {}
+        for desktop_file in sorted(directory.glob("*.desktop")):
+            try:
+                st = desktop_file.stat()
+            except OSError:
+                continue
+            record = cached.get(desktop_file.name)
+            if (
+                not isinstance(record, dict)
+                or record.get("mtime_ns") != st.st_mtime_ns
+                or record.get("size") != st.st_size
+            ):
+                record = None
+                stale.append((files, desktop_file.name, desktop_file, st))
+            files[desktop_file.name] = record
+        return files
+
+    def _parse_record(self, path: Path, st: os.stat_result) -> dict:
+        entry = self._parse_desktop_file(path)
+        return {
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+            "entry": dataclasses.asdict(entry) if entry is not None else None,
+        }
+
+    def _parse_stale(self, stale: list, on_chunk=None) -> None:
+        """Parse every file in *stale* and fill in its placeholder record.
+
+        Runs on a thread pool when there are enough files and the
+        ``app_discovery_workers`` setting allows more than one worker.
+        Records are stored by the loading thread only; *on_chunk* is called
+        after each chunk so callers can publish partial results.
+        """
+        workers = self._worker_count()
+        chunks = [stale[i : i + _PARSE_CHUNK] for i in range(0, len(stale), _PARSE_CHUNK)]
+
+        def parse_chunk(chunk):
+            return [self._parse_record(path, st) for _files, _name, path, st in chunk]
+
+        def store(chunk, records):
+            for (files, name, _path, _st), record in zip(chunk, records, strict=True):
+                files[name] = record
+            if on_chunk is not None:
+                on_chunk()
+
+        if workers <= 1 or len(stale) < _PARALLEL_MIN_FILES:
+            for chunk in chunks:
+                store(chunk, parse_chunk(chunk))
+            return
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="desktop-parse") as pool:
+            futures = {pool.submit(parse_chunk, chunk): chunk for chunk in chunks}
+            for future in as_completed(futures):
+                store(futures[future], future.result())
+
+    def _worker_count(self) -> int:
+        if self._workers is not None:
+            return self._workers
+        try:
+            return int(config_manager.get_settings().get("app_discovery_workers", 4))
+        except (TypeError, ValueError, AttributeError):
+            return 1
+
+    def _cache_path(self, name: str) -> Path | None:
+        """Return the path of cache file *name* (next to ``index_file`` if given)."""
+        if self._index_file is not None:
+            return self._index_file.with_name(name)
+        cache_dir = getattr(config_manager, "cache_dir", None)
+        return cache_dir / name if cache_dir is not None else None
+
+    def _desktop_index_path(self) -> Path | None:
+        if self._index_file is not None:
+            return self._index_file
+        return self._cache_path("desktop_index.json")
+
+    @staticmethod
+    def _read_cache(path: Path | None, version: int) -> dict | None:
+        """Return the JSON object at *path* if it has *version*, else ``None``."""
+        if path is None:
+            return None
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            logger.debug("Ignoring unreadable cache file %s: %s", path, exc)
+            return None
+        if not isinstance(data, dict) or data.get("version") != version:
+            return None
+        return data
+
+    @staticmethod
+    def _write_cache(path: Path | None, data: dict) -> None:
+        """Atomically write *data* as JSON to *path*; failures are logged only."""
+        if path is None:
+            return
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as exc:
+            logger.debug("Could not write cache file %s: %s", path, exc)
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
+    def _load_desktop_index(self) -> dict[str, dict]:
+        """Return the persisted per-directory index, or ``{}`` if missing/stale."""
+        data = self._read_cache(self._desktop_index_path(), _DESKTOP_INDEX_VERSION) or {}
+        dirs = data.get("dirs")
+        return dirs if isinstance(dirs, dict) else {}
+
+    def _save_desktop_index(self, dirs: dict[str, dict]) -> None:
+        """Persist the per-directory index; failures are logged only."""
+        self._write_cache(
+            self._desktop_index_path(), {"version": _DESKTOP_INDEX_VERSION, "dirs": dirs}
+        )
 
     def _load_windows(self) -> None:
         """Scan Windows Start Menu .lnk shortcuts from user and system locations."""
@@ -190,42 +911,30 @@ class AppDiscovery:
 
     def _parse_desktop_file(self, path: Path) -> AppEntry | None:
         """Parse a single .desktop file; returns None if the entry should be hidden."""
-        parser = configparser.RawConfigParser(strict=False)
-        parser.optionxform = str  # preserve case
         try:
-            parser.read(str(path), encoding="utf-8")
-        except Exception as exc:
+            values = _read_desktop_entry(path)
+        except (OSError, UnicodeDecodeError) as exc:
             logger.debug("Skipping %s: %s", path, exc)
             return None
-
-        section = "Desktop Entry"
-        if not parser.has_section(section):
+        if values is None:
             return None
 
-        def get(key, fallback=""):
-            return parser.get(section, key, fallback=fallback)
-
-        def getbool(key, fallback=False):
-            try:
-                return parser.getboolean(section, key, fallback=fallback)
-            except Exception:
-                return fallback
+        def getbool(key):
+            return values.get(key, "").lower() in _TRUE_VALUES
 
-        if get("Type") != "Application":
+        if values.get("Type") != "Application":
             return None
         if getbool("NoDisplay"):
             return None
         if getbool("Hidden"):
             return None
 
-        name = get("Name")
-        exec_cmd = get("Exec")
+        name = values.get("Name", "")
+        exec_cmd = values.get("Exec", "")
         if not name or not exec_cmd:
             return None
 
-        icon_name = get("Icon")
-        terminal = getbool("Terminal")
-        raw_categories = get("Categories")
+        raw_categories = values.get("Categories", "")
         categories = (
             [c.strip() for c in raw_categories.split(";") if c.strip()] if raw_categories else []
         )
@@ -233,9 +942,9 @@ class AppDiscovery:
         return AppEntry(
             name=name,
             exec_cmd=exec_cmd,
-            icon_name=icon_name,
+            icon_name=values.get("Icon", ""),
             categories=categories,
-            terminal=terminal,
+            terminal=getbool("Terminal"),
         )
 
     # ------------------------------------------------------------------
@@ -243,29 +952,30 @@ class AppDiscovery:
     # ------------------------------------------------------------------
 
     def get_all(self) -> list[AppEntry]:
-        """Return all discovered apps, loading on first call."""
+        """Return all discovered apps, loading on first call.
+
+        During a :meth:`load_in_background` run this returns the apps parsed
+        so far instead of blocking.
+        """
         if self._apps is None:
+            if self._load_thread is not None:
+                return self._partial or []
             self.load()
         return self._apps
 
-    def search(self, query: str) -> list[AppEntry]:
-        """Return apps matching *query*, scored and sorted by relevance.
+    def search(self, query: str, limit: int | None = None) -> list[AppEntry]:
+        """Return apps matching *query*, ranked by fuzzy score and launch frecency.
 
-        When *query* is blank all apps are returned alphabetically.
+        When *query* is blank all apps are returned, most frecent first and
+        otherwise alphabetically.  *limit* caps the number of matches for a
+        non-blank query.  Scores of recent queries are cached until the app
+        list is reloaded.
         """
         apps = self.get_all()
-        if not query.strip():
-            return apps
-
-        q = query.strip()
-        scored = []
-        for app in apps:
-            text = f"{app.name} {app.categories_str}"
-            s = _score(q, text)
-            if s > 30 or q.lower() in app.name.lower():
-                scored.append((s, app))
-        scored.sort(key=lambda x: x[0], reverse=True)
-        return [app for _s, app in scored]
+        session = self._search_session
+        if session is None or session.items is not apps:
+            session = self._search_session = app_session(apps)
+        return session.search(query, limit=limit)
 
     # ------------------------------------------------------------------
     # Icon resolution
@@ -274,25 +984,77 @@ class AppDiscovery:
     def resolve_icon_pixmap(self, icon_name: str, size: int = 32) -> QPixmap:
         """Return a QPixmap for *icon_name*, using a per-instance cache.
 
-        Only *successful* resolutions are cached.  Fallbacks are never stored
-        so that if the background icon index is still building on first open,
-        the next repopulation (triggered by the debounce timer) will retry and
-        find the real icon once the index is ready.
+        Resolved pixmaps are kept in an LRU bounded by the
+        ``app_icon_cache_mb`` setting.  A failed lookup returns the generic
+        fallback and is remembered for a few seconds, so a missing icon is
+        not searched for again on every keystroke.  Failed lookups are
+        forgotten when the background icon index finishes building and when
+        a watched icon directory changes.
         """
         if not icon_name:
             return self._fallback_pixmap(size)
 
+        cache = self._pixmaps()
         cache_key = f"{icon_name}\x00{size}"
-        cached = self._pixmap_cache.get(cache_key)
+        cached = cache.get(cache_key)
         if cached is not None:
             return cached
+        if cache.is_missing(cache_key):
+            return self._fallback_pixmap(size)
 
         px = self._find_pixmap(icon_name, size)
         if px is not None:
-            self._pixmap_cache[cache_key] = px
+            cache.put(cache_key, px)
             return px
+        cache.put_missing(cache_key)
         return self._fallback_pixmap(size)
 
+    def icon_source(self, icon_name: str) -> str | None:
+        """Return the image file *icon_name* resolves to, or ``None``.
+
+        Only consults the filesystem and the background icon index, never
+        ``QIcon``/``QPixmap``, so it is safe to call from any thread (see
+        :mod:`core.icon_loader`).  Icons only Qt's theme resolver knows about
+        still need :meth:`resolve_icon_pixmap` on the GUI thread.
+        """
+        if not icon_name or IS_WINDOWS:
+            return None
+        if os.path.isabs(icon_name):
+            return icon_name if os.path.isfile(icon_name) else None
+        return self._icon_path_index.get(icon_name)
+
+    def cached_icon_pixmap(self, icon_name: str, size: int = 32) -> QPixmap | None:
+        """Return the cached pixmap for *icon_name* without resolving it.
+
+        Returns the generic fallback for a recently failed lookup and
+        ``None`` when the icon has not been resolved yet.
+        """
+        cache = self._pixmaps()
+        cache_key = f"{icon_name}\x00{size}"
+        cached = cache.get(cache_key)
+        if cached is None and cache.is_missing(cache_key):
+            return self._fallback_pixmap(size)
+        return cached
+
+    def store_icon_pixmap(self, icon_name: str, size: int, pixmap: QPixmap) -> None:
+        """Cache *pixmap* as the resolved icon for *icon_name* at *size*."""
+        self._pixmaps().put(f"{icon_name}\x00{size}", pixmap)
+
+    @property
+    def pixmap_cache_stats(self) -> dict:
+        """Hit/miss/eviction counters and size of the icon pixmap cache."""
+        return self._pixmaps().stats()
+
+    def _pixmaps(self) -> _PixmapCache:
+        cache = getattr(self, "_pixmap_cache", None)
+        if cache is None:
+            try:
+                mb = int(config_manager.get_settings().get("app_icon_cache_mb", _PIXMAP_CACHE_MB))
+            except (TypeError, ValueError, AttributeError):
+                mb = _PIXMAP_CACHE_MB
+            cache = self._pixmap_cache = _PixmapCache(max(mb, 1) * 1024 * 1024)
+        return cache
+
     def _find_pixmap(self, icon_name: str, size: int) -> QPixmap | None:
         """Return a QPixmap for *icon_name*, or ``None`` if not found.
 
@@ -352,59 +1114,194 @@ class AppDiscovery:
             )
         return px
 
-    def _build_icon_index(self) -> None:
-        """Scan XDG icon directories once and populate *_icon_path_index*.
-
-        Runs in a background daemon thread started at module import so the
-        index is likely complete before the user first opens the Apps tab.
-        Uses first-wins strategy: hicolor at preferred sizes is scanned first
-        so higher-quality icons take priority over lower-resolution variants.
-        """
-        index: dict[str, str] = {}
-
+    @staticmethod
+    def _icon_bases() -> list[Path]:
+        """Return the XDG icon base directories in lookup order."""
         xdg_data_home = os.environ.get("XDG_DATA_HOME", str(Path.home() / ".local" / "share"))
         xdg_data_dirs = os.environ.get("XDG_DATA_DIRS", "/usr/local/share:/usr/share")
-        all_icon_bases = [Path(xdg_data_home) / "icons"] + [
+        return [Path.home() / ".icons", Path(xdg_data_home) / "icons"] + [
             Path(d.strip()) / "icons" for d in xdg_data_dirs.split(":") if d.strip()
         ]
 
-        def _index_dir(directory: Path) -> None:
-            try:
-                for f in directory.iterdir():
-                    if f.is_file() and f.suffix in _ICON_EXTS:
-                        index.setdefault(f.stem, str(f))
-            except OSError:
-                pass
+    @staticmethod
+    def _active_icon_theme() -> str:
+        """Return the icon theme Qt uses, falling back to ``hicolor``.
 
-        # Pass 1 — hicolor at preferred sizes (first-wins → best quality wins)
-        for base in all_icon_bases:
-            hicolor = base / "hicolor"
-            for size_name in _PREFERRED_SIZES:
-                for category in ("apps", "applications", ""):
-                    d = hicolor / size_name / category if category else hicolor / size_name
-                    _index_dir(d)
-
-        # Pass 2 — remaining installed themes at preferred sizes
-        for base in all_icon_bases:
-            if not base.is_dir():
+        Calls into ``QIcon``, so only call it from the GUI thread.
+        """
+        try:
+            name = QIcon.themeName()
+        except Exception:  # noqa: BLE001 — no QApplication yet
+            name = ""
+        return name if isinstance(name, str) and name else "hicolor"
+
+    @staticmethod
+    def _icon_theme_chain(bases: list[Path], theme: str) -> list[tuple[str, list | None]]:
+        """Return ``[(theme, subdirs)]`` for *theme* and its ``Inherits=`` chain.
+
+        ``hicolor`` always comes last, as the icon theme spec requires.
+        ``subdirs`` lists the ``(subdir, keys)`` pairs from ``index.theme``,
+        or is ``None`` when the theme has no readable ``index.theme``.
+        """
+        chain: list[tuple[str, list | None]] = []
+        queue = [theme]
+        seen: set[str] = {"hicolor"}
+        while queue:
+            theme = queue.pop(0)
+            if theme in seen:
+                continue
+            seen.add(theme)
+            info = _find_index_theme(bases, theme)
+            chain.append((theme, info[1] if info else None))
+            if info:
+                queue.extend(info[0])
+        info = _find_index_theme(bases, "hicolor")
+        chain.append(("hicolor", info[1] if info else None))
+        return chain
+
+    def _icon_dirs(self, theme: str | None = None) -> list[Path]:
+        """Return candidate app-icon directories in lookup-priority order.
+
+        Walks the inheritance chain of *theme* (default: the theme captured
+        at construction), ending in ``hicolor``.
+        Within a theme, the application directories listed in ``index.theme``
+        are ordered by their ``Size=``/``Type=`` metadata — 48 px first, then
+        32, 64, scalable, 24, 22, 16 and others by distance from 48 — and
+        each is looked up in every icon base directory.  Themes without an
+        ``index.theme`` fall back to the conventional ``<size>/apps`` layout.
+        ``/usr/share/pixmaps`` (catch-all for older packages) comes last.
+        """
+        bases = self._icon_bases()
+        dirs: list[Path] = []
+        chain = self._icon_theme_chain(bases, theme or self._icon_theme)
+        for theme, subdirs in chain:
+            if subdirs is None:
+                names = [
+                    f"{size_name}/{category}" if category else size_name
+                    for size_name in _PREFERRED_SIZES
+                    for category in ("apps", "applications", "")
+                ]
+            else:
+                app_dirs = [(d, keys) for d, keys in subdirs if _is_app_icon_dir(d, keys)]
+                app_dirs.sort(key=lambda entry: _icon_dir_rank(entry[1]))
+                names = [d for d, _keys in app_dirs]
+            for name in names:
+                dirs.extend(base / theme / name for base in bases)
+        dirs.append(_PIXMAPS_DIR)
+        return dirs
+
+    @staticmethod
+    def _list_icon_dir(directory: Path) -> dict[str, str]:
+        """Return ``{icon name: path}`` for the icon files directly in *directory*."""
+        icons: dict[str, str] = {}
+        try:
+            for f in directory.iterdir():
+                if f.is_file() and f.suffix in _ICON_EXTS:
+                    icons.setdefault(f.stem, str(f))
+        except OSError:
+            pass
+        return icons
+
+    def _merge_icon_dirs(self) -> dict[str, str]:
+        """Merge the per-directory listings, first directory wins."""
+        index: dict[str, str] = {}
+        for icons in self._icon_dir_files.values():
+            for name, path in icons.items():
+                index.setdefault(name, path)
+        return index
+
+    @property
+    def icon_index_stats(self) -> dict:
+        """Timing and size of the last icon index build.
+
+        Keys: ``seconds``, ``theme`` (active theme), ``dirs`` (existing
+        candidate directories), ``dirs_listed`` (directories read from disk
+        rather than the persisted index) and ``icons``.  Empty until the
+        first build has finished.
+        """
+        return dict(self._icon_index_stats)
+
+    def _build_icon_index(self, theme: str | None = None) -> None:
+        """Build *_icon_path_index* from the persisted index and changed directories.
+
+        Runs in a background daemon thread started with the instance, for
+        the icon *theme* read on the constructing (GUI) thread.  Each
+        candidate directory whose mtime matches ``icon_index.json`` reuses the
+        stored listing; only new or changed directories are listed again.
+        Per-directory listings are kept so a watched directory change only
+        relists that directory (see :meth:`watch_for_changes`).
+        """
+        started = time.perf_counter()
+        theme = theme or self._icon_theme
+        cached = self._read_cache(self._icon_index_path(), _ICON_INDEX_VERSION) or {}
+        cached_dirs = cached.get("dirs") if isinstance(cached.get("dirs"), dict) else {}
+
+        dir_files: dict[str, dict[str, str]] = {}
+        mtimes: dict[str, int] = {}
+        candidates: dict[str, None] = {}
+        listed = 0
+        for directory in self._icon_dirs(theme):
+            key = str(directory)
+            if key in candidates:
                 continue
+            candidates[key] = None
             try:
-                for theme in sorted(base.iterdir()):
-                    if not theme.is_dir() or theme.name == "hicolor":
-                        continue
-                    for size_name in _PREFERRED_SIZES:
-                        for category in ("apps", "applications", ""):
-                            d = theme / size_name / category if category else theme / size_name
-                            _index_dir(d)
+                st = directory.stat()
             except OSError:
-                pass
-
-        # Pass 3 — /usr/share/pixmaps (catch-all for older packages)
-        _index_dir(Path("/usr/share/pixmaps"))
+                continue
+            if not stat.S_ISDIR(st.st_mode):
+                continue
+            entry = cached_dirs.get(key)
+            if (
+                isinstance(entry, dict)
+                and entry.get("mtime_ns") == st.st_mtime_ns
+                and isinstance(entry.get("icons"), dict)
+            ):
+                icons = entry["icons"]
+            else:
+                icons = self._list_icon_dir(directory)
+                listed += 1
+            dir_files[key] = icons
+            mtimes[key] = st.st_mtime_ns
+
+        self._icon_dir_keys = list(candidates)
+        self._icon_dir_files = dir_files
+        self._icon_dir_mtimes = mtimes
+        index = self._merge_icon_dirs()
+        if listed or len(dir_files) != len(cached_dirs):
+            self._save_icon_index()
 
         # Atomic replacement so readers always see a complete dict
         self._icon_path_index = index
-        logger.info("AppDiscovery: icon index built — %d icons indexed", len(index))
+        self._request_watch_sync()
+        cache = getattr(self, "_pixmap_cache", None)
+        if cache is not None:
+            cache.clear_missing()
+        elapsed = time.perf_counter() - started
+        self._icon_index_stats = {
+            "seconds": elapsed,
+            "theme": theme,
+            "dirs": len(dir_files),
+            "dirs_listed": listed,
+            "icons": len(index),
+        }
+        logger.info(
+            "AppDiscovery: icon index built in %.0f ms — %d icons from %d dirs (%d listed)",
+            elapsed * 1000,
+            len(index),
+            len(dir_files),
+            listed,
+        )
+
+    def _icon_index_path(self) -> Path | None:
+        return self._cache_path("icon_index.json")
+
+    def _save_icon_index(self) -> None:
+        dirs = {
+            key: {"mtime_ns": self._icon_dir_mtimes.get(key, 0), "icons": icons}
+            for key, icons in self._icon_dir_files.items()
+        }
+        self._write_cache(self._icon_index_path(), {"version": _ICON_INDEX_VERSION, "dirs": dirs})
 
     def _fallback_pixmap(self, size: int) -> QPixmap:
         """Return a generic application pixmap."""
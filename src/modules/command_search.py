@@ -3,8 +3,10 @@
 """
 CommandSearch — fuzzy command search dialog.
 
-Uses ``rapidfuzz.fuzz.WRatio`` for scoring.  Falls back to exact
-substring search with a log warning when rapidfuzz is unavailable.
+Results are ranked by :mod:`core.ranking`: the ``rapidfuzz.fuzz.WRatio``
+score blended with launch frecency.  Falls back to exact substring search
+when rapidfuzz is unavailable.  Non-empty queries are ranked on a
+:class:`core.search_worker.SearchWorker` thread so typing stays responsive.
 
 Keyboard navigation:
   • Arrow keys move selection in the results tree
@@ -27,22 +29,10 @@ from PyQt6.QtWidgets import (
     QVBoxLayout,
 )
 
-logger = logging.getLogger(__name__)
-
-try:
-    from rapidfuzz import fuzz as _fuzz
-
-    _FUZZY_AVAILABLE = True
-except ImportError:
-    _FUZZY_AVAILABLE = False
-    logger.warning("rapidfuzz not available; falling back to substring search in CommandSearch")
+from core.ranking import command_session
+from core.search_worker import SearchWorker
 
-
-def _score(query: str, text: str) -> float:
-    """Return a match score 0–100 for *query* against *text*."""
-    if _FUZZY_AVAILABLE:
-        return _fuzz.WRatio(query, text)
-    return 100.0 if query.lower() in text.lower() else 0.0
+logger = logging.getLogger(__name__)
 
 
 class CommandSearch:
@@ -92,27 +82,30 @@ class CommandSearch:
         btn_row.addWidget(close_btn)
         layout.addLayout(btn_row)
 
-        all_commands = self.services.get_all_commands()
+        all_commands = self.services.get_command_index()
+
+        session = command_session(all_commands)
+        worker = SearchWorker(dialog)
 
         def _populate(query: str):
-            results_tree.clear()
-            if not query.strip():
-                scored = [(100, cmd) for cmd in all_commands]
+            if query.strip():
+                worker.submit(session.search, query)
             else:
-                scored = []
-                for cmd in all_commands:
-                    text = f"{cmd['group']} {cmd['label']}"
-                    s = _score(query, text)
-                    if s > 30 or query.lower() in text.lower():
-                        scored.append((s, cmd))
-                scored.sort(key=lambda x: x[0], reverse=True)
-
-            for _s, cmd in scored:
+                worker.cancel()
+                _show_results(session.search(query))
+
+        def _on_results(generation: int, results):
+            if worker.is_current(generation):
+                _show_results(results)
+
+        def _show_results(results):
+            results_tree.clear()
+            for cmd in results:
                 item = QTreeWidgetItem(
                     [
-                        cmd["label"],
-                        cmd["group"],
-                        cmd.get("command", ""),
+                        cmd.label,
+                        cmd.group,
+                        cmd.command,
                     ]
                 )
                 item.setData(0, Qt.ItemDataRole.UserRole, cmd)
@@ -144,6 +137,7 @@ class CommandSearch:
             dialog.accept()
 
         search_box.textChanged.connect(_populate)
+        worker.results_ready.connect(_on_results)
         results_tree.currentItemChanged.connect(lambda *_: _update_preview())
         results_tree.itemDoubleClicked.connect(lambda *_: _execute())
         execute_btn.clicked.connect(_execute)
@@ -178,3 +172,4 @@ class CommandSearch:
         search_box.setFocus()
         dialog.resize(640, 460)
         dialog.exec()
+        worker.stop()
@@ -4,10 +4,11 @@ import logging
 import os
 
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QAction, QCursor, QIcon
+from PyQt6.QtGui import QAction, QCursor
 from PyQt6.QtWidgets import QInputDialog, QMenu, QMessageBox
 
 from core.config_manager import config_manager
+from core.icon_cache import icon_cache
 
 logger = logging.getLogger(__name__)
 
@@ -41,14 +42,14 @@ class Favorites:
     def add_to_favorites(self):
         """Add a command to favorites by reference."""
         # Get all available commands
-        all_commands = self.services.get_all_commands()
+        all_commands = self.services.get_command_index()
 
         if not all_commands:
             QMessageBox.warning(None, "No Commands", "No commands available to add to favorites.")
             return
 
         # Create a list of command options
-        command_options = [f"{cmd['group']} → {cmd['label']}" for cmd in all_commands]
+        command_options = [f"{cmd.group} → {cmd.label}" for cmd in all_commands]
 
         # Let user select a command
         selection, ok = QInputDialog.getItem(
@@ -65,10 +66,10 @@ class Favorites:
             index = command_options.index(selection)
             command_data = all_commands[index]
 
-            command_path = _build_command_path(command_data["group"], command_data["label"])
+            command_path = command_data.path
 
             # Get a label for the favorite
-            default_label = command_data["label"]
+            default_label = command_data.label
             label, ok = QInputDialog.getText(
                 None,
                 "Favorite Label",
@@ -172,7 +173,7 @@ class Favorites:
                             config_manager.get_base_dir(), "resources/icons/icon.png"
                         )
 
-                    action = QAction(QIcon(icon_path), label, menu)
+                    action = QAction(icon_cache.icon(icon_path), label, menu)
 
                     command = resolved_item.get("command")
                     show_output = resolved_item.get("showOutput", False)
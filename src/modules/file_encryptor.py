@@ -1,13 +1,63 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+"""
+File and folder encryption for the tray menu.
+
+Files are encrypted with a key derived from the user's password
+(PBKDF2-HMAC-SHA256).  The current on-disk format (version 2) streams the
+file through fixed-size AES-256-GCM chunks, so memory use is bounded by the
+chunk size regardless of file size::
+
+    header   magic "PTCLENC\\x02" | iterations u32 | salt[16] | file nonce[16] | chunk size u32
+    chunks   AES-GCM(chunk) + tag[16], repeated; the last one may be short
+
+Each file gets its own AES key, derived with HKDF from the password key and
+the file nonce.  Chunk *n* is sealed with the nonce ``n`` (11 bytes) plus a
+final-chunk flag byte, and the header is authenticated with every chunk, so
+reordered, truncated or extended files fail to decrypt.  The header carries
+the KDF parameters, so version 2 files do not need the ``.salt`` companion
+file (it is still written).  Files written before version 2 are single
+Fernet tokens keyed from the ``.salt`` file and still decrypt.
+
+Progress is weighted by file size and reported with throughput and an ETA.
+Folder operations process files on a bounded thread pool
+(``encryption_workers`` setting) with the password key derived once per run.
+They can be cancelled between chunks and record finished files in a
+``.encryption_journal`` (``JobJournal``), so an interrupted job resumes
+with the files it had left.
+
+Outputs are written to a ``.enc-partial`` sibling and renamed into place
+once complete and synced to disk; only then is the source removed.  The
+``encryption_sync_batch`` setting trades per-file fsyncs for one
+filesystem sync per batch of files.
+
+With the opt-in ``encryption_key_cache_minutes`` setting, derived keys are
+kept in memory (``key_cache``) for that long after the last use, so
+decrypting and re-encrypting the same files skips the 600 000-iteration KDF.
+"""
+
+import atexit
 import base64
+import ctypes
+import functools
+import hashlib
+import hmac
+import json
 import logging
 import os
 import struct
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 
+from cryptography.exceptions import InvalidTag
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from PyQt6.QtCore import QThread, pyqtSignal
 from PyQt6.QtWidgets import (
@@ -27,11 +77,752 @@ logger = logging.getLogger(__name__)
 
 SALT_FILE_SUFFIX = ".salt"
 ENC_FILE_SUFFIX = ".enc"
+FOLDER_SALT_FILE_NAME = ".encryption_salt"
+# Output being written, next to the plaintext path in both directions;
+# renamed to its final name once complete
+PARTIAL_FILE_SUFFIX = ".enc-partial"
+JOURNAL_FILE_NAME = ".encryption_journal"
 # OWASP Password Storage Cheat Sheet (2023): minimum 600 000 for PBKDF2-HMAC-SHA256.
 _PBKDF2_ITERATIONS = 600_000
 # Iteration count used by all files encrypted before this change.
 _LEGACY_ITERATIONS = 100_000
 
+# Version 2 streaming format (see module docstring)
+_STREAM_MAGIC = b"PTCLENC\x02"
+_STREAM_HEADER = struct.Struct(">8sI16s16sI")  # magic, iterations, salt, file nonce, chunk size
+_STREAM_CHUNK_SIZE = 1024 * 1024
+_STREAM_MAX_CHUNK_SIZE = 64 * 1024 * 1024
+# Iteration counts accepted from a file header.  The count is attacker
+# controlled and PBKDF2 cannot be cancelled, so cap it at a few seconds' work.
+_STREAM_MIN_ITERATIONS = _PBKDF2_ITERATIONS
+_STREAM_MAX_ITERATIONS = 5_000_000
+_GCM_TAG_SIZE = 16
+_HKDF_INFO = b"py-tray-command-launcher file encryption v2"
+# Default thread count for folder operations (encryption_workers setting)
+_DEFAULT_WORKERS = 4
+# Files queued per worker thread; bounds memory for very large folders
+_QUEUE_PER_WORKER = 4
+# Progress weight of one file on top of its size, so empty and tiny files
+# still move the bar (roughly the cost of opening, writing and removing one)
+_FILE_WEIGHT_BYTES = 64 * 1024
+# Minimum seconds between byte progress / throughput updates
+_RATE_INTERVAL = 0.5
+# Smoothing factor for the throughput moving average (0–1, higher = faster)
+_RATE_SMOOTHING = 0.3
+_JOURNAL_VERSION = 1
+# Files finished between filesystem syncs (encryption_sync_batch setting)
+_DEFAULT_SYNC_BATCH = 1
+
+
+class StreamFormatError(ValueError):
+    """Raised when a version 2 file is malformed or fails authentication."""
+
+
+class _Cancelled(Exception):
+    """Raised from a progress callback to abandon the file being processed."""
+
+
+def _is_stream_file(path: str) -> bool:
+    """Return True if *path* starts with the version 2 header magic."""
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(_STREAM_MAGIC)) == _STREAM_MAGIC
+    except OSError:
+        return False
+
+
+def _read_stream_header(f) -> tuple[bytes, int, bytes, bytes, int]:
+    """Read the version 2 header from *f*.
+
+    Returns ``(raw header, iterations, salt, file nonce, chunk size)``.
+    """
+    raw = f.read(_STREAM_HEADER.size)
+    if len(raw) != _STREAM_HEADER.size:
+        raise StreamFormatError("File is too short to be encrypted.")
+    magic, iterations, salt, file_nonce, chunk_size = _STREAM_HEADER.unpack(raw)
+    if magic != _STREAM_MAGIC:
+        raise StreamFormatError("Unrecognised encrypted file format.")
+    if not 0 < chunk_size <= _STREAM_MAX_CHUNK_SIZE:
+        raise StreamFormatError("Encrypted file header is corrupt.")
+    if not _STREAM_MIN_ITERATIONS <= iterations <= _STREAM_MAX_ITERATIONS:
+        raise StreamFormatError("Encrypted file header is corrupt.")
+    return raw, iterations, salt, file_nonce, chunk_size
+
+
+def _file_cipher(key: bytes, file_nonce: bytes) -> AESGCM:
+    """Return the AES-GCM cipher for one file from the password-derived *key*."""
+    hkdf = HKDF(algorithm=hashes.SHA256(), length=32, salt=file_nonce, info=_HKDF_INFO)
+    return AESGCM(hkdf.derive(base64.urlsafe_b64decode(key)))
+
+
+def _chunk_nonce(index: int, final: bool) -> bytes:
+    return index.to_bytes(11, "big") + (b"\x01" if final else b"\x00")
+
+
+def _encrypt_stream(
+    src,
+    dst,
+    key: bytes,
+    salt: bytes,
+    iterations: int = _PBKDF2_ITERATIONS,
+    chunk_size: int = _STREAM_CHUNK_SIZE,
+    progress=None,
+) -> None:
+    """Encrypt binary stream *src* into *dst* in the version 2 format.
+
+    Args:
+        key: Password key from :func:`_derive_key`.
+        salt, iterations: The KDF parameters *key* was derived with; stored in
+            the header.
+        progress: Optional callable receiving the plaintext bytes consumed
+            after every chunk.
+    """
+    file_nonce = os.urandom(16)
+    header = _STREAM_HEADER.pack(_STREAM_MAGIC, iterations, salt, file_nonce, chunk_size)
+    cipher = _file_cipher(key, file_nonce)
+    dst.write(header)
+
+    index = 0
+    chunk = src.read(chunk_size)
+    while True:
+        # Read one chunk ahead so the last chunk can be flagged as final.
+        following = src.read(chunk_size) if len(chunk) == chunk_size else b""
+        final = not following
+        dst.write(cipher.encrypt(_chunk_nonce(index, final), chunk, header))
+        if progress is not None:
+            progress(len(chunk))
+        if final:
+            return
+        chunk = following
+        index += 1
+
+
+def _decrypt_stream(src, dst, key_for, progress=None) -> None:
+    """Decrypt version 2 stream *src* into *dst*.
+
+    Args:
+        key_for: ``key_for(salt, iterations)`` returns the password key for
+            the KDF parameters stored in the header.
+        progress: Optional callable receiving the ciphertext bytes consumed
+            after every chunk (including the header).
+
+    Raises:
+        StreamFormatError: The header is malformed, the password is wrong or
+            the file was modified, reordered or truncated.
+    """
+    header, iterations, salt, file_nonce, chunk_size = _read_stream_header(src)
+    if progress is not None:
+        progress(len(header))
+    cipher = _file_cipher(key_for(salt, iterations), file_nonce)
+
+    sealed_size = chunk_size + _GCM_TAG_SIZE
+    index = 0
+    sealed = src.read(sealed_size)
+    while True:
+        following = src.read(sealed_size) if len(sealed) == sealed_size else b""
+        final = not following
+        if len(sealed) < _GCM_TAG_SIZE:
+            raise StreamFormatError("Encrypted file is truncated.")
+        try:
+            dst.write(cipher.decrypt(_chunk_nonce(index, final), sealed, header))
+        except InvalidTag:
+            raise StreamFormatError(
+                "Wrong password, or the file is corrupt or was modified."
+            ) from None
+        if progress is not None:
+            progress(len(sealed))
+        if final:
+            return
+        sealed = following
+        index += 1
+
+
+class DerivedKeyCache:
+    """Short-lived in-memory cache of password-derived keys.
+
+    Entries are keyed by salt, iteration count and a keyed BLAKE2b digest of
+    the password (the digest key is random per process, so the cache never
+    holds anything that can be used to test passwords offline faster than
+    the KDF itself).  Each entry lives *ttl* seconds after it was last
+    stored or returned, and the whole cache is wiped *ttl* seconds after the
+    last such use, on :meth:`clear` and at interpreter exit.  Key bytes are
+    kept in ``bytearray`` buffers that are zeroed when dropped — best effort
+    only, since callers hold ``bytes`` copies.
+
+    Encrypting reuses the salt of a cached key for the same password
+    (:meth:`find`), so an encrypt after a decrypt needs no new derivation.
+    Version 2 files derive a separate AES key per file with HKDF, so a
+    shared salt does not make two files share a key.
+
+    Args:
+        ttl: Lifetime in seconds; ``0`` disables the cache.
+        clock: Returns the current time in seconds (injectable for tests).
+    """
+
+    def __init__(self, ttl: float = 0.0, clock=time.monotonic):
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._secret = os.urandom(32)
+        # (password digest, iterations, salt) -> (key, expiry); oldest → newest
+        self._entries: OrderedDict[tuple[bytes, int, bytes], tuple[bytearray, float]] = (
+            OrderedDict()
+        )
+        self._timer: threading.Timer | None = None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        """True when keys are being cached."""
+        return self.ttl > 0
+
+    def configure(self, ttl: float) -> None:
+        """Set the lifetime; ``0`` disables the cache and wipes it."""
+        self.ttl = max(float(ttl), 0.0)
+        if not self.enabled:
+            self.clear()
+
+    def get(self, password: str, salt: bytes, iterations: int) -> bytes | None:
+        """Return the cached key for these KDF inputs, or ``None``."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            self._expire()
+            index = (self._digest(password), iterations, salt)
+            entry = self._entries.get(index)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._touch(index)
+            return bytes(entry[0])
+
+    def find(self, password: str, iterations: int) -> tuple[bytes, bytes] | None:
+        """Return ``(salt, key)`` of the newest cached key for *password*, or ``None``."""
+        if not self.enabled:
+            return None
+        digest = self._digest(password)
+        with self._lock:
+            self._expire()
+            for index, (key, _expiry) in reversed(self._entries.items()):
+                entry_digest, entry_iterations, salt = index
+                if entry_digest == digest and entry_iterations == iterations:
+                    self.hits += 1
+                    self._touch(index)
+                    return salt, bytes(key)
+            self.misses += 1
+            return None
+
+    def put(self, password: str, salt: bytes, iterations: int, key: bytes) -> None:
+        """Cache *key*; does nothing while the cache is disabled."""
+        if not self.enabled:
+            return
+        with self._lock:
+            index = (self._digest(password), iterations, salt)
+            old = self._entries.pop(index, None)
+            if old is not None:
+                _wipe(old[0])
+            self._entries[index] = (bytearray(key), 0.0)
+            self._touch(index)
+
+    def clear(self) -> None:
+        """Wipe every cached key."""
+        with self._lock:
+            for key, _expiry in self._entries.values():
+                _wipe(key)
+            self._entries.clear()
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _digest(self, password: str) -> bytes:
+        return hashlib.blake2b(password.encode("utf-8"), key=self._secret).digest()
+
+    def _touch(self, index: tuple[bytes, int, bytes]) -> None:
+        """Restart the lifetime of entry *index* and the wipe timer; hold the lock."""
+        self._entries[index] = (self._entries[index][0], self._clock() + self.ttl)
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = threading.Timer(self.ttl, self.clear)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _expire(self) -> None:
+        now = self._clock()
+        for index in [i for i, (_key, expiry) in self._entries.items() if expiry <= now]:
+            _wipe(self._entries.pop(index)[0])
+
+
+def _wipe(buffer: bytearray) -> None:
+    buffer[:] = bytes(len(buffer))
+
+
+def _derive_key(password: str, salt: bytes, iterations: int = _PBKDF2_ITERATIONS) -> bytes:
+    """Derive encryption key from password using PBKDF2-HMAC-SHA256.
+
+    Args:
+        password:   plaintext password supplied by the user.
+        salt:       16-byte random salt generated at encryption time.
+        iterations: PBKDF2 iteration count; defaults to _PBKDF2_ITERATIONS.
+                    Pass the value read from the .salt file on decryption to
+                    maintain backward compatibility with older encrypted files.
+    """
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=salt,
+        iterations=iterations,
+    )
+    return base64.urlsafe_b64encode(kdf.derive(password.encode("utf-8")))
+
+
+def _derive_cached(password: str, salt: bytes, iterations: int) -> bytes:
+    """Return the key for these KDF inputs from ``key_cache`` or derive it."""
+    key = key_cache.get(password, salt, iterations)
+    if key is None:
+        key = _derive_key(password, salt, iterations)
+        key_cache.put(password, salt, iterations, key)
+    return key
+
+
+def _format_bytes(count: float) -> str:
+    """Return *count* bytes as a short human-readable string."""
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(count) < 1000 or unit == "GB":
+            break
+        count /= 1000
+    if unit == "B":
+        return f"{int(count)} B"
+    return f"{count:.1f} {unit}"
+
+
+def _format_eta(seconds: float) -> str:
+    """Return an ETA in seconds as ``"45 s"``, ``"12 min"`` or ``"2 h 05 min"``."""
+    if seconds < 0:
+        return "estimating…"
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"{seconds} s"
+    if seconds < 3600:
+        return f"{round(seconds / 60)} min"
+    return f"{seconds // 3600} h {seconds % 3600 // 60:02d} min"
+
+
+class _JobProgress:
+    """Byte-weighted progress of one encryption run.
+
+    Fed from the file threads as chunks are processed; reports through the
+    worker's ``progress_updated`` (percent), ``bytes_progress`` and
+    ``rate_updated`` signals.  Percent and ETA weigh every file as its size
+    plus :data:`_FILE_WEIGHT_BYTES`; throughput counts real bytes only.
+
+    Args:
+        worker: The :class:`EncryptionWorker` whose signals are emitted.
+        total_bytes: Sum of the input file sizes.
+        total_files: Number of files in the run.
+        clock: Returns the current time in seconds (injectable for tests).
+    """
+
+    def __init__(self, worker, total_bytes: int, total_files: int, clock=time.monotonic):
+        self._worker = worker
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.total_bytes = total_bytes
+        self.bytes_done = 0
+        self._total_units = total_bytes + total_files * _FILE_WEIGHT_BYTES
+        self._units_done = 0
+        self._percent = -1
+        self._started = self._last_time = clock()
+        self._last_bytes = 0
+        self._last_units = 0
+        # Smoothed bytes/s and weighted units/s; None until the first sample
+        self.rate: float | None = None
+        self._unit_rate: float | None = None
+
+    def add(self, count: int) -> None:
+        """Count *count* bytes of file data as processed."""
+        with self._lock:
+            self.bytes_done += count
+            self._units_done += count
+            self._report(force=False)
+
+    def file_done(self, remaining: int) -> None:
+        """Mark a file finished; *remaining* counts its bytes not yet reported."""
+        with self._lock:
+            self.bytes_done += remaining
+            self._units_done += remaining + _FILE_WEIGHT_BYTES
+            self._report(force=False)
+
+    def finish(self) -> None:
+        """Emit the final figures regardless of the update interval."""
+        with self._lock:
+            self._report(force=True)
+
+    def eta(self) -> float:
+        """Seconds left at the current rate, or ``-1`` while unknown."""
+        if not self._unit_rate:
+            return -1.0
+        return max(self._total_units - self._units_done, 0) / self._unit_rate
+
+    def _report(self, force: bool) -> None:
+        worker = self._worker
+        percent = (
+            min(self._units_done * 100 // self._total_units, 100) if self._total_units else 100
+        )
+        if percent != self._percent:
+            self._percent = percent
+            worker.progress_updated.emit(percent)
+
+        now = self._clock()
+        elapsed = now - self._last_time
+        if not force and elapsed < _RATE_INTERVAL:
+            return
+        if elapsed > 0:
+            rate = (self.bytes_done - self._last_bytes) / elapsed
+            unit_rate = (self._units_done - self._last_units) / elapsed
+            if self.rate is None:
+                self.rate, self._unit_rate = rate, unit_rate
+            else:
+                self.rate += _RATE_SMOOTHING * (rate - self.rate)
+                self._unit_rate += _RATE_SMOOTHING * (unit_rate - self._unit_rate)
+        self._last_time, self._last_bytes, self._last_units = now, self.bytes_done, self._units_done
+        worker.bytes_progress.emit(self.bytes_done, self.total_bytes)
+        worker.rate_updated.emit(float(self.rate or 0.0), self.eta())
+
+
+class JobJournal:
+    """Append-only record of the files a folder job has finished.
+
+    Kept as ``.encryption_journal`` next to ``.encryption_salt``.  The first
+    line is a JSON header with the operation and the files the job set out
+    to process, relative to the folder; encryption jobs also store the salt,
+    iteration count and a check value of the key, so a resume with another
+    password is refused.  Each finished file appends its relative path as a
+    JSON string line.  A line torn by a crash is skipped on load.
+
+    The journal is removed when every file succeeded, or when the job ran to
+    the end without finishing any file (a wrong password fails them all).
+    It is kept when the job was cancelled or some files failed, so the next
+    run can process only :meth:`pending` files instead of walking the folder
+    again.
+    """
+
+    def __init__(
+        self,
+        folder: str,
+        operation: str,
+        files: list[str],
+        salt: bytes | None = None,
+        iterations: int | None = None,
+        check: str | None = None,
+    ):
+        self.folder = folder
+        self.operation = operation
+        self.files = files
+        self.salt = salt
+        self.iterations = iterations
+        self.check = check
+        self.done: set[str] = set()
+        self._lock = threading.Lock()
+        self._file = None
+        self._needs_newline = False
+
+    @staticmethod
+    def path_for(folder: str) -> str:
+        """Return the journal path for *folder*."""
+        return os.path.join(folder, JOURNAL_FILE_NAME)
+
+    @classmethod
+    def create(
+        cls,
+        folder: str,
+        operation: str,
+        files: list[str],
+        salt: bytes | None = None,
+        iterations: int | None = None,
+        key: bytes | None = None,
+    ) -> "JobJournal":
+        """Start a journal for *files* (absolute paths under *folder*), replacing any old one."""
+        root = str(Path(folder).resolve())
+        journal = cls(
+            root,
+            operation,
+            [os.path.relpath(f, root) for f in files],
+            salt,
+            iterations,
+            _key_check(key) if key is not None else None,
+        )
+        header = {"version": _JOURNAL_VERSION, "operation": operation, "files": journal.files}
+        if salt is not None:
+            header.update(salt=salt.hex(), iterations=iterations, check=journal.check)
+        journal._file = open(cls.path_for(root), "w", encoding="utf-8")
+        journal._file.write(json.dumps(header) + "\n")
+        journal._file.flush()
+        return journal
+
+    @classmethod
+    def load(cls, folder: str) -> "JobJournal | None":
+        """Read the journal in *folder*; ``None`` if there is none or it is unusable."""
+        root = str(Path(folder).resolve())
+        try:
+            with open(cls.path_for(root), encoding="utf-8") as f:
+                text = f.read()
+        except OSError:
+            return None
+        lines = text.splitlines()
+        try:
+            header = json.loads(lines[0])
+            if header.get("version") != _JOURNAL_VERSION:
+                raise ValueError(f"unsupported version {header.get('version')!r}")
+            operation = header["operation"]
+            files = [str(f) for f in header["files"]]
+            salt = bytes.fromhex(header["salt"]) if "salt" in header else None
+            if operation == "encrypt" and (salt is None or len(salt) != 16):
+                raise ValueError("encryption journal without a salt")
+            journal = cls(
+                root,
+                operation,
+                files,
+                salt,
+                int(header["iterations"]) if salt is not None else None,
+                header.get("check"),
+            )
+        except (IndexError, KeyError, TypeError, ValueError) as e:
+            logger.warning("Ignoring unreadable encryption journal in %s: %s", root, e)
+            return None
+
+        known = set(files)
+        for line in lines[1:]:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if entry in known:
+                journal.done.add(entry)
+        journal._needs_newline = not text.endswith("\n")
+        return journal
+
+    def key_matches(self, key: bytes) -> bool:
+        """True if *key* is the key this journal's encryption job used."""
+        return self.check is not None and hmac.compare_digest(self.check, _key_check(key))
+
+    def pending(self) -> list[str]:
+        """Return absolute paths of planned files that are not done and still exist.
+
+        A file whose source is gone finished after its journal entry was lost
+        (or was removed by the user) and is skipped.  Entries that resolve
+        outside the folder are ignored.
+        """
+        root = Path(self.folder)
+        files = []
+        for rel in self.files:
+            if rel in self.done:
+                continue
+            path = root / rel
+            try:
+                path.resolve().relative_to(root)
+            except ValueError:
+                logger.warning("Skipping journal entry outside target directory: %s", rel)
+                continue
+            if path.is_file():
+                files.append(str(path))
+        return files
+
+    def record(self, file_path: str) -> None:
+        """Mark *file_path* (absolute) as done; safe to call from pool threads."""
+        rel = os.path.relpath(file_path, self.folder)
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path_for(self.folder), "a", encoding="utf-8")
+                if self._needs_newline:
+                    self._file.write("\n")
+            self._file.write(json.dumps(rel) + "\n")
+            self._file.flush()
+            self.done.add(rel)
+
+    def close(self) -> None:
+        """Close the journal file; :meth:`record` reopens it."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            self._needs_newline = False
+
+    def discard(self) -> None:
+        """Close and delete the journal."""
+        self.close()
+        _remove_partial(self.path_for(self.folder))
+
+
+def _fsync_dir(path: str) -> None:
+    """Persist renames and removals in directory *path*; best effort, POSIX only."""
+    if os.name == "nt":
+        return
+    try:
+        fd = os.open(path or ".", os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass  # some filesystems do not support fsync on directories
+    finally:
+        os.close(fd)
+
+
+def _syncfs(path: str) -> bool:
+    """Flush the whole filesystem holding *path* with ``syncfs(2)``.
+
+    Returns ``False`` where ``syncfs`` is unavailable (non-Linux, or a libc
+    without it).  Raises ``OSError`` if the call fails.
+    """
+    syncfs = _libc_syncfs()
+    if syncfs is None:
+        return False
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        if syncfs(fd) != 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), path)
+    finally:
+        os.close(fd)
+    return True
+
+
+@functools.cache
+def _libc_syncfs():
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        return getattr(ctypes.CDLL(None, use_errno=True), "syncfs", None)
+    except OSError:
+        return None
+
+
+def _fsync_path(path: str) -> None:
+    fd = os.open(path, os.O_RDWR)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class _SyncBatch:
+    """Makes finished outputs durable before their sources are removed.
+
+    With a batch size of 1 each output is fsynced, renamed into place and
+    its directory fsynced, then the source is removed.  With a larger size
+    outputs are renamed into place without syncing and their sources kept.
+    Once *size* files have finished, the batch is synced together: one
+    ``syncfs`` per filesystem where available, otherwise an fsync of each
+    output and directory.  Only then are the sources removed.  Either way a
+    crash can leave an output next to its still-present source (which is
+    processed again), but never a removed source without a complete output.
+
+    A source that cannot be retired in a batch (failed sync or removal) was
+    already counted as processed, so it is counted in :attr:`failures` and
+    passed to *on_error*.
+
+    Args:
+        size: Files per sync.
+        on_error: Called as ``on_error(source, error)`` for every source
+            that could not be retired after a batched sync.
+    """
+
+    def __init__(self, size: int = _DEFAULT_SYNC_BATCH, on_error=None):
+        self.size = max(int(size), 1)
+        self._on_error = on_error
+        self._lock = threading.Lock()
+        # (output, source, on_done) of renamed outputs awaiting the next sync
+        self._pending: list[tuple[str, str, object]] = []
+        self.syncs = 0
+        self.failures = 0
+
+    @property
+    def batched(self) -> bool:
+        """True when outputs are synced in batches rather than one by one."""
+        return self.size > 1
+
+    def sync_file(self, f) -> None:
+        """Flush open output *f* to disk unless syncing is batched."""
+        f.flush()
+        if not self.batched:
+            os.fsync(f.fileno())
+            self.syncs += 1
+
+    def commit(self, partial: str, final: str, source: str, on_done=None) -> None:
+        """Rename complete *partial* to *final*, then remove *source*.
+
+        *on_done*, if given, is called once *source* is gone.  In batched
+        mode that happens at the next sync, possibly on another thread.
+        """
+        os.replace(partial, final)
+        if not self.batched:
+            _fsync_dir(os.path.dirname(final))
+            os.remove(source)
+            if on_done is not None:
+                on_done()
+            return
+        with self._lock:
+            self._pending.append((final, source, on_done))
+            if len(self._pending) < self.size:
+                return
+            batch, self._pending = self._pending, []
+        self._flush(batch)
+
+    def flush(self) -> None:
+        """Sync and retire every output still waiting for a batch to fill."""
+        with self._lock:
+            batch, self._pending = self._pending, []
+        self._flush(batch)
+
+    def _flush(self, batch: list[tuple[str, str, object]]) -> None:
+        if not batch:
+            return
+        try:
+            self._sync([final for final, _source, _on_done in batch])
+        except OSError as e:
+            for _final, source, _on_done in batch:
+                self._fail(source, e)
+            return
+        for _final, source, on_done in batch:
+            try:
+                os.remove(source)
+            except OSError as e:
+                self._fail(source, e)
+                continue
+            if on_done is not None:
+                on_done()
+
+    def _sync(self, outputs: list[str]) -> None:
+        """Make *outputs* and their directory entries durable."""
+        dirs = {os.path.dirname(path) or "." for path in outputs}
+        # One directory per filesystem is enough for syncfs
+        by_device = {os.stat(d).st_dev: d for d in dirs}
+        if all(_syncfs(d) for d in by_device.values()):
+            self.syncs += len(by_device)
+            return
+        for path in outputs:
+            _fsync_path(path)
+        for d in dirs:
+            _fsync_dir(d)
+        self.syncs += len(outputs)
+
+    def _fail(self, source: str, error: OSError) -> None:
+        with self._lock:
+            self.failures += 1
+        logger.warning("Could not retire %s after processing it: %s", source, error)
+        if self._on_error is not None:
+            self._on_error(source, error)
+
+
+def _key_check(key: bytes) -> str:
+    return hmac.new(key, b"encryption journal", hashlib.sha256).hexdigest()[:32]
+
 
 class EncryptionWorker(QThread):
     """Worker thread for encryption/decryption operations."""
@@ -40,76 +831,223 @@ class EncryptionWorker(QThread):
     status_updated = pyqtSignal(str)
     finished_signal = pyqtSignal(bool, str)  # success, message
     legacy_detected = pyqtSignal(str)  # decrypted output path
-
-    def __init__(self, operation, file_path, password, is_folder=False):
+    bytes_progress = pyqtSignal(object, object)  # bytes done, total bytes
+    rate_updated = pyqtSignal(float, float)  # bytes per second, ETA in seconds (-1 = unknown)
+
+    def __init__(
+        self,
+        operation,
+        file_path,
+        password,
+        is_folder=False,
+        workers=1,
+        resume=False,
+        sync_batch=_DEFAULT_SYNC_BATCH,
+    ):
         super().__init__()
         self.operation = operation  # 'encrypt' or 'decrypt'
         self.file_path = file_path
         self.password = password  # best-effort only: cleared after run(); CPython may retain string contents in memory
         self.is_folder = is_folder
-
-    def _derive_key(
-        self, password: str, salt: bytes, iterations: int = _PBKDF2_ITERATIONS
-    ) -> bytes:
-        """Derive encryption key from password using PBKDF2-HMAC-SHA256.
-
-        Args:
-            password:   plaintext password supplied by the user.
-            salt:       16-byte random salt generated at encryption time.
-            iterations: PBKDF2 iteration count; defaults to _PBKDF2_ITERATIONS.
-                        Pass the value read from the .salt file on decryption to
-                        maintain backward compatibility with older encrypted files.
+        # Files processed concurrently; 1 processes them in order on this thread
+        self.workers = workers
+        # Continue the folder's interrupted job from its journal
+        self.resume = resume
+        # When outputs are synced to disk and their sources removed
+        self.sync = _SyncBatch(sync_batch, on_error=self._on_retire_error)
+        # (file path, error message) for every file that failed
+        self.errors: list[tuple[str, str]] = []
+        self._errors_lock = threading.Lock()
+        self._cancel = threading.Event()
+
+    def cancel(self) -> None:
+        """Stop after the current chunk; safe to call from any thread.
+
+        The file being processed is abandoned with its source left intact.
+        Files already finished stay finished and, for folders, are recorded
+        in the job journal so the job can be resumed.
         """
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=iterations,
-        )
-        return base64.urlsafe_b64encode(kdf.derive(password.encode("utf-8")))
-
-    def _encrypt_file(self, file_path: str, key: bytes) -> bool:
-        """Encrypt a single file."""
+        self._cancel.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """True once :meth:`cancel` has been called."""
+        event = getattr(self, "_cancel", None)
+        return event is not None and event.is_set()
+
+    def _encrypt_file(
+        self,
+        file_path: str,
+        key: bytes,
+        salt: bytes,
+        iterations: int = _PBKDF2_ITERATIONS,
+        progress=None,
+        on_done=None,
+    ) -> bool:
+        """Encrypt a single file into ``<file>.enc`` (version 2 format).
+
+        The output is written to a ``.enc-partial`` file and renamed into
+        place once complete; the original is removed after that (see
+        :class:`_SyncBatch`), then *on_done* is called.  *progress*, if
+        given, receives the plaintext bytes consumed per chunk.
+        """
+        encrypted_file_path = file_path + ENC_FILE_SUFFIX
+        partial_path = file_path + PARTIAL_FILE_SUFFIX
+        sync = self._sync_batch()
         try:
-            with open(file_path, "rb") as file:
-                file_data = file.read()
-
-            fernet = Fernet(key)
-            encrypted_data = fernet.encrypt(file_data)
-
-            # Write encrypted data to .enc file
-            encrypted_file_path = file_path + ENC_FILE_SUFFIX
-            with open(encrypted_file_path, "wb") as file:
-                file.write(encrypted_data)
+            with open(file_path, "rb") as src, open(partial_path, "wb") as dst:
+                _encrypt_stream(src, dst, key, salt, iterations, progress=progress)
+                sync.sync_file(dst)
 
-            # Remove original file
-            os.remove(file_path)
+            # Move into place, then remove original file
+            sync.commit(partial_path, encrypted_file_path, file_path, on_done)
             return True
+        except _Cancelled:
+            _remove_partial(partial_path)
+            raise
         except Exception as e:
-            self.status_updated.emit(f"Error encrypting {file_path}: {str(e)}")
+            _remove_partial(partial_path)
+            self._report_error(file_path, f"Error encrypting {file_path}: {str(e)}")
             return False
 
-    def _decrypt_file(self, file_path: str, key: bytes) -> bool:
-        """Decrypt a single file."""
+    def _decrypt_file(
+        self,
+        file_path: str,
+        key_for,
+        legacy_key: bytes | None = None,
+        progress=None,
+        on_done=None,
+    ) -> bool:
+        """Decrypt a single file.
+
+        Version 2 files are streamed with the key ``key_for(salt, iterations)``
+        for the parameters in their header.  Older Fernet files need
+        *legacy_key*, derived from the ``.salt`` file.  Like encryption, the
+        output is renamed into place once complete before the ``.enc`` file
+        is removed and *on_done* called.  *progress*, if given, receives the
+        encrypted bytes consumed per chunk.
+        """
+        # Write decrypted data to original file (remove .enc extension)
+        original_file_path = file_path[: -len(ENC_FILE_SUFFIX)]
+        partial_path = original_file_path + PARTIAL_FILE_SUFFIX
+        sync = self._sync_batch()
         try:
-            with open(file_path, "rb") as file:
-                encrypted_data = file.read()
-
-            fernet = Fernet(key)
-            decrypted_data = fernet.decrypt(encrypted_data)
-
-            # Write decrypted data to original file (remove .enc extension)
-            original_file_path = file_path[: -len(ENC_FILE_SUFFIX)]  # Remove .enc extension
-            with open(original_file_path, "wb") as file:
-                file.write(decrypted_data)
-
-            # Remove encrypted file
-            os.remove(file_path)
+            with open(partial_path, "wb") as dst:
+                if _is_stream_file(file_path):
+                    with open(file_path, "rb") as src:
+                        _decrypt_stream(src, dst, key_for, progress=progress)
+                else:
+                    if legacy_key is None:
+                        raise FileNotFoundError("salt file not found for legacy encrypted file")
+                    with open(file_path, "rb") as file:
+                        encrypted_data = file.read()
+                    dst.write(Fernet(legacy_key).decrypt(encrypted_data))
+                sync.sync_file(dst)
+
+            # Move into place, then remove encrypted file
+            sync.commit(partial_path, original_file_path, file_path, on_done)
             return True
+        except _Cancelled:
+            _remove_partial(partial_path)
+            raise
         except Exception as e:
-            self.status_updated.emit(f"Error decrypting {file_path}: {str(e)}")
+            _remove_partial(partial_path)
+            self._report_error(file_path, f"Error decrypting {file_path}: {str(e)}")
             return False
 
+    def _sync_batch(self) -> _SyncBatch:
+        sync = getattr(self, "sync", None)
+        if sync is None:
+            sync = self.sync = _SyncBatch()
+        return sync
+
+    def _on_retire_error(self, source: str, error: OSError) -> None:
+        """A batched file's output is in place but its source could not be removed."""
+        self._report_error(source, f"Error finishing {source}: {error}")
+
+    def _report_error(self, file_path: str, message: str) -> None:
+        """Record a per-file failure and show it in the progress dialog."""
+        errors = getattr(self, "errors", None)
+        if errors is not None:
+            with self._errors_lock:
+                errors.append((file_path, message))
+        self.status_updated.emit(message)
+
+    @staticmethod
+    def _file_sizes(files: list[str]) -> list[int]:
+        """Return the size of every file (0 if it cannot be read)."""
+        sizes = []
+        for file_path in files:
+            try:
+                sizes.append(os.stat(file_path, follow_symlinks=False).st_size)
+            except OSError:
+                sizes.append(0)
+        return sizes
+
+    def _process_files(self, files: list[str], process) -> int:
+        """Run ``process(file_path, progress) -> bool`` for every file; return the successes.
+
+        *progress* is a callable taking byte counts as the file is processed.
+        The job is sized up front so ``progress_updated`` is weighted by bytes
+        and ``bytes_progress``/``rate_updated`` report throughput and ETA.
+
+        With more than one worker, files are dispatched to a thread pool (the
+        AES and file I/O release the GIL).  At most ``workers *
+        _QUEUE_PER_WORKER`` files are queued at a time.
+
+        After :meth:`cancel`, no new file is started and *progress* raises
+        ``_Cancelled`` at the next chunk of the files in flight; those count
+        as neither success nor error.
+        """
+        total = len(files)
+        sizes = self._file_sizes(files)
+        tracker = _JobProgress(self, sum(sizes), total)
+        self.bytes_progress.emit(0, tracker.total_bytes)
+        successes = 0
+
+        def run_one(file_path: str, size: int) -> bool:
+            if self.cancelled:
+                return False
+            counted = 0
+
+            def on_bytes(count: int) -> None:
+                nonlocal counted
+                counted += count
+                tracker.add(count)
+                if self.cancelled:
+                    raise _Cancelled
+
+            try:
+                return process(file_path, on_bytes)
+            except _Cancelled:
+                return False
+            finally:
+                tracker.file_done(max(size - counted, 0))
+
+        workers = min(max(int(getattr(self, "workers", 1) or 1), 1), total)
+        if workers == 1:
+            for file_path, size in zip(files, sizes, strict=True):
+                if self.cancelled:
+                    break
+                self.status_updated.emit(f"Processing: {os.path.basename(file_path)}")
+                successes += bool(run_one(file_path, size))
+            tracker.finish()
+            return successes
+
+        self.status_updated.emit(f"Processing {total} files on {workers} threads…")
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="encrypt") as pool:
+            running = set()
+            for file_path, size in zip(files, sizes, strict=True):
+                if self.cancelled:
+                    break
+                running.add(pool.submit(run_one, file_path, size))
+                if len(running) >= workers * _QUEUE_PER_WORKER:
+                    finished, running = wait(running, return_when=FIRST_COMPLETED)
+                    successes += sum(bool(future.result()) for future in finished)
+            successes += sum(bool(future.result()) for future in wait(running).done)
+        tracker.finish()
+        return successes
+
     def _get_all_files(self, path: str, operation: str):
         """Get all files to process.
 
@@ -128,6 +1066,11 @@ class EncryptionWorker(QThread):
             # It's a directory — walk without following symlinks
             for root, _dirs, filenames in os.walk(str(resolved_root), followlinks=False):
                 for filename in filenames:
+                    if filename.endswith(PARTIAL_FILE_SUFFIX) or (
+                        root == str(resolved_root)
+                        and filename in (FOLDER_SALT_FILE_NAME, JOURNAL_FILE_NAME)
+                    ):
+                        continue
                     file_path = os.path.join(root, filename)
                     # Reject any path that escapes the intended root
                     try:
@@ -150,18 +1093,33 @@ class EncryptionWorker(QThread):
         """
         logger.info("Starting %s operation on: %s", self.operation, self.file_path)
         is_legacy = False
+        journal = None
         password = self.password
         self.password = None  # best-effort: drop instance reference ASAP
         try:
             if password is None:
                 self.finished_signal.emit(False, "Password is required.")
                 return
-            # Generate salt
-            salt = os.urandom(16)
-            key = self._derive_key(password, salt)
-
-            # Get all files to process
-            files_to_process = self._get_all_files(self.file_path, self.operation)
+            if self.is_folder and getattr(self, "resume", False):
+                journal = JobJournal.load(self.file_path)
+                if journal is not None and journal.operation != self.operation:
+                    journal = None
+
+            if journal is not None:
+                # Only what the interrupted job had left; no new walk
+                files_to_process = journal.pending()
+                self.status_updated.emit(
+                    f"Resuming: {len(journal.done)} of {len(journal.files)} files already done"
+                )
+                if not files_to_process:
+                    journal.discard()
+                    if self.operation == "decrypt":
+                        _remove_partial(os.path.join(self.file_path, FOLDER_SALT_FILE_NAME))
+                    self.finished_signal.emit(True, "Nothing left to do; the job was complete.")
+                    return
+            else:
+                # Get all files to process
+                files_to_process = self._get_all_files(self.file_path, self.operation)
 
             if not files_to_process:
                 if self.operation == "encrypt":
@@ -172,12 +1130,41 @@ class EncryptionWorker(QThread):
                 return
 
             total_files = len(files_to_process)
-            successful_operations = 0
 
+            # Keys derived during this run, by KDF parameters; shared by the
+            # pool threads so each parameter set is derived once
+            keys: dict[tuple[bytes, int], bytes] = {}
+            keys_lock = threading.Lock()
+
+            def key_for(salt: bytes, iterations: int) -> bytes:
+                with keys_lock:
+                    key = keys.get((salt, iterations))
+                    if key is None:
+                        key = keys[(salt, iterations)] = _derive_cached(password, salt, iterations)
+                    return key
+
+            key = None
+            salt = os.urandom(16)
+            iterations = _PBKDF2_ITERATIONS
             # Store salt in a .salt file for the entire operation
-            if self.operation == "encrypt":
+            if self.operation == "encrypt" and journal is not None:
+                salt, iterations = journal.salt, journal.iterations
+                key = key_for(salt, iterations)
+                if not journal.key_matches(key):
+                    self.finished_signal.emit(
+                        False, "The password does not match the interrupted encryption."
+                    )
+                    return
+                salt_file = os.path.join(self.file_path, FOLDER_SALT_FILE_NAME)
+            elif self.operation == "encrypt":
+                cached = key_cache.find(password, _PBKDF2_ITERATIONS)
+                if cached is not None:
+                    salt, key = cached
+                    keys[(salt, _PBKDF2_ITERATIONS)] = key
+                else:
+                    key = key_for(salt, _PBKDF2_ITERATIONS)
                 if self.is_folder:
-                    salt_file = os.path.join(self.file_path, ".encryption_salt")
+                    salt_file = os.path.join(self.file_path, FOLDER_SALT_FILE_NAME)
                 else:
                     # For single files, store salt next to the original file location
                     salt_file = self.file_path + SALT_FILE_SUFFIX
@@ -188,7 +1175,7 @@ class EncryptionWorker(QThread):
             else:  # decrypt
                 # Read salt
                 if self.is_folder:
-                    salt_file = os.path.join(self.file_path, ".encryption_salt")
+                    salt_file = os.path.join(self.file_path, FOLDER_SALT_FILE_NAME)
                 else:
                     # For single files, the salt file should be next to the original file
                     # If we're decrypting /path/file.txt.enc, salt should be at /path/file.txt.salt
@@ -215,33 +1202,70 @@ class EncryptionWorker(QThread):
                             False, "Salt file is corrupt or unrecognised format. Cannot decrypt."
                         )
                         return
-                    key = self._derive_key(password, salt, iterations=stored_iterations)
-                else:
+                    key = key_for(salt, stored_iterations)
+                elif not all(_is_stream_file(f) for f in files_to_process):
+                    # Version 2 files carry their KDF parameters; only
+                    # legacy Fernet files need the .salt file.
                     self.finished_signal.emit(
                         False, "Salt file not found. Cannot decrypt without the original salt."
                     )
                     return
 
-            for i, file_path in enumerate(files_to_process):
-                self.status_updated.emit(f"Processing: {os.path.basename(file_path)}")
-
+            if self.is_folder and journal is None:
                 if self.operation == "encrypt":
-                    success = self._encrypt_file(file_path, key)
+                    journal = JobJournal.create(
+                        self.file_path, "encrypt", files_to_process, salt, _PBKDF2_ITERATIONS, key
+                    )
                 else:
-                    success = self._decrypt_file(file_path, key)
+                    journal = JobJournal.create(self.file_path, "decrypt", files_to_process)
 
-                if success:
-                    successful_operations += 1
+            if self.operation == "encrypt":
 
-                # Update progress
-                progress = int((i + 1) / total_files * 100)
-                self.progress_updated.emit(progress)
+                def process_file(file_path, progress, on_done):
+                    return self._encrypt_file(
+                        file_path, key, salt, iterations, progress=progress, on_done=on_done
+                    )
+            else:
+
+                def process_file(file_path, progress, on_done):
+                    return self._decrypt_file(
+                        file_path, key_for, legacy_key=key, progress=progress, on_done=on_done
+                    )
 
-            # Clean up salt file after decryption
-            if self.operation == "decrypt" and os.path.exists(salt_file):
+            def process(file_path, progress):
+                # Journal a file only once its source is gone
+                on_done = None if journal is None else lambda: journal.record(file_path)
+                return process_file(file_path, progress, on_done)
+
+            successful_operations = self._process_files(files_to_process, process)
+            sync = self._sync_batch()
+            sync.flush()
+            # Batched files were counted before their sources were retired
+            successful_operations -= sync.failures
+            complete = successful_operations == total_files
+            if journal is not None:
+                # A run that finished without a single file done (e.g. a
+                # wrong password) leaves nothing worth resuming
+                if complete or (not self.cancelled and not journal.done):
+                    journal.discard()
+                    journal = None
+                else:
+                    journal.close()
+
+            # Clean up salt file once every file is decrypted
+            if complete and self.operation == "decrypt" and os.path.exists(salt_file):
                 os.remove(salt_file)
 
-            if successful_operations == total_files:
+            if self.cancelled and not complete:
+                operation_name = "encrypted" if self.operation == "encrypt" else "decrypted"
+                message = (
+                    f"Cancelled: {successful_operations} of {total_files} file(s) {operation_name}."
+                )
+                if journal is not None:
+                    message += " Run it again on this folder to resume."
+                logger.info("%s cancelled: %s", self.operation, message)
+                self.finished_signal.emit(False, message)
+            elif complete:
                 operation_name = "encrypted" if self.operation == "encrypt" else "decrypted"
                 message = f"Successfully {operation_name} {successful_operations} file(s)."
                 logger.info(
@@ -261,6 +1285,11 @@ class EncryptionWorker(QThread):
             else:
                 operation_name = "encryption" if self.operation == "encrypt" else "decryption"
                 message = f"Completed with issues: {successful_operations}/{total_files} files processed successfully."
+                failed = [os.path.basename(path) for path, _error in self.errors]
+                if failed:
+                    shown = ", ".join(failed[:3])
+                    more = f" and {len(failed) - 3} more" if len(failed) > 3 else ""
+                    message += f"\nFailed: {shown}{more}"
                 logger.warning(
                     "%s completed with issues: %d/%d files processed",
                     self.operation,
@@ -273,10 +1302,21 @@ class EncryptionWorker(QThread):
             logger.error("Encryption worker failed: %s", str(e))
             self.finished_signal.emit(False, f"Operation failed: {str(e)}")
         finally:
+            self._sync_batch().flush()
+            if journal is not None:
+                journal.close()
             password = None  # best-effort: drop local reference too
             self.password = None
 
 
+def _remove_partial(path: str) -> None:
+    """Best-effort removal of an output file left behind by a failed operation."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
 class PasswordDialog(QDialog):
     """Dialog for password input."""
 
@@ -384,10 +1424,14 @@ class PasswordDialog(QDialog):
 class ProgressDialog(QDialog):
     """Dialog to show encryption/decryption progress."""
 
-    def __init__(self, operation, file_path, parent=None):
+    def __init__(self, operation, file_path, parent=None, on_cancel=None):
         super().__init__(parent)
         self.operation = operation
         self.file_path = file_path
+        # Called on Cancel/Escape; the dialog then stays open until the
+        # operation reports that it has stopped
+        self._on_cancel = on_cancel
+        self._cancelling = False
         self.setup_ui()
 
     def setup_ui(self):
@@ -411,6 +1455,12 @@ class ProgressDialog(QDialog):
         self.status_label = QLabel("Initializing...")
         layout.addWidget(self.status_label)
 
+        # Bytes, throughput and time left
+        self.detail_label = QLabel("")
+        layout.addWidget(self.detail_label)
+        self._bytes_text = ""
+        self._rate_text = ""
+
         # Cancel button
         self.cancel_button = QPushButton("Cancel")
         self.cancel_button.clicked.connect(self.reject)
@@ -426,10 +1476,34 @@ class ProgressDialog(QDialog):
         """Update status label."""
         self.status_label.setText(status)
 
+    def update_bytes(self, done, total):
+        """Show how many bytes have been processed out of *total*."""
+        self._bytes_text = f"{_format_bytes(done)} of {_format_bytes(total)}"
+        self._update_detail()
+
+    def update_rate(self, bytes_per_second, eta_seconds):
+        """Show the current throughput and estimated time left."""
+        self._rate_text = f"{_format_bytes(bytes_per_second)}/s · {_format_eta(eta_seconds)} left"
+        self._update_detail()
+
+    def _update_detail(self):
+        self.detail_label.setText(" · ".join(t for t in (self._bytes_text, self._rate_text) if t))
+
     def disable_cancel(self):
         """Disable cancel button when operation is finishing."""
         self.cancel_button.setEnabled(False)
 
+    def reject(self):
+        """Ask the operation to stop instead of closing while it still runs."""
+        if self._on_cancel is None:
+            super().reject()
+            return
+        if not self._cancelling:
+            self._cancelling = True
+            self.disable_cancel()
+            self.status_label.setText("Cancelling…")
+            self._on_cancel()
+
 
 class FileEncryptor:
     """Main class for file encryption/decryption functionality."""
@@ -492,12 +1566,24 @@ class FileEncryptor:
     def _process_file(self, file_path, password, operation, is_folder):
         """Process file/folder with progress dialog."""
         self._legacy_decrypted_path = None
-        progress_dialog = ProgressDialog(operation, file_path)
+        resume = is_folder and self._ask_resume(file_path, operation)
 
         # Create worker thread
-        self.worker = EncryptionWorker(operation, file_path, password, is_folder)
+        self._configure_key_cache()
+        self.worker = EncryptionWorker(
+            operation,
+            file_path,
+            password,
+            is_folder,
+            workers=self._worker_count(),
+            resume=resume,
+            sync_batch=self._sync_batch_size(),
+        )
+        progress_dialog = ProgressDialog(operation, file_path, on_cancel=self.worker.cancel)
         self.worker.progress_updated.connect(progress_dialog.update_progress)
         self.worker.status_updated.connect(progress_dialog.update_status)
+        self.worker.bytes_progress.connect(progress_dialog.update_bytes)
+        self.worker.rate_updated.connect(progress_dialog.update_rate)
         self.worker.legacy_detected.connect(self._on_legacy_detected)
         self.worker.finished_signal.connect(
             lambda success, message: self._on_operation_finished(progress_dialog, success, message)
@@ -507,6 +1593,63 @@ class FileEncryptor:
         self.worker.start()
         progress_dialog.exec()
 
+    def _ask_resume(self, folder: str, operation: str) -> bool:
+        """Offer to resume an interrupted *operation* on *folder*.
+
+        A journal that is declined, or left by the other operation, is
+        deleted so the new job starts over.
+        """
+        journal = JobJournal.load(folder)
+        if journal is None:
+            return False
+        if journal.operation == operation:
+            job = "encryption" if operation == "encrypt" else "decryption"
+            reply = QMessageBox.question(
+                None,
+                "Resume Interrupted Job",
+                f"An interrupted {job} of this folder was found "
+                f"({len(journal.done)} of {len(journal.files)} files done).\n"
+                "Resume it? Choosing No starts over.",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                QMessageBox.StandardButton.Yes,
+            )
+            if reply == QMessageBox.StandardButton.Yes:
+                return True
+        journal.discard()
+        return False
+
+    def _worker_count(self) -> int:
+        """Threads for folder operations, from the ``encryption_workers`` setting."""
+        try:
+            settings = self.services.config_manager.get_settings()
+            return max(int(settings.get("encryption_workers", _DEFAULT_WORKERS)), 1)
+        except (TypeError, ValueError, AttributeError):
+            return 1
+
+    def _sync_batch_size(self) -> int:
+        """Files per filesystem sync, from the ``encryption_sync_batch`` setting."""
+        try:
+            settings = self.services.config_manager.get_settings()
+            return max(int(settings.get("encryption_sync_batch", _DEFAULT_SYNC_BATCH)), 1)
+        except (TypeError, ValueError, AttributeError):
+            return _DEFAULT_SYNC_BATCH
+
+    def _configure_key_cache(self) -> None:
+        """Apply the ``encryption_key_cache_minutes`` setting to ``key_cache``."""
+        try:
+            settings = self.services.config_manager.get_settings()
+            minutes = settings.get("encryption_key_cache_minutes", 0)
+        except AttributeError:
+            minutes = 0
+        if isinstance(minutes, bool) or not isinstance(minutes, (int, float)):
+            minutes = 0
+        key_cache.configure(minutes * 60)
+
+    def forget_keys(self) -> None:
+        """Wipe every cached derived key (tray menu and application exit)."""
+        key_cache.clear()
+        logger.info("Cleared cached encryption keys")
+
     def _on_legacy_detected(self, decrypted_path: str) -> None:
         """Store the decrypted path from a legacy-encrypted file for upgrade prompt."""
         self._legacy_decrypted_path = decrypted_path
@@ -531,15 +1674,17 @@ class FileEncryptor:
                 )
                 if reply == QMessageBox.StandardButton.Yes:
                     self._reencrypt_to_current_standard(legacy_path)
+        elif getattr(self, "worker", None) is not None and self.worker.cancelled:
+            QMessageBox.information(None, "Cancelled", message)
         else:
             QMessageBox.warning(None, "Error", message)
 
     def _reencrypt_to_current_standard(self, file_path: str) -> None:
         """Re-encrypt a plaintext file using current KDF parameters (600 000 iterations).
 
-        Operates atomically: writes to temp files first, then os.replace() into final
-        positions. The original plaintext file is not removed until both temp files have
-        been written successfully.
+        Operates atomically: writes to temp files first, fsyncs them, then os.replace() into
+        final positions. The original plaintext file is not removed until both temp files
+        have been written and the renames synced to disk.
         """
         import tempfile
 
@@ -551,21 +1696,23 @@ class FileEncryptor:
                 return
             password = password_dialog.get_password()
 
-            salt = os.urandom(16)
-            key = EncryptionWorker("encrypt", file_path, password)._derive_key(
-                password, salt, iterations=_PBKDF2_ITERATIONS
-            )
-
-            with open(file_path, "rb") as fh:
-                plaintext = fh.read()
-
-            fernet = Fernet(key)
-            ciphertext = fernet.encrypt(plaintext)
+            self._configure_key_cache()
+            cached = key_cache.find(password, _PBKDF2_ITERATIONS)
+            if cached is not None:
+                salt, key = cached
+            else:
+                salt = os.urandom(16)
+                key = _derive_cached(password, salt, _PBKDF2_ITERATIONS)
 
             dir_ = os.path.dirname(file_path) or "."
-            with tempfile.NamedTemporaryFile(dir=dir_, delete=False, suffix=".enc.tmp") as enc_tmp:
-                enc_tmp.write(ciphertext)
+            with (
+                open(file_path, "rb") as fh,
+                tempfile.NamedTemporaryFile(dir=dir_, delete=False, suffix=".enc.tmp") as enc_tmp,
+            ):
                 enc_tmp_path = enc_tmp.name
+                _encrypt_stream(fh, enc_tmp, key, salt, _PBKDF2_ITERATIONS)
+                enc_tmp.flush()
+                os.fsync(enc_tmp.fileno())
 
             with tempfile.NamedTemporaryFile(
                 dir=dir_, delete=False, suffix=".salt.tmp"
@@ -573,9 +1720,12 @@ class FileEncryptor:
                 salt_tmp.write(struct.pack(">I", _PBKDF2_ITERATIONS))
                 salt_tmp.write(salt)
                 salt_tmp_path = salt_tmp.name
+                salt_tmp.flush()
+                os.fsync(salt_tmp.fileno())
 
             os.replace(enc_tmp_path, enc_path)
             os.replace(salt_tmp_path, salt_path)
+            _fsync_dir(dir_)
             os.remove(file_path)
 
             QMessageBox.information(
@@ -590,3 +1740,8 @@ class FileEncryptor:
                         os.remove(tmp)
                     except OSError:
                         pass
+
+
+# Singleton instance
+key_cache = DerivedKeyCache()
+atexit.register(key_cache.clear)
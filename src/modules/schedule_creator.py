@@ -44,10 +44,10 @@ class ScheduleCreator:
 
         # Populate with all available commands
         try:
-            all_commands = self.services.get_all_commands()
+            all_commands = self.services.get_command_index()
             command_data: dict = {}
             for cmd_info in all_commands:
-                display_text = f"{cmd_info['group']} → {cmd_info['label']}"
+                display_text = f"{cmd_info.group} → {cmd_info.label}"
                 command_combo.addItem(display_text)
                 command_data[display_text] = cmd_info
         except Exception as e:
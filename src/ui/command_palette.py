@@ -6,7 +6,17 @@ app launching.
 
 * Frameless ``Qt.Popup`` window — disappears on focus loss.
 * Two tabs: **Commands** (existing behaviour) and **Apps** (new app launcher).
-* Reuses the same rapidfuzz scoring used in CommandSearch.
+* Results live in a ``QAbstractListModel`` shown by a uniform-row
+  ``QListView``, so only visible rows are materialised.  Each keystroke
+  updates the model in place (changed rows only) instead of rebuilding every
+  item.
+* App icons are requested when a row is first painted and decoded on a
+  :class:`core.icon_loader.IconLoader` thread; the row shows a generic
+  placeholder until its icon is swapped in.
+* Non-empty queries are ranked on a :class:`core.search_worker.SearchWorker`
+  thread; results of superseded keystrokes are dropped.
+* Ranks results with :mod:`core.ranking` (fuzzy score blended with launch
+  frecency), shared with CommandSearch and the app launcher.
 * Global hotkey registration uses ``pynput`` via ``_HotkeyTrigger``, which
   emits a ``pyqtSignal`` from a background listener thread into the Qt main
   loop so the palette is shown safely on the main thread.
@@ -31,16 +41,24 @@ import os
 import subprocess
 import sys
 
-from PyQt6.QtCore import QEvent, QObject, QSize, Qt, QTimer, pyqtSignal
-from PyQt6.QtGui import QKeyEvent
+from PyQt6.QtCore import (
+    QAbstractListModel,
+    QEvent,
+    QModelIndex,
+    QObject,
+    QSize,
+    Qt,
+    QTimer,
+    pyqtSignal,
+)
+from PyQt6.QtGui import QIcon, QKeyEvent, QPixmap
 from PyQt6.QtWidgets import (
     QApplication,
     QFrame,
     QHBoxLayout,
     QLabel,
     QLineEdit,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QPushButton,
     QSizePolicy,
     QStackedWidget,
@@ -48,6 +66,11 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from core.frecency import app_key, frecency_store
+from core.icon_loader import IconLoader
+from core.ranking import command_session
+from core.search_worker import SearchWorker
+
 logger = logging.getLogger(__name__)
 
 
@@ -108,23 +131,126 @@ class _HotkeyTrigger(QObject):
     app_triggered = pyqtSignal()
 
 
+class _AppsProgress(QObject):
+    """Thread-safe bridge for AppDiscovery background-load progress."""
+
+    progressed = pyqtSignal()
+
+
 # Tab identifiers
 _TAB_COMMANDS = "commands"
 _TAB_APPS = "apps"
+# Rows shown for a non-empty query; ranking stops after the best matches.
+_MAX_RESULTS = 100
+# App icon edge length in the Apps tab
+_ICON_SIZE = 32
+
+
+class _ResultModel(QAbstractListModel):
+    """Flat list model holding the palette's current results.
+
+    Args:
+        display: Returns the text shown for a result.
+        decoration: Returns the icon for a result, or ``None``.  Only called
+            for rows the view actually paints; icons are cached until the
+            rows change.
+    """
+
+    def __init__(self, display, decoration=None, parent=None):
+        super().__init__(parent)
+        self._rows: list = []
+        self._display = display
+        self._decoration = decoration
+        self._icons: dict[int, QIcon | None] = {}
+
+    def rowCount(self, parent=None) -> int:  # noqa: N802 — Qt override
+        if parent is not None and parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        item = self.item(index.row())
+        if item is None:
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._display(item)
+        if role == Qt.ItemDataRole.UserRole:
+            return item
+        if role == Qt.ItemDataRole.DecorationRole and self._decoration is not None:
+            row = index.row()
+            if row not in self._icons:
+                self._icons[row] = self._decoration(item)
+            return self._icons[row]
+        return None
+
+    def item(self, row):
+        """Return the result at *row*, or ``None`` when out of range."""
+        if isinstance(row, int) and 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+
+    def set_rows(self, rows) -> bool:
+        """Replace the results, touching only rows that actually changed.
+
+        Returns ``False`` (and emits nothing) when *rows* holds the same
+        objects in the same order as the current results.
+        """
+        rows = list(rows)
+        old_count, new_count = len(self._rows), len(rows)
+        common = min(old_count, new_count)
+        changed = [i for i in range(common) if self._rows[i] is not rows[i]]
+        if old_count == new_count and not changed:
+            return False
 
+        self._icons.clear()
+        if old_count > new_count:
+            self.beginRemoveRows(QModelIndex(), new_count, old_count - 1)
+            del self._rows[new_count:]
+            self.endRemoveRows()
+        if changed:
+            self._rows[:common] = rows[:common]
+            self.dataChanged.emit(self.index(changed[0], 0), self.index(changed[-1], 0))
+        if new_count > old_count:
+            self.beginInsertRows(QModelIndex(), old_count, new_count - 1)
+            self._rows.extend(rows[old_count:])
+            self.endInsertRows()
+        return True
+
+    def refresh_decorations(self, predicate) -> None:
+        """Re-request the icon of every row whose item satisfies *predicate*."""
+        rows = [row for row, item in enumerate(self._rows) if predicate(item)]
+        if not rows:
+            return
+        for row in rows:
+            self._icons.pop(row, None)
+        self.dataChanged.emit(
+            self.index(rows[0], 0), self.index(rows[-1], 0), [Qt.ItemDataRole.DecorationRole]
+        )
 
-try:
-    from rapidfuzz import fuzz as _fuzz
 
-    _FUZZY_AVAILABLE = True
-except ImportError:
-    _FUZZY_AVAILABLE = False
+def _command_display(cmd) -> str:
+    return f"{cmd.label}  —  {cmd.group}"
 
 
-def _score(query: str, text: str) -> float:
-    if _FUZZY_AVAILABLE:
-        return _fuzz.WRatio(query, text)
-    return 100.0 if query.lower() in text.lower() else 0.0
+def _app_display(app) -> str:
+    return f"{app.name}\n{app.categories_str}" if app.categories_str else app.name
+
+
+def _pixmap_icon(px) -> QIcon | None:
+    if px and not px.isNull():
+        return QIcon(px)
+    return None
+
+
+def _make_result_view(model: _ResultModel) -> QListView:
+    view = QListView()
+    view.setObjectName("PaletteList")
+    view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+    # Uniform rows let the view lay out thousands of results without asking
+    # the model for each row's size hint (and therefore its icon).
+    view.setUniformItemSizes(True)
+    view.setModel(model)
+    return view
 
 
 class _PaletteWindow(QWidget):
@@ -185,15 +311,13 @@ class _PaletteWindow(QWidget):
         # Stacked widget — index 0: commands, index 1: apps
         self._stack = QStackedWidget()
 
-        self._cmd_list = QListWidget()
-        self._cmd_list.setObjectName("PaletteList")
-        self._cmd_list.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self._cmd_model = _ResultModel(_command_display)
+        self._cmd_list = _make_result_view(self._cmd_model)
         self._stack.addWidget(self._cmd_list)
 
-        self._app_list = QListWidget()
-        self._app_list.setObjectName("PaletteList")
-        self._app_list.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        self._app_list.setIconSize(QSize(32, 32))
+        self._app_model = _ResultModel(_app_display, self._app_icon)
+        self._app_list = _make_result_view(self._app_model)
+        self._app_list.setIconSize(QSize(_ICON_SIZE, _ICON_SIZE))
         self._stack.addWidget(self._app_list)
 
         layout.addWidget(self._stack)
@@ -206,17 +330,29 @@ class _PaletteWindow(QWidget):
 
         outer.addWidget(frame)
 
-        # Debounce timer — waits 150 ms after the last keystroke before
-        # updating the list, preventing floods of work during fast typing
+        # Ranking runs off the GUI thread; only the newest query's results
+        # are shown.
+        self._search_worker = SearchWorker(self)
+        self._search_worker.results_ready.connect(self._on_search_results)
+        self._pending_tab = _TAB_COMMANDS
+        # Typed-ahead score cache, reset each time the palette opens
+        self._cmd_session = None
+        # Created on first use of the Apps tab
+        self._apps_progress: _AppsProgress | None = None
+        self._icon_loader: IconLoader | None = None
+        self._placeholder_icon: QIcon | None = None
+
+        # Debounce timer — coalesces bursts of keystrokes.  Ranking happens
+        # on the worker thread, so this can stay short.
         self._search_timer = QTimer(self)
         self._search_timer.setSingleShot(True)
-        self._search_timer.setInterval(150)
+        self._search_timer.setInterval(50)
         self._search_timer.timeout.connect(lambda: self._populate(self._search.text()))
 
         # Connections
         self._search.textChanged.connect(lambda _: self._search_timer.start())
-        self._cmd_list.itemActivated.connect(self._execute)
-        self._app_list.itemActivated.connect(self._execute)
+        self._cmd_list.activated.connect(self._execute)
+        self._app_list.activated.connect(self._execute)
         self._cmd_tab_btn.clicked.connect(lambda: self._switch_tab(_TAB_COMMANDS))
         self._app_tab_btn.clicked.connect(lambda: self._switch_tab(_TAB_APPS))
 
@@ -258,68 +394,118 @@ class _PaletteWindow(QWidget):
             self._populate_apps(query)
 
     def _populate_commands(self, query: str) -> None:
-        self._cmd_list.clear()
-        all_cmds = self._palette._services.get_all_commands()
-
-        if not query.strip():
-            scored = [(100, cmd) for cmd in all_cmds]
-        else:
-            scored = []
-            for cmd in all_cmds:
-                text = f"{cmd['group']} {cmd['label']}"
-                s = _score(query, text)
-                if s > 30 or query.lower() in text.lower():
-                    scored.append((s, cmd))
-            scored.sort(key=lambda x: x[0], reverse=True)
-
-        for _s, cmd in scored:
-            item = QListWidgetItem(f"{cmd['label']}  —  {cmd['group']}")
-            item.setData(Qt.ItemDataRole.UserRole, cmd)
-            self._cmd_list.addItem(item)
-
-        if self._cmd_list.count() > 0:
-            self._cmd_list.setCurrentRow(0)
+        all_cmds = self._palette._services.get_command_index()
+        session = self._cmd_session
+        if session is None or session.items is not all_cmds:
+            session = self._cmd_session = command_session(all_cmds)
+        self._search_tab(_TAB_COMMANDS, query, session.search, query, limit=_MAX_RESULTS)
 
     def _populate_apps(self, query: str) -> None:
-        from PyQt6.QtGui import QIcon as _QIcon
+        from modules.app_discovery import app_discovery
+
+        if self._apps_progress is None:
+            # Scan installed apps off the GUI thread, refresh as they arrive
+            # and keep the catalogue live as apps are (un)installed.
+            self._apps_progress = _AppsProgress()
+            self._apps_progress.progressed.connect(
+                self._on_apps_progress, Qt.ConnectionType.QueuedConnection
+            )
+            app_discovery.add_progress_listener(self._apps_progress.progressed.emit)
+            app_discovery.watch_for_changes()
+        app_discovery.load_in_background()
+        self._search_tab(_TAB_APPS, query, app_discovery.search, query, limit=_MAX_RESULTS)
 
+    def _on_apps_progress(self) -> None:
+        if self._active_tab == _TAB_APPS and self.isVisible():
+            self._populate_apps(self._search.text())
+
+    def _app_icon(self, app) -> QIcon | None:
+        """Decoration for an app row: its cached icon, or a placeholder while it loads."""
+        from modules.app_discovery import app_discovery
+
+        if not app.icon_name:
+            return _pixmap_icon(app_discovery.resolve_icon_pixmap("", size=_ICON_SIZE))
+        px = app_discovery.cached_icon_pixmap(app.icon_name, size=_ICON_SIZE)
+        if px is not None:
+            return _pixmap_icon(px)
+
+        if self._icon_loader is None:
+            self._icon_loader = IconLoader(app_discovery.icon_source, self)
+            self._icon_loader.loaded.connect(
+                self._on_icon_loaded, Qt.ConnectionType.QueuedConnection
+            )
+        self._icon_loader.request(app.icon_name, _ICON_SIZE)
+        if self._placeholder_icon is None:
+            self._placeholder_icon = _pixmap_icon(
+                app_discovery.resolve_icon_pixmap("", size=_ICON_SIZE)
+            )
+        return self._placeholder_icon
+
+    def _on_icon_loaded(self, name: str, size: int, image) -> None:
+        """Cache an icon decoded by the loader and repaint the rows showing it."""
         from modules.app_discovery import app_discovery
 
-        self._app_list.clear()
-        apps = app_discovery.search(query)
+        if image is None:
+            # Not a plain file: let Qt's theme resolver try (GUI thread only).
+            # Failures are negatively cached, so this runs once per name.
+            app_discovery.resolve_icon_pixmap(name, size=size)
+        else:
+            app_discovery.store_icon_pixmap(name, size, QPixmap.fromImage(image))
+        self._app_model.refresh_decorations(lambda app: app.icon_name == name)
 
-        for app in apps:
-            display = app.name
-            if app.categories_str:
-                display = f"{app.name}\n{app.categories_str}"
-            item = QListWidgetItem(display)
-            px = app_discovery.resolve_icon_pixmap(app.icon_name, size=32)
-            if px and not px.isNull():
-                item.setIcon(_QIcon(px))
-            item.setData(Qt.ItemDataRole.UserRole, app)
-            self._app_list.addItem(item)
+    def _search_tab(self, tab: str, query: str, fn, *args, **kwargs) -> None:
+        """Run ``fn(*args, **kwargs)`` and show its results on *tab*.
 
-        if self._app_list.count() > 0:
-            self._app_list.setCurrentRow(0)
+        Blank queries only sort by frecency and run inline so the palette
+        never opens empty; everything else goes to the search worker.
+        """
+        worker = self._search_worker
+        if worker is None or not query.strip():
+            if worker is not None:
+                worker.cancel()
+            self._show_results(tab, fn(*args, **kwargs))
+            return
+        self._pending_tab = tab
+        worker.submit(fn, *args, **kwargs)
+
+    def _on_search_results(self, generation: int, results) -> None:
+        if self._search_worker.is_current(generation):
+            self._show_results(self._pending_tab, results)
+
+    def _show_results(self, tab: str, results) -> None:
+        """Load *results* into *tab*'s model and select the first row when they changed."""
+        if tab == _TAB_COMMANDS:
+            view, model = self._cmd_list, self._cmd_model
+        else:
+            view, model = self._app_list, self._app_model
+        if not model.set_rows(results):
+            return
+        if tab == _TAB_APPS and self._icon_loader is not None:
+            # Rows that are still visible request their icons again on paint.
+            self._icon_loader.clear_pending()
+        if model.rowCount() > 0:
+            view.setCurrentIndex(model.index(0, 0))
+            view.scrollToTop()
 
     # ------------------------------------------------------------------
     # Active list helper
     # ------------------------------------------------------------------
 
-    def _active_list(self) -> QListWidget:
+    def _active_list(self) -> QListView:
         return self._cmd_list if self._active_tab == _TAB_COMMANDS else self._app_list
 
+    def _active_model(self) -> _ResultModel:
+        return self._cmd_model if self._active_tab == _TAB_COMMANDS else self._app_model
+
     # ------------------------------------------------------------------
     # Execution
     # ------------------------------------------------------------------
 
-    def _execute(self, item: QListWidgetItem = None) -> None:
-        if item is None:
-            item = self._active_list().currentItem()
-        if not item:
-            return
-        data = item.data(Qt.ItemDataRole.UserRole)
-        if not data:
+    def _execute(self, index: QModelIndex | None = None) -> None:
+        if index is None:
+            index = self._active_list().currentIndex()
+        data = self._active_model().item(index.row())
+        if data is None:
             return
         self.hide()
 
@@ -338,6 +524,8 @@ class _PaletteWindow(QWidget):
         """Launch an installed application from its AppEntry."""
         from modules.app_discovery import AppDiscovery
 
+        frecency_store.record(app_key(entry.name))
+
         # Windows: .lnk shortcuts are launched via os.startfile() which lets
         # the shell resolve the shortcut target, file associations, and UAC.
         if AppDiscovery.is_windows_lnk_entry(entry):
@@ -388,18 +576,19 @@ class _PaletteWindow(QWidget):
         ):
             key = event.key()
             active = self._active_list()
+            model = self._active_model()
             if key in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
                 self._execute()
                 return True
             elif key == Qt.Key.Key_Down:
-                row = active.currentRow()
-                if row < active.count() - 1:
-                    active.setCurrentRow(row + 1)
+                row = active.currentIndex().row()
+                if row < model.rowCount() - 1:
+                    active.setCurrentIndex(model.index(row + 1, 0))
                 return True
             elif key == Qt.Key.Key_Up:
-                row = active.currentRow()
+                row = active.currentIndex().row()
                 if row > 0:
-                    active.setCurrentRow(row - 1)
+                    active.setCurrentIndex(model.index(row - 1, 0))
                 return True
             elif key == Qt.Key.Key_Escape:
                 self.hide()
@@ -439,6 +628,7 @@ class _PaletteWindow(QWidget):
             self.move(x, y)
         self._search.clear()
         self._search_timer.stop()  # cancel any pending timer from clear()
+        self._cmd_session = None
         self._populate("")
         self.show()
         self.raise_()
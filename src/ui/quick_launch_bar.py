@@ -23,7 +23,6 @@ Example entry in settings.json:
 import logging
 
 from PyQt6.QtCore import QObject, QPoint, Qt, pyqtSignal
-from PyQt6.QtGui import QIcon
 from PyQt6.QtWidgets import (
     QHBoxLayout,
     QSizePolicy,
@@ -31,6 +30,8 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from core.icon_cache import icon_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -138,12 +139,12 @@ class QuickLaunchBar(QWidget):
 
         settings = self.services.config_manager.get_settings()
         pinned = settings.get("quick_launch_bar", {}).get("pinned", [])
-        all_cmds = {(c["group"], c["label"]): c for c in self.services.get_all_commands()}
+        index = self.services.get_command_index()
 
         for pin in pinned:
             group = pin.get("group", "")
             label = pin.get("label", "")
-            cmd = all_cmds.get((group, label))
+            cmd = index.find(group, label)
             if not cmd:
                 logger.warning("Pinned command not found: %s / %s", group, label)
                 continue
@@ -152,16 +153,12 @@ class QuickLaunchBar(QWidget):
             btn.setToolTip(f"{group} → {label}")
             btn.setText(label[:12])  # truncate for compact display
             if self._icon_path:
-                btn.setIcon(QIcon(self._icon_path))
+                btn.setIcon(icon_cache.icon(self._icon_path))
             btn.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
-            # Capture cmd dict at closure time
+            # Capture the command record at closure time
             btn.clicked.connect(
                 lambda _checked=False, c=cmd: self.services.execute(
-                    c["label"],
-                    c["command"],
-                    c.get("confirm", False),
-                    c.get("showOutput", False),
-                    c.get("prompt"),
+                    c.label, c.command, c.confirm, c.show_output, c.prompt
                 )
             )
             self._layout.addWidget(btn)
@@ -125,6 +125,7 @@ def _make_pyqt6_stub():
             return attr
 
     pyqt6.QtCore.QObject = _QObject
+    pyqt6.QtCore.QAbstractListModel = _QObject
     pyqt6.QtWidgets.QWidget = _QWidget
     pyqt6.QtWidgets.QMainWindow = _QWidget
     pyqt6.QtWidgets.QDialog = _QWidget
@@ -144,6 +145,7 @@ def _make_pyqt6_stub():
     pyqt6.QtWidgets.QSpinBox = _QWidget
     pyqt6.QtWidgets.QGroupBox = _QWidget
     pyqt6.QtWidgets.QListWidget = _QWidget
+    pyqt6.QtWidgets.QListView = _QWidget
     pyqt6.QtWidgets.QStackedWidget = _QWidget
     pyqt6.QtWidgets.QHBoxLayout = _QWidget
     pyqt6.QtWidgets.QVBoxLayout = _QWidget
@@ -173,6 +175,16 @@ if str(SRC_DIR) not in sys.path:
     sys.path.insert(0, str(SRC_DIR))
 
 
+@pytest.fixture(autouse=True)
+def _in_memory_frecency(monkeypatch):
+    """Keep the shared frecency store in memory so tests never write frecency.json."""
+    from core.frecency import frecency_store
+
+    monkeypatch.setattr(frecency_store, "_schedule_save", lambda: None)
+    monkeypatch.setattr(frecency_store, "_entries", {})
+    monkeypatch.setattr(frecency_store, "_save", lambda: None)
+
+
 # ---------------------------------------------------------------------------
 # Filesystem helpers
 # ---------------------------------------------------------------------------
@@ -212,11 +224,14 @@ def tmp_commands_file(tmp_config_dir: Path) -> Path:
 def mock_services() -> MagicMock:
     """Return a MagicMock that quacks like AppServices."""
     svc = MagicMock()
-    svc.get_all_commands.return_value = [
-        {"group": "System", "label": "Terminal", "command": "gnome-terminal"},
-        {"group": "System", "label": "Editor", "command": "gedit"},
-        {"group": "Git", "label": "Status", "command": "git status"},
-    ]
+    from core.command_index import CommandIndex
+
+    svc.get_command_index.return_value = CommandIndex.from_commands(
+        {
+            "System": {"Terminal": {"command": "gnome-terminal"}, "Editor": {"command": "gedit"}},
+            "Git": {"Status": {"command": "git status"}},
+        }
+    )
     svc.resolve_icon_path.return_value = None
     svc.resolve_command_reference.side_effect = lambda group, label, item: item
     svc.notify_user = MagicMock()
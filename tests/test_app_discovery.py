@@ -1,10 +1,20 @@
 """Tests for AppDiscovery.clean_exec, build_launch_args, and is_windows_lnk_entry."""
 
-from unittest.mock import patch
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-from modules.app_discovery import AppDiscovery, AppEntry, _find_terminal_emulator
+from modules.app_discovery import (
+    AppDiscovery,
+    AppEntry,
+    _find_terminal_emulator,
+    _PixmapCache,
+    _read_desktop_entry,
+    _read_index_theme,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -169,3 +179,546 @@ def test_is_windows_lnk_entry_linux_always_false():
     with patch("modules.app_discovery.IS_WINDOWS", False):
         result = AppDiscovery.is_windows_lnk_entry(entry)
     assert result is False
+
+
+# ---------------------------------------------------------------------------
+# Persistent .desktop index
+# ---------------------------------------------------------------------------
+
+
+def _desktop(name, extra=""):
+    return f"[Desktop Entry]\nType=Application\nName={name}\nExec={name.lower()}\n{extra}"
+
+
+@pytest.fixture()
+def xdg_apps(tmp_path, monkeypatch):
+    apps_dir = tmp_path / "data" / "applications"
+    apps_dir.mkdir(parents=True)
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path / "data"))
+    monkeypatch.setenv("XDG_DATA_DIRS", str(tmp_path / "none"))
+    (apps_dir / "a.desktop").write_text(_desktop("Alpha", "Categories=Dev;Tools;\n"))
+    (apps_dir / "b.desktop").write_text(_desktop("Beta"))
+    (apps_dir / "h.desktop").write_text(_desktop("Hidden", "NoDisplay=true\n"))
+    return apps_dir
+
+
+def _discovery(tmp_path, workers=1):
+    with patch("modules.app_discovery.threading.Thread"):
+        return AppDiscovery(index_file=tmp_path / "cache" / "desktop_index.json", workers=workers)
+
+
+def _load(discovery):
+    parsed = []
+    real = discovery._parse_desktop_file
+
+    def spy(path):
+        parsed.append(path.name)
+        return real(path)
+
+    with patch.object(discovery, "_parse_desktop_file", side_effect=spy):
+        discovery._load_linux()
+    return parsed
+
+
+def test_desktop_index_reuses_unchanged_directory(tmp_path, xdg_apps):
+    first = _discovery(tmp_path)
+    assert sorted(_load(first)) == ["a.desktop", "b.desktop", "h.desktop"]
+    assert (tmp_path / "cache" / "desktop_index.json").is_file()
+
+    second = _discovery(tmp_path)
+    assert _load(second) == []
+    assert second.get_all() == first.get_all()
+    assert [a.name for a in second.get_all()] == ["Alpha", "Beta"]
+    assert second.get_all()[0].categories == ["Dev", "Tools"]
+
+
+def test_desktop_index_reparses_only_new_and_changed_files(tmp_path, xdg_apps):
+    _load(_discovery(tmp_path))
+    (xdg_apps / "c.desktop").write_text(_desktop("Gamma"))
+    (xdg_apps / "b.desktop").write_text(_desktop("Beta2"))
+    (xdg_apps / "h.desktop").unlink()
+
+    discovery = _discovery(tmp_path)
+    assert sorted(_load(discovery)) == ["b.desktop", "c.desktop"]
+    assert [a.name for a in discovery.get_all()] == ["Alpha", "Beta2", "Gamma"]
+
+
+def test_desktop_index_ignores_corrupt_file(tmp_path, xdg_apps):
+    index_file = tmp_path / "cache" / "desktop_index.json"
+    index_file.parent.mkdir()
+    index_file.write_text("{not json")
+    discovery = _discovery(tmp_path)
+    assert len(_load(discovery)) == 3
+    assert [a.name for a in discovery.get_all()] == ["Alpha", "Beta"]
+
+
+# ---------------------------------------------------------------------------
+# Parallel / background loading
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture()
+def big_xdg(tmp_path, monkeypatch):
+    home_apps = tmp_path / "home" / "applications"
+    sys_apps = tmp_path / "sys" / "applications"
+    home_apps.mkdir(parents=True)
+    sys_apps.mkdir(parents=True)
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path / "home"))
+    monkeypatch.setenv("XDG_DATA_DIRS", str(tmp_path / "sys"))
+    for i in range(150):
+        (sys_apps / f"app{i:03}.desktop").write_text(_desktop(f"App {i:03}"))
+    # Same name in both: the XDG_DATA_HOME copy must win.
+    (home_apps / "mine.desktop").write_text(
+        "[Desktop Entry]\nType=Application\nName=App 007\nExec=mine\n"
+    )
+    return tmp_path
+
+
+def test_parallel_load_matches_sequential_and_keeps_precedence(tmp_path, big_xdg):
+    sequential = _discovery(tmp_path / "seq")
+    sequential._load_linux()
+    parallel = _discovery(tmp_path / "par", workers=4)
+    with patch("modules.app_discovery.ThreadPoolExecutor", wraps=ThreadPoolExecutor) as pool:
+        parallel._load_linux()
+    pool.assert_called_once()
+    assert parallel.get_all() == sequential.get_all()
+    assert len(parallel.get_all()) == 150
+    assert next(a for a in parallel.get_all() if a.name == "App 007").exec_cmd == "mine"
+
+
+def test_load_reports_progressive_partial_results(tmp_path, big_xdg):
+    discovery = _discovery(tmp_path, workers=4)
+    partials = []
+    discovery.load(progress=lambda apps: partials.append(len(apps)))
+    assert partials == sorted(partials)
+    assert len(partials) > 2
+    assert partials[-1] == len(discovery.get_all()) == 150
+
+
+def test_load_in_background_publishes_partial_then_final(tmp_path, big_xdg):
+    discovery = _discovery(tmp_path, workers=2)
+    done = threading.Event()
+    discovery.add_progress_listener(lambda: None if discovery.is_loading else done.set())
+    discovery.load_in_background()
+    assert done.wait(10)
+    assert not discovery.is_loading
+    assert len(discovery.get_all()) == 150
+    discovery.load_in_background()  # already loaded: no new thread
+    assert not discovery.is_loading
+
+
+def test_get_all_returns_partial_while_loading(tmp_path):
+    discovery = _discovery(tmp_path)
+    discovery._load_thread = object()
+    discovery._partial = [AppEntry(name="A", exec_cmd="a", icon_name="")]
+    assert [a.name for a in discovery.get_all()] == ["A"]
+    assert discovery._apps is None
+
+
+# ---------------------------------------------------------------------------
+# Live updates
+# ---------------------------------------------------------------------------
+
+
+def test_desktop_dir_change_applies_delta(tmp_path, xdg_apps):
+    discovery = _discovery(tmp_path)
+    _load(discovery)
+    listener = MagicMock()
+    discovery.add_progress_listener(listener)
+    before = discovery.get_all()
+
+    (xdg_apps / "c.desktop").write_text(_desktop("Gamma"))
+    (xdg_apps / "b.desktop").unlink()
+    parsed = []
+    real = discovery._parse_desktop_file
+    with patch("modules.app_discovery.threading.Thread") as thread_cls:
+        discovery._on_dirs_changed({str(xdg_apps)})
+    thread_cls.assert_called_once()
+    assert thread_cls.call_args.kwargs["target"] == discovery._background_refresh
+    listener.assert_not_called()  # nothing rescanned on the calling (GUI) thread
+    with patch.object(
+        discovery, "_parse_desktop_file", side_effect=lambda p: parsed.append(p.name) or real(p)
+    ):
+        discovery._background_refresh()
+
+    assert parsed == ["c.desktop"]
+    assert not discovery.is_loading
+    assert [a.name for a in discovery.get_all()] == ["Alpha", "Gamma"]
+    assert discovery.get_all() is not before  # new list invalidates the search session
+    listener.assert_called_once()
+    # The persisted index reflects the delta, so the next start parses nothing.
+    assert _load(_discovery(tmp_path)) == []
+
+
+def test_desktop_dir_change_before_load_is_ignored(tmp_path, xdg_apps):
+    discovery = _discovery(tmp_path)
+    with patch("modules.app_discovery.threading.Thread") as thread_cls:
+        discovery._on_dirs_changed({str(xdg_apps)})
+    thread_cls.assert_not_called()
+    assert discovery._apps is None and not discovery._pending_changes
+
+
+def test_desktop_file_edited_in_place_is_rescanned(tmp_path, xdg_apps):
+    discovery = _discovery(tmp_path)
+    _load(discovery)
+    dir_mtime = xdg_apps.stat().st_mtime_ns
+    (xdg_apps / "b.desktop").write_text(_desktop("Beta, edited"))
+    os.utime(xdg_apps, ns=(dir_mtime, dir_mtime))
+
+    with patch("modules.app_discovery.threading.Thread"):
+        discovery._on_dirs_changed({str(xdg_apps / "b.desktop")})
+    assert discovery._pending_changes == {str(xdg_apps)}
+    discovery._background_refresh()
+    assert [a.name for a in discovery.get_all()] == ["Alpha", "Beta, edited"]
+
+
+def test_load_compares_file_mtimes_in_unchanged_directory(tmp_path, xdg_apps):
+    _load(_discovery(tmp_path))
+    dir_mtime = xdg_apps.stat().st_mtime_ns
+    (xdg_apps / "a.desktop").write_text(_desktop("Alpha2"))
+    os.utime(xdg_apps, ns=(dir_mtime, dir_mtime))
+
+    discovery = _discovery(tmp_path)
+    assert _load(discovery) == ["a.desktop"]
+    assert [a.name for a in discovery.get_all()] == ["Alpha2", "Beta"]
+
+
+def test_changes_during_load_are_applied_when_it_finishes(tmp_path, xdg_apps):
+    discovery = _discovery(tmp_path)
+    _load(discovery)
+    discovery._load_thread = running = object()
+    (xdg_apps / "c.desktop").write_text(_desktop("Gamma"))
+    with patch("modules.app_discovery.threading.Thread") as thread_cls:
+        discovery._on_dirs_changed({str(xdg_apps)})
+    thread_cls.assert_not_called()
+    assert discovery._load_thread is running
+
+    assert discovery._drain_dir_changes() is True
+    assert discovery._load_thread is None
+    assert [a.name for a in discovery.get_all()] == ["Alpha", "Beta", "Gamma"]
+
+
+def test_missing_directory_is_watched_through_its_ancestor(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path / "home"))
+    monkeypatch.setenv("XDG_DATA_DIRS", str(tmp_path / "sys"))
+    discovery = _discovery(tmp_path)
+    discovery.watch_for_changes()
+    apps = tmp_path / "sys" / "applications"
+    assert str(tmp_path) in discovery._watched_paths
+    assert str(apps) in discovery._missing_dirs
+
+    apps.mkdir(parents=True)
+    assert discovery._sync_watches() == {str(apps)}
+    assert str(apps) in discovery._watched_paths
+    assert discovery._sync_watches() == set()
+    discovery.stop_watching()
+
+
+def test_icon_dir_change_updates_index_and_drops_stale_pixmaps(tmp_path):
+    icons = tmp_path / "icons"
+    icons.mkdir()
+    (icons / "old.png").write_bytes(b"")
+    discovery = _discovery(tmp_path)
+    with patch.object(AppDiscovery, "_icon_dirs", return_value=[icons]):
+        discovery._build_icon_index()
+    cache = discovery._pixmaps()
+    cache.put("old\x0032", _px(4))
+    cache.put("other\x0032", _px(4))
+    cache.put_missing("new\x0032")
+
+    (icons / "old.png").unlink()
+    (icons / "new.svg").write_bytes(b"")
+    assert discovery._apply_dir_changes({str(icons)}) is True
+
+    assert discovery._icon_path_index == {"new": str(icons / "new.svg")}
+    assert "old\x0032" not in cache and "other\x0032" in cache
+    assert not cache.is_missing("new\x0032")
+
+
+# ---------------------------------------------------------------------------
+# Bounded pixmap cache
+# ---------------------------------------------------------------------------
+
+
+def _px(side):
+    px = MagicMock()
+    px.width.return_value = px.height.return_value = side
+    px.depth.return_value = 32
+    return px
+
+
+class TestPixmapCache:
+    def test_evicts_least_recently_used_over_budget(self):
+        cache = _PixmapCache(max_bytes=3 * 16 * 16 * 4)
+        for name in ("a", "b", "c"):
+            cache.put(f"{name}\x0016", _px(16))
+        cache.get("a\x0016")  # a is now the most recent
+        cache.put("d\x0016", _px(16))
+
+        assert "b\x0016" not in cache
+        assert all(f"{n}\x0016" in cache for n in "acd")
+        assert cache.total_bytes == 3 * 16 * 16 * 4
+        assert cache.evictions == 1
+
+    def test_keeps_newest_entry_even_if_over_budget(self):
+        cache = _PixmapCache(max_bytes=10)
+        cache.put("big\x0064", _px(64))
+        assert len(cache) == 1
+
+    def test_counts_hits_and_misses(self):
+        cache = _PixmapCache(max_bytes=1 << 20)
+        cache.put("a\x0016", _px(16))
+        cache.get("a\x0016")
+        cache.get("b\x0016")
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+    def test_negative_entries_expire(self):
+        now = [100.0]
+        cache = _PixmapCache(max_bytes=1 << 20, negative_ttl=5.0, clock=lambda: now[0])
+        cache.put_missing("gone\x0016")
+        assert cache.is_missing("gone\x0016")
+        now[0] += 5.0
+        assert not cache.is_missing("gone\x0016")
+        assert cache.negative_hits == 1
+
+    def test_put_replaces_negative_entry(self):
+        cache = _PixmapCache(max_bytes=1 << 20)
+        cache.put_missing("a\x0016")
+        cache.put("a\x0016", _px(16))
+        assert not cache.is_missing("a\x0016")
+
+
+def test_resolve_icon_pixmap_caches_failed_lookup(tmp_path):
+    discovery = _discovery(tmp_path)
+    fallback = MagicMock()
+    with (
+        patch.object(discovery, "_find_pixmap", return_value=None) as find,
+        patch.object(discovery, "_fallback_pixmap", return_value=fallback),
+    ):
+        assert discovery.resolve_icon_pixmap("nope", 32) is fallback
+        assert discovery.resolve_icon_pixmap("nope", 32) is fallback
+        assert find.call_count == 1
+
+        # A finished index build makes failed lookups eligible again
+        with patch.object(discovery, "_icon_dirs", return_value=[]):
+            discovery._build_icon_index()
+        discovery.resolve_icon_pixmap("nope", 32)
+        assert find.call_count == 2
+    assert discovery.pixmap_cache_stats["negative_hits"] == 1
+
+
+def test_icon_source_uses_files_and_index_only(tmp_path):
+    discovery = _discovery(tmp_path)
+    icon = tmp_path / "app.png"
+    icon.write_bytes(b"")
+    discovery._icon_path_index = {"term": "/icons/term.svg"}
+    with patch("modules.app_discovery.QIcon") as qicon:
+        assert discovery.icon_source(str(icon)) == str(icon)
+        assert discovery.icon_source(str(tmp_path / "gone.png")) is None
+        assert discovery.icon_source("term") == "/icons/term.svg"
+        assert discovery.icon_source("unknown") is None
+        assert discovery.icon_source("") is None
+    qicon.fromTheme.assert_not_called()
+
+
+def test_cached_icon_pixmap_peeks_without_resolving(tmp_path):
+    discovery = _discovery(tmp_path)
+    fallback, px = MagicMock(), _px(32)
+    with (
+        patch.object(discovery, "_find_pixmap") as find,
+        patch.object(discovery, "_fallback_pixmap", return_value=fallback),
+    ):
+        assert discovery.cached_icon_pixmap("term", 32) is None
+        discovery.store_icon_pixmap("term", 32, px)
+        assert discovery.cached_icon_pixmap("term", 32) is px
+        discovery._pixmaps().put_missing("gone\x0032")
+        assert discovery.cached_icon_pixmap("gone", 32) is fallback
+    find.assert_not_called()
+
+
+def test_pixmap_cache_budget_comes_from_settings(tmp_path):
+    discovery = _discovery(tmp_path)
+    with patch("modules.app_discovery.config_manager") as cm:
+        cm.get_settings.return_value = {"app_icon_cache_mb": 2}
+        assert discovery._pixmaps().max_bytes == 2 * 1024 * 1024
+
+
+# ---------------------------------------------------------------------------
+# Theme-aware, persisted icon index
+# ---------------------------------------------------------------------------
+
+
+def _theme(base, name, inherits, dirs):
+    theme = base / name
+    theme.mkdir(parents=True)
+    lines = ["[Icon Theme]", f"Name={name}", f"Directories={','.join(dirs)}"]
+    if inherits:
+        lines.append(f"Inherits={inherits}")
+    for subdir, keys in dirs.items():
+        lines += ["", f"[{subdir}]", *(f"{k}={v}" for k, v in keys.items())]
+    (theme / "index.theme").write_text("\n".join(lines) + "\n")
+    return theme
+
+
+@pytest.fixture()
+def icon_themes(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path / "data"))
+    monkeypatch.setenv("XDG_DATA_DIRS", str(tmp_path / "none"))
+    base = tmp_path / "data" / "icons"
+    _theme(
+        base,
+        "Papirus",
+        "breeze",
+        {
+            "16x16/apps": {"Size": "16", "Context": "Applications"},
+            "48x48/apps": {"Size": "48", "Context": "Applications"},
+            "22x22/actions": {"Size": "22", "Context": "Actions"},
+            "scalable/apps": {"Size": "64", "Type": "Scalable", "Context": "Applications"},
+        },
+    )
+    _theme(base, "breeze", "hicolor", {"apps/32": {"Size": "32", "Context": "Applications"}})
+    monkeypatch.setattr("modules.app_discovery._PIXMAPS_DIR", tmp_path / "pixmaps")
+    monkeypatch.setattr(AppDiscovery, "_active_icon_theme", staticmethod(lambda: "Papirus"))
+    return base
+
+
+def test_icon_dirs_follow_inherits_chain_and_size_metadata(tmp_path, icon_themes):
+    dirs = _discovery(tmp_path)._icon_dirs()
+    local = [d.relative_to(icon_themes).as_posix() for d in dirs if d.is_relative_to(icon_themes)]
+
+    assert local[:4] == [
+        "Papirus/48x48/apps",
+        "Papirus/scalable/apps",
+        "Papirus/16x16/apps",
+        "breeze/apps/32",
+    ]
+    assert "Papirus/22x22/actions" not in local
+    # hicolor has no index.theme here: conventional layout, after the chain
+    assert local[4] == "hicolor/48x48/apps"
+    assert dirs[-1] == tmp_path / "pixmaps"
+
+
+def test_icon_index_prefers_active_theme_over_parent(tmp_path, icon_themes):
+    for subdir in ("Papirus/scalable/apps", "breeze/apps/32"):
+        (icon_themes / subdir).mkdir(parents=True)
+        (icon_themes / subdir / "firefox.svg").write_bytes(b"")
+    discovery = _discovery(tmp_path)
+    discovery._build_icon_index()
+
+    assert discovery._icon_path_index["firefox"] == str(
+        icon_themes / "Papirus/scalable/apps/firefox.svg"
+    )
+
+
+def test_icon_index_is_persisted_and_reused(tmp_path, icon_themes):
+    apps = icon_themes / "Papirus" / "48x48" / "apps"
+    apps.mkdir(parents=True)
+    (apps / "term.png").write_bytes(b"")
+    first = _discovery(tmp_path)
+    first._build_icon_index()
+    assert (tmp_path / "cache" / "icon_index.json").exists()
+    assert first.icon_index_stats["dirs_listed"] == first.icon_index_stats["dirs"] == 1
+
+    second = _discovery(tmp_path)
+    with patch.object(second, "_list_icon_dir") as list_dir:
+        second._build_icon_index()
+    list_dir.assert_not_called()
+    assert second._icon_path_index == {"term": str(apps / "term.png")}
+    stats = second.icon_index_stats
+    assert stats["dirs_listed"] == 0 and stats["icons"] == 1 and stats["theme"] == "Papirus"
+    assert stats["seconds"] >= 0
+
+
+def test_icon_index_relists_changed_directory(tmp_path, icon_themes):
+    apps = icon_themes / "Papirus" / "48x48" / "apps"
+    apps.mkdir(parents=True)
+    (apps / "term.png").write_bytes(b"")
+    _discovery(tmp_path)._build_icon_index()
+
+    (apps / "edit.svg").write_bytes(b"")
+    os.utime(apps, ns=(0, apps.stat().st_mtime_ns + 1_000_000_000))
+    discovery = _discovery(tmp_path)
+    discovery._build_icon_index()
+
+    assert discovery.icon_index_stats["dirs_listed"] == 1
+    assert set(discovery._icon_path_index) == {"term", "edit"}
+
+
+def test_icon_index_uses_theme_captured_at_construction(tmp_path, icon_themes, monkeypatch):
+    with patch("modules.app_discovery.threading.Thread") as thread_cls:
+        discovery = AppDiscovery(index_file=tmp_path / "cache" / "desktop_index.json")
+    assert thread_cls.call_args.kwargs["args"] == ("Papirus",)
+
+    def off_thread():
+        raise AssertionError("QIcon used from the icon index thread")
+
+    monkeypatch.setattr(AppDiscovery, "_active_icon_theme", staticmethod(off_thread))
+    discovery._build_icon_index("Papirus")
+    assert discovery.icon_index_stats["theme"] == "Papirus"
+    assert str(icon_themes / "breeze" / "apps" / "32") in discovery._icon_dir_keys
+
+
+def test_read_index_theme_handles_missing_and_malformed(tmp_path):
+    assert _read_index_theme(tmp_path / "nope" / "index.theme") is None
+    bad = tmp_path / "index.theme"
+    bad.write_text("[Other]\nKey=1\n")
+    assert _read_index_theme(bad) is None
+
+
+# ---------------------------------------------------------------------------
+# Streaming [Desktop Entry] parser
+# ---------------------------------------------------------------------------
+
+
+def test_read_desktop_entry_only_reads_main_group(tmp_path):
+    path = tmp_path / "x.desktop"
+    path.write_text(
+        "# comment\n"
+        "[Desktop Entry]\n"
+        "Type=Application\n"
+        "Name=Editor\n"
+        "Name[de]=Bearbeiter\n"
+        "Exec = edit %F\n"
+        "Comment=ignored\n"
+        "[Desktop Action new]\n"
+        "Name=New Window\n"
+        "Exec=edit --new\n"
+    )
+    assert _read_desktop_entry(path) == {"Type": "Application", "Name": "Editor", "Exec": "edit %F"}
+
+
+def test_read_desktop_entry_without_group_returns_none(tmp_path):
+    path = tmp_path / "x.desktop"
+    path.write_text("[Other]\nName=X\n")
+    assert _read_desktop_entry(path) is None
+
+
+@pytest.mark.parametrize(("value", "hidden"), [("true", True), ("1", True), ("false", False)])
+def test_parse_desktop_file_boolean_keys(tmp_path, value, hidden):
+    path = tmp_path / "x.desktop"
+    path.write_text(f"[Desktop Entry]\nType=Application\nName=X\nExec=x\nNoDisplay={value}\n")
+    entry = AppDiscovery._parse_desktop_file(None, path)
+    assert (entry is None) is hidden
+
+
+def test_parse_desktop_file_rejects_undecodable_file(tmp_path):
+    path = tmp_path / "x.desktop"
+    path.write_bytes(b"[Desktop Entry]\nName=\xff\xfe\nExec=x\nType=Application\n")
+    assert AppDiscovery._parse_desktop_file(None, path) is None
+
+
+def test_parse_desktop_file_full_entry(tmp_path):
+    path = tmp_path / "x.desktop"
+    path.write_text(
+        "[Desktop Entry]\nType=Application\nName=Top\nExec=htop\nIcon=htop\n"
+        "Terminal=true\nCategories=System;Monitor;\n"
+    )
+    assert AppDiscovery._parse_desktop_file(None, path) == AppEntry(
+        name="Top",
+        exec_cmd="htop",
+        icon_name="htop",
+        categories=["System", "Monitor"],
+        terminal=True,
+    )
@@ -0,0 +1,63 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""Tests for core.command_index (flattened command records)."""
+
+import marshal
+
+import pytest
+
+from core.command_index import CommandIndex, CommandRecord
+
+TREE = {
+    "System": {
+        "icon": "sys.png",
+        "Top": {"command": "top", "confirm": True},
+        "Disk": {"Usage": {"command": "df -h", "showOutput": True, "prompt": "Mount?"}},
+    },
+    "Git": {"Status": {"command": "git status"}},
+}
+
+
+def test_from_commands_folds_nested_groups_in_order():
+    index = CommandIndex.from_commands(TREE)
+    assert [(r.group, r.label) for r in index] == [
+        ("System", "Top"),
+        ("System → Disk", "Usage"),
+        ("Git", "Status"),
+    ]
+
+
+def test_record_fields_and_derived_text():
+    usage = CommandIndex.from_commands(TREE).find("System → Disk", "Usage")
+    assert usage.path == "System.Disk.Usage"
+    assert usage.show_output is True and usage.confirm is False
+    assert usage.prompt == "Mount?"
+    assert usage.text == "System → Disk Usage"
+    assert usage.search_text == "system → disk usage"
+
+
+def test_record_supports_dict_style_access():
+    top = CommandIndex.from_commands(TREE)[0]
+    assert top["label"] == "Top"
+    assert top["showOutput"] is False
+    assert top.get("confirm") is True
+    assert top.get("missing", "x") == "x"
+    with pytest.raises(KeyError):
+        top["missing"]
+
+
+def test_records_have_no_instance_dict():
+    record = CommandRecord("G", "L", "cmd")
+    with pytest.raises(AttributeError):
+        record.extra = 1
+
+
+def test_rows_round_trip_through_marshal():
+    index = CommandIndex.from_commands(TREE)
+    restored = CommandIndex.from_rows(marshal.loads(marshal.dumps(index.to_rows())))  # noqa: S302
+    assert [r.to_row() for r in restored] == index.to_rows()
+    assert restored.find("Git", "Status").command == "git status"
+
+
+def test_empty_index_is_falsy():
+    assert not CommandIndex()
+    assert len(CommandIndex.from_commands({})) == 0
@@ -11,7 +11,7 @@ import sys
 import types
 import unittest
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 # ---------------------------------------------------------------------------
 # Install a real-class PyQt6 stub BEFORE any src imports
@@ -223,7 +223,9 @@ if "modules.app_discovery" not in sys.modules:
     _ad.app_discovery.resolve_icon_pixmap.return_value = None
     sys.modules["modules.app_discovery"] = _ad
 
-from ui.command_palette import CommandPalette, _PaletteWindow, _score, _to_pynput_str
+from core.command_index import CommandIndex
+from core.ranking import fuzzy_score as _score
+from ui.command_palette import CommandPalette, _PaletteWindow, _ResultModel, _to_pynput_str
 
 # ---------------------------------------------------------------------------
 # Pure-logic: _score
@@ -277,11 +279,12 @@ class TestToPynputStr(unittest.TestCase):
 class TestCommandPaletteLifecycle(unittest.TestCase):
     def _make_palette(self):
         svc = MagicMock()
-        svc.get_all_commands.return_value = [
-            {"group": "System", "label": "Terminal", "command": "xterm"},
-            {"group": "System", "label": "Editor", "command": "gedit"},
-            {"group": "Git", "label": "Status", "command": "git status"},
-        ]
+        svc.get_command_index.return_value = CommandIndex.from_commands(
+            {
+                "System": {"Terminal": {"command": "xterm"}, "Editor": {"command": "gedit"}},
+                "Git": {"Status": {"command": "git status"}},
+            }
+        )
         p = CommandPalette(svc)
         return p, svc
 
@@ -320,17 +323,17 @@ class TestCommandPaletteLifecycle(unittest.TestCase):
         """_populate_commands shows all commands when query is empty."""
         p, svc = self._make_palette()
         win = _PaletteWindow(p)
-        win._cmd_list.count.return_value = 0
         win._populate_commands("")
-        assert win._cmd_list.addItem.call_count == len(svc.get_all_commands())
+        assert win._cmd_model.rowCount() == len(svc.get_command_index())
 
     def test_fuzzy_query_filters_commands(self):
         """_populate_commands filters commands by fuzzy query."""
         p, svc = self._make_palette()
         win = _PaletteWindow(p)
-        win._cmd_list.count.return_value = 0
+        win._search_worker = None  # rank inline
         win._populate_commands("terminal")
-        assert win._cmd_list.addItem.call_count >= 1
+        assert 1 <= win._cmd_model.rowCount() < len(svc.get_command_index())
+        assert win._cmd_model.item(0).label == "Terminal"
 
     def test_enter_key_triggers_execute(self):
         """eventFilter triggers _execute on Enter."""
@@ -385,3 +388,186 @@ class TestCommandPaletteLifecycle(unittest.TestCase):
         win._switch_tab("apps")
         win._stack.setCurrentIndex.assert_called_with(1)
         win._populate.assert_called_once_with("calc")
+
+    def test_non_empty_query_goes_to_worker(self):
+        p, svc = self._make_palette()
+        win = _PaletteWindow(p)
+        win._search_worker = MagicMock()
+        win._search_worker.is_current.side_effect = lambda g: g == 2
+        win._populate_commands("term")
+        win._search_worker.submit.assert_called_once()
+        assert win._cmd_model.rowCount() == 0
+
+        cmds = list(svc.get_command_index())
+        win._on_search_results(1, cmds)  # stale generation
+        assert win._cmd_model.rowCount() == 0
+        win._on_search_results(2, cmds[:1])
+        assert win._cmd_model.rowCount() == 1
+
+    def test_empty_query_cancels_pending_search(self):
+        p, svc = self._make_palette()
+        win = _PaletteWindow(p)
+        win._search_worker = MagicMock()
+        win._populate_commands("")
+        win._search_worker.cancel.assert_called_once()
+        win._search_worker.submit.assert_not_called()
+        assert win._cmd_model.rowCount() == len(svc.get_command_index())
+
+    def _app(self, icon_name="firefox"):
+        app = MagicMock()
+        app.icon_name = icon_name
+        return app
+
+    def test_app_icon_shows_placeholder_and_requests_load(self):
+        p, svc = self._make_palette()
+        win = _PaletteWindow(p)
+        win._icon_loader = MagicMock()
+        with patch("modules.app_discovery.app_discovery") as discovery:
+            discovery.cached_icon_pixmap.return_value = None
+            icon = win._app_icon(self._app())
+        win._icon_loader.request.assert_called_once_with("firefox", 32)
+        assert icon is win._placeholder_icon
+        discovery.resolve_icon_pixmap.assert_called_once_with("", size=32)
+
+    def test_app_icon_uses_cached_pixmap_without_loading(self):
+        p, svc = self._make_palette()
+        win = _PaletteWindow(p)
+        win._icon_loader = MagicMock()
+        with patch("modules.app_discovery.app_discovery") as discovery:
+            discovery.cached_icon_pixmap.return_value.isNull.return_value = False
+            assert win._app_icon(self._app()) is not None
+        win._icon_loader.request.assert_not_called()
+
+    def test_loaded_icon_is_cached_and_rows_refreshed(self):
+        p, svc = self._make_palette()
+        win = _PaletteWindow(p)
+        win._app_model = MagicMock()
+        with (
+            patch("modules.app_discovery.app_discovery") as discovery,
+            patch("ui.command_palette.QPixmap") as qpixmap,
+        ):
+            win._on_icon_loaded("firefox", 32, "image")
+        qpixmap.fromImage.assert_called_once_with("image")
+        discovery.store_icon_pixmap.assert_called_once_with(
+            "firefox", 32, qpixmap.fromImage.return_value
+        )
+        predicate = win._app_model.refresh_decorations.call_args.args[0]
+        assert predicate(self._app("firefox")) and not predicate(self._app("gimp"))
+
+    def test_unresolved_icon_falls_back_to_theme_lookup(self):
+        p, svc = self._make_palette()
+        win = _PaletteWindow(p)
+        win._app_model = MagicMock()
+        with patch("modules.app_discovery.app_discovery") as discovery:
+            win._on_icon_loaded("weird", 32, None)
+        discovery.resolve_icon_pixmap.assert_called_once_with("weird", size=32)
+        discovery.store_icon_pixmap.assert_not_called()
+        win._app_model.refresh_decorations.assert_called_once()
+
+    def test_new_app_results_drop_pending_icon_loads(self):
+        p, svc = self._make_palette()
+        win = _PaletteWindow(p)
+        win._icon_loader = MagicMock()
+        win._show_results("apps", [self._app()])
+        win._icon_loader.clear_pending.assert_called_once()
+        win._show_results("commands", list(svc.get_command_index()))
+        win._icon_loader.clear_pending.assert_called_once()
+
+
+# ---------------------------------------------------------------------------
+# _ResultModel
+# ---------------------------------------------------------------------------
+
+
+class _Index:
+    def __init__(self, row):
+        self._row = row
+
+    def row(self):
+        return self._row
+
+
+def _palette_qt():
+    import ui.command_palette as cp
+
+    return cp.Qt
+
+
+class TestResultModel(unittest.TestCase):
+    def _make_model(self, decoration=None):
+        model = _ResultModel(str, decoration)
+        for name in (
+            "beginInsertRows",
+            "endInsertRows",
+            "beginRemoveRows",
+            "endRemoveRows",
+            "dataChanged",
+        ):
+            setattr(model, name, MagicMock())
+        return model
+
+    def test_same_rows_emit_nothing(self):
+        model = self._make_model()
+        rows = ["a", "b"]
+        assert model.set_rows(rows) is True
+        model.beginInsertRows.reset_mock()
+        assert model.set_rows(list(rows)) is False
+        model.beginInsertRows.assert_not_called()
+        model.dataChanged.emit.assert_not_called()
+
+    def test_shrinking_removes_only_the_tail(self):
+        model = self._make_model()
+        a, b, c = "a", "b", "c"
+        model.set_rows([a, b, c])
+        model.set_rows([a])
+        assert model.beginRemoveRows.call_args.args[1:] == (1, 2)
+        model.dataChanged.emit.assert_not_called()
+        assert model.rowCount() == 1
+
+    def test_changed_rows_update_in_place(self):
+        model = self._make_model()
+        model.set_rows(["a", "b"])
+        model.set_rows(["a", "x", "y"])
+        model.dataChanged.emit.assert_called_once()
+        assert model.beginInsertRows.call_args.args[1:] == (2, 2)
+        assert [model.item(i) for i in range(3)] == ["a", "x", "y"]
+        assert model.item(3) is None
+
+    def test_icons_are_resolved_lazily_and_cached(self):
+        decoration = MagicMock(return_value="icon")
+        model = self._make_model(decoration)
+        model.set_rows(["a", "b", "c"])
+        decoration.assert_not_called()
+        role = _palette_qt().ItemDataRole.DecorationRole
+        assert model.data(_Index(1), role) == "icon"
+        assert model.data(_Index(1), role) == "icon"
+        decoration.assert_called_once_with("b")
+
+    def test_user_role_returns_item(self):
+        model = self._make_model()
+        model.set_rows(["a"])
+        role = _palette_qt().ItemDataRole.UserRole
+        assert model.data(_Index(0), role) == "a"
+        assert model.data(_Index(5), role) is None
+
+    def test_refresh_decorations_rerequests_matching_rows(self):
+        decoration = MagicMock(side_effect=lambda item: f"icon-{item}")
+        model = self._make_model(decoration)
+        model.set_rows(["a", "b", "a"])
+        role = _palette_qt().ItemDataRole.DecorationRole
+        for row in range(3):
+            model.data(_Index(row), role)
+        decoration.reset_mock()
+
+        model.refresh_decorations(lambda item: item == "a")
+        model.dataChanged.emit.assert_called_once()
+        model.data(_Index(1), role)
+        decoration.assert_not_called()
+        model.data(_Index(2), role)
+        decoration.assert_called_once_with("a")
+
+    def test_refresh_decorations_without_matches_emits_nothing(self):
+        model = self._make_model(MagicMock())
+        model.set_rows(["a"])
+        model.refresh_decorations(lambda item: False)
+        model.dataChanged.emit.assert_not_called()
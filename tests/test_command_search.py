@@ -13,7 +13,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
 import pytest
 
-from modules.command_search import _score
+from core.ranking import fuzzy_score as _score
 
 
 def test_exact_match_scores_high():
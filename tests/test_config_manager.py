@@ -252,3 +252,220 @@ class TestSettingsSchemaValidation:
             mgr.get_settings()
         warning_msgs = [str(call) for call in mock_logger.warning.call_args_list]
         assert not any("settings.json validation error" in msg for msg in warning_msgs)
+
+
+# ---------------------------------------------------------------------------
+# diff_command_groups
+# ---------------------------------------------------------------------------
+
+
+class TestDiffCommandGroups:
+    BASE = {
+        "System": {"Terminal": {"command": "xterm"}},
+        "Git": {"Status": {"command": "git status"}},
+        "Media": {"Music": {"command": "rhythmbox"}},
+    }
+
+    def _copy(self):
+        return json.loads(json.dumps(self.BASE))
+
+    def test_identical_trees_are_empty(self):
+        from core.config_manager import diff_command_groups
+
+        assert diff_command_groups(self.BASE, self._copy()).is_empty()
+
+    def test_changed_group_detected(self):
+        from core.config_manager import diff_command_groups
+
+        new = self._copy()
+        new["Git"]["Status"]["showOutput"] = True
+        diff = diff_command_groups(self.BASE, new)
+        assert diff.changed == ("Git",)
+        assert diff.added == () and diff.removed == ()
+        assert not diff.reordered
+
+    def test_added_and_removed_groups(self):
+        from core.config_manager import diff_command_groups
+
+        new = self._copy()
+        del new["Media"]
+        new["Dev"] = {"Code": {"command": "code"}}
+        diff = diff_command_groups(self.BASE, new)
+        assert diff.added == ("Dev",)
+        assert diff.removed == ("Media",)
+        assert diff.changed == ()
+
+    def test_reorder_flagged(self):
+        from core.config_manager import diff_command_groups
+
+        new = {k: self.BASE[k] for k in ("Git", "System", "Media")}
+        assert diff_command_groups(self.BASE, new).reordered
+
+    def test_group_with_ref_into_changed_group_is_changed(self):
+        from core.config_manager import diff_command_groups
+
+        old = self._copy()
+        old["Shortcuts"] = {"Nested": {"St": {"ref": "Git.Status"}}}
+        new = json.loads(json.dumps(old))
+        new["Git"]["Status"]["command"] = "git status -sb"
+        diff = diff_command_groups(old, new)
+        assert set(diff.changed) == {"Git", "Shortcuts"}
+
+
+# ---------------------------------------------------------------------------
+# Compiled schema validator cache
+# ---------------------------------------------------------------------------
+
+
+class TestSchemaValidatorCache:
+    SCHEMA = {"type": "object", "properties": {"history_limit": {"type": "integer"}}}
+
+    def _setup(self, tmp_path, settings):
+        schema_dir = tmp_path / "schemas"
+        schema_dir.mkdir()
+        (schema_dir / "settings.schema.json").write_text(json.dumps(self.SCHEMA))
+        return _make_settings_mgr(tmp_path, settings, defaults_dir=schema_dir)
+
+    def test_schema_compiled_once_per_process(self, tmp_path):
+        from core import config_manager as cm
+
+        mgr = self._setup(tmp_path, {"history_limit": 5})
+        schema_path = mgr.defaults_dir / "settings.schema.json"
+        mgr.get_settings(refresh=True)
+        first = cm._schema_validators.get(schema_path)
+        (tmp_path / "settings.json").write_text(json.dumps({"history_limit": 7}))
+        with patch("core.config_manager.json.load") as json_load:
+            assert mgr.get_settings(refresh=True)["history_limit"] == 7
+        json_load.assert_not_called()
+        assert cm._schema_validators.get(schema_path) is first
+
+    def test_unchanged_content_skips_validation(self, tmp_path):
+        from core import config_manager as cm
+
+        mgr = self._setup(tmp_path, {"history_limit": 5})
+        mgr.get_settings(refresh=True)
+        with patch.object(cm._schema_validators, "get") as get_validator:
+            mgr.get_settings(refresh=True)
+        get_validator.assert_not_called()
+
+    def test_schema_change_recompiles_and_revalidates(self, tmp_path):
+        import os
+
+        mgr = self._setup(tmp_path, {"history_limit": 5})
+        assert mgr.get_settings(refresh=True)["history_limit"] == 5
+
+        schema_path = mgr.defaults_dir / "settings.schema.json"
+        stricter = {"type": "object", "properties": {"history_limit": {"maximum": 1}}}
+        schema_path.write_text(json.dumps(stricter))
+        st = schema_path.stat()
+        os.utime(schema_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert mgr.get_settings(refresh=True)["history_limit"] == 50
+
+    def test_invalid_commands_never_cached_as_valid(self, tmp_path):
+        mgr = ConfigManager.__new__(ConfigManager)
+        mgr.defaults_dir = PROJECT_ROOT / "config"
+        bad = {"Group": "not-a-dict"}
+        for _ in range(2):
+            with pytest.raises(ConfigurationError):
+                mgr._validate_commands_schema(bad, content_digest="same")
+
+
+# ---------------------------------------------------------------------------
+# Commands snapshot / command index
+# ---------------------------------------------------------------------------
+
+
+class TestCommandsSnapshot:
+    def _mgr(self, tmp_path, snapshot=True):
+        commands_file = tmp_path / "commands.json"
+        if not commands_file.exists():
+            commands_file.write_text(
+                json.dumps({"G": {"A": {"command": "echo a", "showOutput": False}}})
+            )
+        mgr = ConfigManager.__new__(ConfigManager)
+        mgr._commands_cache = None
+        mgr._commands_override = commands_file
+        mgr._is_windows = False
+        mgr.commands_file = commands_file
+        mgr.defaults_dir = PROJECT_ROOT / "config"
+        mgr.cache_dir = tmp_path / "cache"
+        mgr._settings_cache = {"commands_snapshot": snapshot}
+        return mgr
+
+    def test_snapshot_written_and_reused(self, tmp_path):
+        first = self._mgr(tmp_path)
+        assert first.get_command_index()[0].command == "echo a"
+        assert (tmp_path / "cache" / "commands.snapshot").exists()
+
+        second = self._mgr(tmp_path)
+        with (
+            patch("core.config_manager.json.loads") as loads,
+            patch("core.config_manager.CommandIndex.from_commands") as walk,
+        ):
+            commands = second.get_commands()
+        loads.assert_not_called()
+        walk.assert_not_called()
+        assert commands == {"G": {"A": {"command": "echo a", "showOutput": False}}}
+        assert second.get_command_index()[0].label == "A"
+
+    def test_edited_file_invalidates_snapshot(self, tmp_path):
+        self._mgr(tmp_path).get_commands()
+        (tmp_path / "commands.json").write_text(
+            json.dumps({"G": {"B": {"command": "echo b", "showOutput": False}}})
+        )
+
+        commands = self._mgr(tmp_path).get_commands()
+        assert "B" in commands["G"]
+
+    def test_disabled_setting_writes_no_snapshot(self, tmp_path):
+        self._mgr(tmp_path, snapshot=False).get_commands()
+        assert not (tmp_path / "cache" / "commands.snapshot").exists()
+
+    def test_corrupt_snapshot_falls_back_to_json(self, tmp_path):
+        (tmp_path / "cache").mkdir()
+        (tmp_path / "cache" / "commands.snapshot").write_bytes(b"\x00garbage")
+        assert "A" in self._mgr(tmp_path).get_commands()["G"]
+
+    def test_save_commands_rebuilds_index(self, tmp_path):
+        mgr = self._mgr(tmp_path)
+        tree = mgr.get_commands()
+        assert len(mgr.get_command_index()) == 1
+        tree["G"]["C"] = {"command": "echo c", "showOutput": False}
+        with patch.object(mgr, "backup_commands"), patch.object(mgr, "_write_json_atomic"):
+            mgr.save_commands(tree)
+        assert len(mgr.get_command_index()) == 2
+
+    def test_index_shared_until_cache_changes(self, tmp_path):
+        mgr = self._mgr(tmp_path)
+        index = mgr.get_command_index()
+        assert mgr.get_command_index() is index
+        assert mgr.get_command_index(refresh=True) is not index
+
+
+class TestCommandsChangedOnDisk:
+    _mgr = TestCommandsSnapshot._mgr
+
+    def test_loaded_file_is_unchanged_until_edited_externally(self, tmp_path):
+        mgr = self._mgr(tmp_path)
+        mgr.get_commands()
+        assert mgr.commands_changed_on_disk() is False
+        (tmp_path / "commands.json").write_text(
+            json.dumps({"G": {"B": {"command": "echo b", "showOutput": False}}})
+        )
+        assert mgr.commands_changed_on_disk() is True
+
+    def test_own_save_is_not_reported_as_change(self, tmp_path):
+        mgr = self._mgr(tmp_path)
+        tree = mgr.get_commands()
+        tree["G"]["C"] = {"command": "echo c", "showOutput": False}
+        with patch.object(mgr, "backup_commands"):
+            mgr.save_commands(tree)
+        assert "C" in json.loads((tmp_path / "commands.json").read_text())["G"]
+        assert mgr.commands_changed_on_disk() is False
+
+    def test_missing_file_counts_as_changed(self, tmp_path):
+        mgr = self._mgr(tmp_path)
+        mgr.get_commands()
+        (tmp_path / "commands.json").unlink()
+        assert mgr.commands_changed_on_disk() is True
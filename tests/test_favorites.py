@@ -121,7 +121,7 @@ class TestFavorites(unittest.TestCase):
         self.mock_config_manager.get_base_dir.return_value = str(PROJECT_ROOT)
 
         with patch("modules.favorites.config_manager", self.mock_config_manager):
-            with patch("modules.favorites.QIcon", return_value=MagicMock()):
+            with patch("modules.favorites.icon_cache"):
                 with patch("modules.favorites.QAction", return_value=MagicMock()):
                     with patch("modules.favorites.os.path.isfile", return_value=False):
                         self.favorites.populate_favorites_menu(mock_menu)
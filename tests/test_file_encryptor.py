@@ -1,10 +1,14 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 """Tests for file_encryptor — PBKDF2 iteration count and salt-file format."""
 
+import io
 import os
 import sys
 import tempfile
+import threading
+import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -40,6 +44,10 @@ from modules.file_encryptor import (  # noqa: E402
     _LEGACY_ITERATIONS,
     _PBKDF2_ITERATIONS,
     EncryptionWorker,
+    StreamFormatError,
+    _decrypt_stream,
+    _derive_key,
+    _encrypt_stream,
 )
 
 
@@ -56,35 +64,27 @@ class TestPbkdf2Constant(unittest.TestCase):
 
 
 class TestDeriveKey(unittest.TestCase):
-    """Unit tests for EncryptionWorker._derive_key."""
-
-    def _make_worker(self):
-        worker = EncryptionWorker.__new__(EncryptionWorker)
-        worker.password = "test-password"
-        return worker
+    """Unit tests for _derive_key."""
 
     def test_deterministic_output(self):
         """Same password, salt, and iterations must produce identical keys."""
-        worker = self._make_worker()
         salt = os.urandom(16)
-        key1 = worker._derive_key("secret", salt, iterations=100_000)
-        key2 = worker._derive_key("secret", salt, iterations=100_000)
+        key1 = _derive_key("secret", salt, iterations=100_000)
+        key2 = _derive_key("secret", salt, iterations=100_000)
         self.assertEqual(key1, key2)
 
     def test_different_iterations_produce_different_keys(self):
         """Different iteration counts must produce different keys."""
-        worker = self._make_worker()
         salt = os.urandom(16)
-        key_low = worker._derive_key("secret", salt, iterations=100_000)
-        key_high = worker._derive_key("secret", salt, iterations=200_000)
+        key_low = _derive_key("secret", salt, iterations=100_000)
+        key_high = _derive_key("secret", salt, iterations=200_000)
         self.assertNotEqual(key_low, key_high)
 
     def test_default_iterations_is_pbkdf2_constant(self):
         """Default iterations parameter must equal _PBKDF2_ITERATIONS."""
-        worker = self._make_worker()
         salt = os.urandom(16)
-        key_default = worker._derive_key("secret", salt)
-        key_explicit = worker._derive_key("secret", salt, iterations=_PBKDF2_ITERATIONS)
+        key_default = _derive_key("secret", salt)
+        key_explicit = _derive_key("secret", salt, iterations=_PBKDF2_ITERATIONS)
         self.assertEqual(key_default, key_explicit)
 
 
@@ -139,6 +139,46 @@ class TestEncryptDecryptRoundTrip(unittest.TestCase):
 
             self.assertEqual(Path(plain_file).read_bytes(), original_content)
 
+    def test_encrypted_file_uses_stream_format(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            plain_file = os.path.join(tmp, "data.bin")
+            Path(plain_file).write_bytes(b"\0" * 1000)
+            _worker, result = self._run_worker("encrypt", plain_file, "pw")
+            self.assertTrue(result.get("success"), result.get("message"))
+            blob = Path(plain_file + ".enc").read_bytes()
+            self.assertTrue(blob.startswith(b"PTCLENC\x02"))
+            self.assertEqual(len(blob), 48 + 1000 + 16)
+
+    def test_stream_files_decrypt_without_salt_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            folder = os.path.join(tmp, "docs")
+            os.mkdir(folder)
+            for name in ("a.txt", "b.txt"):
+                Path(folder, name).write_text(name)
+            _worker, result = self._run_worker("encrypt", folder, "pw", is_folder=True)
+            self.assertTrue(result.get("success"), result.get("message"))
+            os.remove(os.path.join(folder, ".encryption_salt"))
+
+            with patch(
+                "modules.file_encryptor._derive_key",
+                side_effect=_derive_key,
+            ) as derive:
+                _worker, result = self._run_worker("decrypt", folder, "pw", is_folder=True)
+            self.assertTrue(result.get("success"), result.get("message"))
+            self.assertEqual(Path(folder, "a.txt").read_text(), "a.txt")
+            derive.assert_called_once()  # both files share the run's KDF parameters
+
+    def test_wrong_password_leaves_no_partial_output(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            plain_file = os.path.join(tmp, "secret.txt")
+            Path(plain_file).write_bytes(b"data")
+            self._run_worker("encrypt", plain_file, "right")
+
+            _worker, result = self._run_worker("decrypt", plain_file + ".enc", "wrong")
+            self.assertFalse(result.get("success"))
+            self.assertFalse(os.path.exists(plain_file))
+            self.assertTrue(os.path.exists(plain_file + ".enc"))
+
     def test_password_reference_cleared_after_run(self):
         """Worker must clear the plaintext password reference after finishing."""
         with tempfile.TemporaryDirectory() as tmp:
@@ -151,6 +191,799 @@ class TestEncryptDecryptRoundTrip(unittest.TestCase):
         self.assertIsNone(worker.password)
 
 
+class TestStreamFormat(unittest.TestCase):
+    """Chunked AES-GCM (version 2) format."""
+
+    KEY = _derive_key("pw", b"s" * 16, iterations=1000)
+
+    def _encrypt(self, data, chunk_size=16):
+        out = io.BytesIO()
+        _encrypt_stream(
+            io.BytesIO(data), out, self.KEY, b"s" * 16, _PBKDF2_ITERATIONS, chunk_size=chunk_size
+        )
+        return out.getvalue()
+
+    def _decrypt(self, blob):
+        out = io.BytesIO()
+        seen = []
+
+        def key_for(salt, iterations):
+            seen.append((salt, iterations))
+            return self.KEY
+
+        _decrypt_stream(io.BytesIO(blob), out, key_for)
+        self.assertEqual(seen, [(b"s" * 16, _PBKDF2_ITERATIONS)])
+        return out.getvalue()
+
+    def test_round_trip_across_chunk_boundaries(self):
+        for size in (0, 1, 15, 16, 17, 32, 100):
+            data = os.urandom(size)
+            with self.subTest(size=size):
+                self.assertEqual(self._decrypt(self._encrypt(data)), data)
+
+    def test_overhead_is_header_plus_tag_per_chunk(self):
+        blob = self._encrypt(b"x" * 40, chunk_size=16)
+        self.assertTrue(blob.startswith(b"PTCLENC\x02"))
+        self.assertEqual(len(blob), 48 + 40 + 3 * 16)
+
+    def test_reads_bounded_chunks(self):
+        reads = []
+
+        class _Src(io.BytesIO):
+            def read(self, n=-1):
+                reads.append(n)
+                return super().read(n)
+
+        _encrypt_stream(
+            _Src(b"x" * 100), io.BytesIO(), self.KEY, b"s" * 16, _PBKDF2_ITERATIONS, chunk_size=16
+        )
+        self.assertTrue(reads and all(0 < n <= 16 for n in reads))
+
+    def test_truncation_is_detected(self):
+        blob = self._encrypt(b"y" * 40)
+        with self.assertRaises(StreamFormatError):
+            self._decrypt(blob[: -(16 + 8)])  # drop the final chunk
+
+    def test_tampering_is_detected(self):
+        blob = bytearray(self._encrypt(b"z" * 40))
+        blob[60] ^= 1
+        with self.assertRaises(StreamFormatError):
+            self._decrypt(bytes(blob))
+
+    def test_header_is_authenticated(self):
+        blob = bytearray(self._encrypt(b"z" * 40))
+        blob[44] ^= 1  # chunk size field
+        with self.assertRaises(StreamFormatError):
+            self._decrypt(bytes(blob))
+
+    def test_out_of_range_iterations_rejected_before_key_derivation(self):
+        blob = self._encrypt(b"z" * 40)
+        for iterations in (0, _PBKDF2_ITERATIONS - 1, 5_000_001, 2**32 - 1):
+            forged = blob[:8] + iterations.to_bytes(4, "big") + blob[12:]
+            key_for = MagicMock(return_value=self.KEY)
+            with self.subTest(iterations=iterations):
+                with self.assertRaisesRegex(StreamFormatError, "corrupt"):
+                    _decrypt_stream(io.BytesIO(forged), io.BytesIO(), key_for)
+                key_for.assert_not_called()
+
+    def test_wrong_key_fails(self):
+        blob = self._encrypt(b"secret")
+        other = _derive_key("no", b"s" * 16, 1000)
+        with self.assertRaises(StreamFormatError):
+            _decrypt_stream(io.BytesIO(blob), io.BytesIO(), lambda *_a: other)
+
+
+class TestParallelFolder(unittest.TestCase):
+    """Folder operations on a thread pool."""
+
+    def _run(self, operation, folder, workers):
+        worker = EncryptionWorker(operation, folder, "pw", is_folder=True, workers=workers)
+        results = {}
+        worker.finished_signal = MagicMock()
+        worker.finished_signal.emit.side_effect = lambda ok, msg: results.update(ok=ok, msg=msg)
+        worker.progress_updated = MagicMock()
+        worker.status_updated = MagicMock()
+        worker.run()
+        return worker, results
+
+    def _folder(self, tmp, count=40):
+        folder = os.path.join(tmp, "docs")
+        os.mkdir(folder)
+        for i in range(count):
+            Path(folder, f"f{i}.txt").write_text(f"content {i}")
+        return folder
+
+    def test_parallel_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            folder = self._folder(tmp)
+            worker, result = self._run("encrypt", folder, workers=4)
+            self.assertTrue(result["ok"], result["msg"])
+            self.assertEqual(len(list(Path(folder).glob("*.enc"))), 40)
+            percents = [c.args[0] for c in worker.progress_updated.emit.call_args_list]
+            self.assertEqual(percents, sorted(percents))
+            self.assertEqual(percents[-1], 100)
+
+            _worker, result = self._run("decrypt", folder, workers=4)
+            self.assertTrue(result["ok"], result["msg"])
+            self.assertEqual(Path(folder, "f7.txt").read_text(), "content 7")
+
+    def test_key_is_derived_once_for_the_pool(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            folder = self._folder(tmp, count=10)
+            with patch(
+                "modules.file_encryptor._derive_key",
+                side_effect=_derive_key,
+            ) as derive:
+                self._run("encrypt", folder, workers=4)
+                self._run("decrypt", folder, workers=4)
+            self.assertEqual(derive.call_count, 2)
+
+    def test_failures_are_aggregated(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            folder = self._folder(tmp, count=10)
+            self._run("encrypt", folder, workers=4)
+            for name in ("f1.txt.enc", "f2.txt.enc"):
+                blob = bytearray(Path(folder, name).read_bytes())
+                blob[-1] ^= 1
+                Path(folder, name).write_bytes(bytes(blob))
+
+            worker, result = self._run("decrypt", folder, workers=4)
+            self.assertFalse(result["ok"])
+            self.assertIn("8/10", result["msg"])
+            self.assertIn("f1.txt.enc", result["msg"])
+            self.assertEqual(
+                sorted(os.path.basename(p) for p, _ in worker.errors), ["f1.txt.enc", "f2.txt.enc"]
+            )
+            self.assertEqual(Path(folder, "f3.txt").read_text(), "content 3")
+
+    def test_queue_is_bounded(self):
+        from modules.file_encryptor import _QUEUE_PER_WORKER
+
+        worker = EncryptionWorker("encrypt", "x", "pw", workers=2)
+        for signal in ("progress_updated", "status_updated", "bytes_progress", "rate_updated"):
+            setattr(worker, signal, MagicMock())
+        lock = threading.Lock()
+        state = {"queued": 0, "done": 0, "peak": 0}
+
+        class _Pool(ThreadPoolExecutor):
+            def submit(self, fn, *args, **kwargs):
+                with lock:
+                    state["queued"] += 1
+                    state["peak"] = max(state["peak"], state["queued"] - state["done"])
+                return super().submit(fn, *args, **kwargs)
+
+        def process(_path, _progress):
+            with lock:
+                state["done"] += 1
+            return True
+
+        with patch("modules.file_encryptor.ThreadPoolExecutor", _Pool):
+            self.assertEqual(worker._process_files([str(i) for i in range(200)], process), 200)
+        self.assertLessEqual(state["peak"], 2 * _QUEUE_PER_WORKER + 1)
+
+    def test_worker_count_comes_from_settings(self):
+        from modules.file_encryptor import FileEncryptor
+
+        enc = FileEncryptor(MagicMock())
+        enc.services.config_manager.get_settings.return_value = {"encryption_workers": 6}
+        self.assertEqual(enc._worker_count(), 6)
+        enc.services.config_manager.get_settings.return_value = {"encryption_workers": "x"}
+        self.assertEqual(enc._worker_count(), 1)
+
+
+class TestJobProgress(unittest.TestCase):
+    """Byte-weighted progress, throughput and ETA."""
+
+    def _tracker(self, total_bytes, total_files):
+        from modules.file_encryptor import _JobProgress
+
+        self.now = 0.0
+        self.worker = MagicMock()
+        return _JobProgress(self.worker, total_bytes, total_files, clock=lambda: self.now)
+
+    def _percents(self):
+        return [c.args[0] for c in self.worker.progress_updated.emit.call_args_list]
+
+    def test_percent_is_weighted_by_bytes(self):
+        from modules.file_encryptor import _FILE_WEIGHT_BYTES
+
+        big = 100 * _FILE_WEIGHT_BYTES
+        tracker = self._tracker(big, total_files=100)
+        for _ in range(99):  # 99 empty files
+            tracker.file_done(0)
+        self.assertLess(self._percents()[-1], 50)
+        tracker.add(big)
+        tracker.file_done(0)
+        self.assertEqual(self._percents()[-1], 100)
+        self.assertEqual(self._percents(), sorted(set(self._percents())))
+
+    def test_rate_and_eta(self):
+        tracker = self._tracker(1000, total_files=0)
+        self.assertEqual(tracker.eta(), -1.0)
+        self.now = 1.0
+        tracker.add(100)
+        self.worker.rate_updated.emit.assert_called_once_with(100.0, 9.0)
+        self.worker.bytes_progress.emit.assert_called_once_with(100, 1000)
+
+    def test_updates_are_throttled(self):
+        tracker = self._tracker(1000, total_files=0)
+        self.now = 1.0
+        tracker.add(10)
+        self.now = 1.1
+        tracker.add(10)
+        self.assertEqual(self.worker.rate_updated.emit.call_count, 1)
+        tracker.finish()
+        self.assertEqual(self.worker.bytes_progress.emit.call_args.args, (20, 1000))
+
+    def test_rate_is_smoothed(self):
+        from modules.file_encryptor import _RATE_SMOOTHING
+
+        tracker = self._tracker(10_000, total_files=0)
+        self.now = 1.0
+        tracker.add(100)
+        self.now = 2.0
+        tracker.add(300)
+        self.assertAlmostEqual(tracker.rate, 100 + _RATE_SMOOTHING * 200)
+
+    def test_format_helpers(self):
+        from modules.file_encryptor import _format_bytes, _format_eta
+
+        self.assertEqual(_format_bytes(512), "512 B")
+        self.assertEqual(_format_bytes(85_300_000), "85.3 MB")
+        self.assertEqual(_format_bytes(12_500_000_000), "12.5 GB")
+        self.assertEqual(_format_eta(-1), "estimating…")
+        self.assertEqual(_format_eta(42), "42 s")
+        self.assertEqual(_format_eta(600), "10 min")
+        self.assertEqual(_format_eta(7500), "2 h 05 min")
+
+    def test_worker_reports_bytes_of_the_whole_job(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            folder = os.path.join(tmp, "docs")
+            os.mkdir(folder)
+            Path(folder, "big.bin").write_bytes(b"\0" * 3_000_000)
+            Path(folder, "small.txt").write_text("x")
+            worker = EncryptionWorker("encrypt", folder, "pw", is_folder=True)
+            for signal in (
+                "finished_signal",
+                "progress_updated",
+                "status_updated",
+                "bytes_progress",
+                "rate_updated",
+            ):
+                setattr(worker, signal, MagicMock())
+            worker.run()
+
+            progress = [c.args for c in worker.bytes_progress.emit.call_args_list]
+            self.assertEqual(progress[0], (0, 3_000_001))
+            self.assertEqual(progress[-1], (3_000_001, 3_000_001))
+            percents = [c.args[0] for c in worker.progress_updated.emit.call_args_list]
+            self.assertGreater(len(percents), 3)  # moves while the big file streams
+            self.assertEqual(percents[-1], 100)
+
+
+class TestCancelAndResume(unittest.TestCase):
+    """Cooperative cancellation and the folder job journal."""
+
+    def _worker(self, operation, folder, password, workers=1, resume=False):
+        worker = EncryptionWorker(
+            operation, folder, password, is_folder=True, workers=workers, resume=resume
+        )
+        worker.results = {}
+        worker.finished_signal = MagicMock()
+        worker.finished_signal.emit.side_effect = lambda ok, msg: worker.results.update(
+            ok=ok, msg=msg
+        )
+        for signal in ("progress_updated", "status_updated", "bytes_progress", "rate_updated"):
+            setattr(worker, signal, MagicMock())
+        return worker
+
+    def _folder(self, tmp, count=6):
+        folder = os.path.join(tmp, "docs")
+        os.mkdir(folder)
+        for i in range(count):
+            Path(folder, f"f{i}.txt").write_text(f"content {i}")
+        return folder
+
+    def _cancel_after(self, worker, count):
+        """Cancel when the worker announces the file after the first *count*."""
+        started = []
+
+        def on_status(text):
+            if text.startswith("Processing: "):
+                started.append(text)
+                if len(started) > count:
+                    worker.cancel()
+
+        worker.status_updated.emit.side_effect = on_status
+
+    def test_cancel_between_files_keeps_journal(self):
+        from modules.file_encryptor import JOURNAL_FILE_NAME, JobJournal
+
+        with tempfile.TemporaryDirectory() as tmp:
+            folder = self._folder(tmp)
+            worker = self._worker("encrypt", folder, "pw")
+            self._cancel_after(worker, 2)
+            worker.run()
+
+            self.assertFalse(worker.results["ok"])
+            self.assertIn("Cancelled", worker.results["msg"])
+            self.assertEqual(worker.errors, [])
+            self.assertTrue(Path(folder, JOURNAL_FILE_NAME).exists())
+            journal = JobJournal.load(folder)
+            self.assertEqual(journal.operation, "encrypt")
+            self.assertEqual(len(journal.files), 6)
+            self.assertEqual(len(journal.done), 2)
+            self.assertEqual(len(journal.pending()), 4)
+
+    def test_cancel_within_a_file_leaves_source_intact(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            folder = os.path.join(tmp, "big")
+            os.mkdir(folder)
+            data = os.urandom(3 * 1024 * 1024 + 5)
+            Path(folder, "big.bin").write_bytes(data)
+            worker = self._worker("encrypt", folder, "pw")
+            # The first chunk moves the bar; cancel there
+            worker.progress_updated.emit.side_effect = lambda percent: (
+                worker.cancel() if 0 < percent < 100 else None
+            )
+            worker.run()
+
+            self.assertIn("Cancelled: 0 of 1", worker.results["msg"])
+            self.assertEqual(Path(folder, "big.bin").read_bytes(), data)
+            # No .enc or partial output
+            self.assertEqual(
+                sorted(os.listdir(folder)), [".encryption_journal", ".encryption_salt", "big.bin"]
+            )
+
+    def test_resume_skips_finished_files_without_walking(self):
+        from modules.file_encryptor import JOURNAL_FILE_NAME
+
+        with tempfile.TemporaryDirectory() as tmp:
+            folder = self._folder(tmp)
+            first = self._worker("encrypt", folder, "pw")
+            self._cancel_after(first, 3)
+            first.run()
+            done = {p.name: p.read_bytes() for p in Path(folder).glob("*.enc")}
+            self.assertEqual(len(done), 3)
+
+            resumed = self._worker("encrypt", folder, "pw", workers=4, resume=True)
+            with patch.object(EncryptionWorker, "_get_all_files") as walk:
+                resumed.run()
+            walk.assert_not_called()
+            self.assertTrue(resumed.results["ok"], resumed.results["msg"])
+            self.assertIn("3 file(s)", resumed.results["msg"])
+            self.assertFalse(Path(folder, JOURNAL_FILE_NAME).exists())
+            for name, blob in done.items():
+                self.assertEqual(Path(folder, name).read_bytes(), blob)  # not re-encrypted
+
+            decrypt = self._worker("decrypt", folder, "pw")
+            decrypt.run()
+            self.assertTrue(decrypt.results["ok"], decrypt.results["msg"])
+            self.assertEqual(Path(folder, "f5.txt").read_text(), "content 5")
+            self.assertEqual(sorted(os.listdir(folder)), [f"f{i}.txt" for i in range(6)])
+
+    def test_resume_refuses_a_different_password(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            folder = self._folder(tmp)
+            first = self._worker("encrypt", folder, "pw")
+            self._cancel_after(first, 1)
+            first.run()
+
+            resumed = self._worker("encrypt", folder, "other", resume=True)
+            resumed.run()
+            self.assertFalse(resumed.results["ok"])
+            self.assertIn("password does not match", resumed.results["msg"])
+            self.assertEqual(len(list(Path(folder).glob("*.enc"))), 1)
+
+    def test_wrong_password_decrypt_leaves_no_journal(self):
+        from modules.file_encryptor import JOURNAL_FILE_NAME
+
+        with tempfile.TemporaryDirectory() as tmp:
+            folder = self._folder(tmp, count=3)
+            self._worker("encrypt", folder, "pw").run()
+            worker = self._worker("decrypt", folder, "wrong")
+            worker.run()
+
+            self.assertFalse(worker.results["ok"])
+            self.assertIn("0/3", worker.results["msg"])
+            self.assertEqual(len(worker.errors), 3)
+            self.assertFalse(Path(folder, JOURNAL_FILE_NAME).exists())
+            self.assertEqual(len(list(Path(folder).glob("*.enc"))), 3)
+
+    def test_cancelled_decrypt_keeps_salt_file_and_resumes(self):
+        from modules.file_encryptor import FOLDER_SALT_FILE_NAME
+
+        with tempfile.TemporaryDirectory() as tmp:
+            folder = self._folder(tmp)
+            self._worker("encrypt", folder, "pw").run()
+            first = self._worker("decrypt", folder, "pw")
+            self._cancel_after(first, 2)
+            first.run()
+            self.assertTrue(Path(folder, FOLDER_SALT_FILE_NAME).exists())
+
+            resumed = self._worker("decrypt", folder, "pw", resume=True)
+            resumed.run()
+            self.assertTrue(resumed.results["ok"], resumed.results["msg"])
+            self.assertEqual(sorted(os.listdir(folder)), [f"f{i}.txt" for i in range(6)])
+
+    def test_journal_load_tolerates_torn_lines_and_foreign_paths(self):
+        from modules.file_encryptor import JobJournal
+
+        with tempfile.TemporaryDirectory() as tmp:
+            folder = self._folder(tmp, count=3)
+            root = str(Path(folder).resolve())
+            files = [os.path.join(root, f"f{i}.txt") for i in range(3)]
+            journal = JobJournal.create(folder, "decrypt", files)
+            journal.record(files[0])
+            journal.close()
+            path = JobJournal.path_for(root)
+            with open(path, "a", encoding="utf-8") as f:
+                f.write('"../outside"\n"f1.t')  # foreign entry, then a torn line
+
+            journal = JobJournal.load(folder)
+            self.assertEqual(journal.done, {"f0.txt"})
+            journal.record(files[2])
+            journal.close()
+            self.assertEqual(JobJournal.load(folder).done, {"f0.txt", "f2.txt"})
+
+            journal.files.append("../escape.txt")
+            Path(tmp, "escape.txt").write_text("x")
+            self.assertEqual(journal.pending(), [files[1]])
+
+            Path(path).write_text("not json")
+            self.assertIsNone(JobJournal.load(folder))
+
+    def test_declined_resume_discards_journal(self):
+        from modules.file_encryptor import JOURNAL_FILE_NAME, FileEncryptor
+
+        with tempfile.TemporaryDirectory() as tmp:
+            folder = self._folder(tmp)
+            first = self._worker("encrypt", folder, "pw")
+            self._cancel_after(first, 1)
+            first.run()
+
+            enc = FileEncryptor(MagicMock())
+            with patch("modules.file_encryptor.QMessageBox") as box:
+                box.question.return_value = box.StandardButton.Yes
+                self.assertTrue(enc._ask_resume(folder, "encrypt"))
+                self.assertFalse(enc._ask_resume(folder, "decrypt"))  # other operation
+            self.assertFalse(Path(folder, JOURNAL_FILE_NAME).exists())
+            self.assertFalse(enc._ask_resume(folder, "encrypt"))
+
+
+class TestAtomicWrites(unittest.TestCase):
+    """Outputs are renamed into place and synced before sources are removed."""
+
+    def _worker(self, operation, path, password, is_folder=False, sync_batch=1):
+        worker = EncryptionWorker(
+            operation, path, password, is_folder=is_folder, sync_batch=sync_batch
+        )
+        worker.results = {}
+        worker.finished_signal = MagicMock()
+        worker.finished_signal.emit.side_effect = lambda ok, msg: worker.results.update(
+            ok=ok, msg=msg
+        )
+        for signal in ("progress_updated", "status_updated", "bytes_progress", "rate_updated"):
+            setattr(worker, signal, MagicMock())
+        return worker
+
+    def test_output_is_fsynced_before_source_is_removed(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            plain = os.path.join(tmp, "a.txt")
+            Path(plain).write_text("secret")
+            events = []
+            real_fsync, real_remove = os.fsync, os.remove
+
+            def fsync(fd):
+                events.append("fsync")
+                real_fsync(fd)
+
+            def remove(path):
+                events.append(("remove", os.path.basename(path)))
+                real_remove(path)
+
+            with (
+                patch("modules.file_encryptor.os.fsync", side_effect=fsync),
+                patch("modules.file_encryptor.os.remove", side_effect=remove),
+            ):
+                worker = self._worker("encrypt", plain, "pw")
+                worker.run()
+            self.assertTrue(worker.results["ok"], worker.results["msg"])
+            # file data, then directory entry, then the source goes
+            self.assertEqual(events, ["fsync", "fsync", ("remove", "a.txt")])
+            self.assertEqual(sorted(os.listdir(tmp)), ["a.txt.enc", "a.txt.salt"])
+
+    def test_failed_rename_keeps_source_and_leaves_no_output(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            plain = os.path.join(tmp, "a.txt")
+            Path(plain).write_text("secret")
+            with patch("modules.file_encryptor.os.replace", side_effect=OSError("disk full")):
+                worker = self._worker("encrypt", plain, "pw")
+                worker.run()
+            self.assertFalse(worker.results["ok"])
+            self.assertEqual(Path(plain).read_text(), "secret")
+            self.assertEqual(sorted(os.listdir(tmp)), ["a.txt", "a.txt.salt"])
+
+    def test_failed_decrypt_does_not_touch_existing_plaintext(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            plain = os.path.join(tmp, "a.txt")
+            Path(plain).write_text("v1")
+            self._worker("encrypt", plain, "pw").run()
+            Path(plain).write_text("v2, written since")
+
+            worker = self._worker("decrypt", plain + ".enc", "wrong")
+            worker.run()
+            self.assertFalse(worker.results["ok"])
+            self.assertEqual(Path(plain).read_text(), "v2, written since")
+            self.assertFalse(Path(plain + ".enc-partial").exists())
+            self.assertTrue(Path(plain + ".enc").exists())
+
+    def test_stale_partial_files_are_not_encrypted(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            folder = os.path.join(tmp, "docs")
+            os.mkdir(folder)
+            Path(folder, "a.txt").write_text("a")
+            Path(folder, "a.txt.enc-partial").write_bytes(b"crash leftovers")
+            worker = self._worker("encrypt", folder, "pw", is_folder=True)
+            worker.run()
+            self.assertIn("1 file(s)", worker.results["msg"])
+            self.assertFalse(Path(folder, "a.txt.enc-partial").exists())  # replaced by a rerun
+
+    def test_batched_sync_removes_sources_per_batch(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            folder = os.path.join(tmp, "docs")
+            os.mkdir(folder)
+            for i in range(10):
+                Path(folder, f"f{i}.txt").write_text(f"content {i}")
+            with (
+                patch("modules.file_encryptor._syncfs", return_value=True) as syncfs,
+                patch("modules.file_encryptor.os.fsync") as fsync,
+            ):
+                worker = self._worker("encrypt", folder, "pw", is_folder=True, sync_batch=4)
+                worker.run()
+            self.assertTrue(worker.results["ok"], worker.results["msg"])
+            self.assertEqual(syncfs.call_count, 3)  # 4 + 4 + the final 2
+            self.assertEqual(worker.sync.syncs, 3)
+            fsync.assert_not_called()
+            self.assertEqual(len(list(Path(folder).glob("*.txt"))), 0)
+            self.assertEqual(len(list(Path(folder).glob("*.enc"))), 10)
+
+    def test_batch_keeps_sources_and_journal_until_synced(self):
+        from modules.file_encryptor import _SyncBatch
+
+        with tempfile.TemporaryDirectory() as tmp:
+            done = []
+            batch = _SyncBatch(3)
+            with patch("modules.file_encryptor._syncfs", return_value=True) as sync:
+                for i in range(2):
+                    Path(tmp, f"s{i}").write_text("src")
+                    Path(tmp, f"p{i}").write_text("out")
+                    batch.commit(
+                        os.path.join(tmp, f"p{i}"),
+                        os.path.join(tmp, f"o{i}"),
+                        os.path.join(tmp, f"s{i}"),
+                        on_done=lambda i=i: done.append(i),
+                    )
+                self.assertTrue(Path(tmp, "s0").exists())
+                self.assertTrue(Path(tmp, "o0").exists())
+                self.assertEqual(done, [])
+                sync.assert_not_called()
+
+                batch.flush()
+            sync.assert_called_once()
+            self.assertEqual(done, [0, 1])
+            self.assertEqual(sorted(os.listdir(tmp)), ["o0", "o1"])
+
+    def test_batch_falls_back_to_fsync_without_syncfs(self):
+        from modules.file_encryptor import _SyncBatch
+
+        with tempfile.TemporaryDirectory() as tmp:
+            batch = _SyncBatch(5)
+            for i in range(2):
+                Path(tmp, f"s{i}").write_text("src")
+                Path(tmp, f"p{i}").write_text("out")
+                batch.commit(
+                    os.path.join(tmp, f"p{i}"),
+                    os.path.join(tmp, f"o{i}"),
+                    os.path.join(tmp, f"s{i}"),
+                )
+            with (
+                patch("modules.file_encryptor._syncfs", return_value=False),
+                patch("modules.file_encryptor.os.fsync") as fsync,
+            ):
+                batch.flush()
+            self.assertEqual(fsync.call_count, 3)  # both outputs and their directory
+            self.assertEqual(sorted(os.listdir(tmp)), ["o0", "o1"])
+
+    def test_syncfs_flushes_the_filesystem_where_available(self):
+        from modules.file_encryptor import _libc_syncfs, _syncfs
+
+        with tempfile.TemporaryDirectory() as tmp:
+            self.assertEqual(_syncfs(tmp), _libc_syncfs() is not None)
+
+    def test_batched_source_that_cannot_be_removed_fails_the_job(self):
+        from modules.file_encryptor import JOURNAL_FILE_NAME
+
+        with tempfile.TemporaryDirectory() as tmp:
+            folder = os.path.join(tmp, "docs")
+            os.mkdir(folder)
+            for i in range(6):
+                Path(folder, f"f{i}.txt").write_text(f"content {i}")
+            real_remove = os.remove
+
+            def remove(path):
+                if path.endswith("f3.txt"):
+                    raise PermissionError(13, "Permission denied", path)
+                real_remove(path)
+
+            with (
+                patch("modules.file_encryptor._syncfs", return_value=True),
+                patch("modules.file_encryptor.os.remove", side_effect=remove),
+            ):
+                worker = self._worker("encrypt", folder, "pw", is_folder=True, sync_batch=4)
+                worker.run()
+            self.assertFalse(worker.results["ok"])
+            self.assertIn("5/6", worker.results["msg"])
+            self.assertIn("f3.txt", worker.results["msg"])
+            self.assertEqual([os.path.basename(p) for p, _ in worker.errors], ["f3.txt"])
+            self.assertTrue(Path(folder, ".encryption_salt").exists())
+            # Kept so a rerun can finish the job
+            self.assertTrue(Path(folder, JOURNAL_FILE_NAME).exists())
+            self.assertTrue(Path(folder, "f3.txt").exists())
+
+    def test_failed_batch_sync_keeps_every_source(self):
+        from modules.file_encryptor import _SyncBatch
+
+        with tempfile.TemporaryDirectory() as tmp:
+            failed = []
+            batch = _SyncBatch(2, on_error=lambda source, _e: failed.append(source))
+            for i in range(2):
+                Path(tmp, f"s{i}").write_text("src")
+                Path(tmp, f"p{i}").write_text("out")
+                with patch("modules.file_encryptor._syncfs", side_effect=OSError(5, "EIO")):
+                    batch.commit(
+                        os.path.join(tmp, f"p{i}"),
+                        os.path.join(tmp, f"o{i}"),
+                        os.path.join(tmp, f"s{i}"),
+                    )
+            self.assertEqual(batch.failures, 2)
+            self.assertEqual(len(failed), 2)
+            self.assertTrue(Path(tmp, "s0").exists() and Path(tmp, "s1").exists())
+
+    def test_sync_batch_comes_from_settings(self):
+        from modules.file_encryptor import FileEncryptor
+
+        enc = FileEncryptor(MagicMock())
+        enc.services.config_manager.get_settings.return_value = {"encryption_sync_batch": 50}
+        self.assertEqual(enc._sync_batch_size(), 50)
+        enc.services.config_manager.get_settings.return_value = {"encryption_sync_batch": None}
+        self.assertEqual(enc._sync_batch_size(), 1)
+
+
+class TestDerivedKeyCache(unittest.TestCase):
+    """Opt-in session cache of derived keys."""
+
+    def setUp(self):
+        from modules.file_encryptor import DerivedKeyCache
+
+        self.now = 0.0
+        self.cache = DerivedKeyCache(ttl=60, clock=lambda: self.now)
+        self.addCleanup(self.cache.clear)
+
+    def test_disabled_by_default(self):
+        from modules.file_encryptor import DerivedKeyCache, key_cache
+
+        cache = DerivedKeyCache()
+        cache.put("pw", b"s" * 16, 1, b"key")
+        self.assertIsNone(cache.get("pw", b"s" * 16, 1))
+        self.assertFalse(key_cache.enabled)
+
+    def test_hit_requires_same_password_salt_and_iterations(self):
+        self.cache.put("pw", b"s" * 16, 1000, b"key")
+        self.assertEqual(self.cache.get("pw", b"s" * 16, 1000), b"key")
+        self.assertIsNone(self.cache.get("other", b"s" * 16, 1000))
+        self.assertIsNone(self.cache.get("pw", b"t" * 16, 1000))
+        self.assertIsNone(self.cache.get("pw", b"s" * 16, 2000))
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 3))
+
+    def test_does_not_store_the_password(self):
+        self.cache.put("hunter2", b"s" * 16, 1000, b"key")
+        (digest, _iterations, _salt), _entry = next(iter(self.cache._entries.items()))
+        self.assertNotIn(b"hunter2", digest)
+
+    def test_find_returns_newest_salt_for_password(self):
+        self.cache.put("pw", b"a" * 16, 1000, b"key-a")
+        self.cache.put("pw", b"b" * 16, 1000, b"key-b")
+        self.assertEqual(self.cache.find("pw", 1000), (b"b" * 16, b"key-b"))
+        self.assertIsNone(self.cache.find("pw", 2000))
+        self.assertIsNone(self.cache.find("nope", 1000))
+
+    def test_entries_expire_and_are_wiped(self):
+        self.cache.put("pw", b"s" * 16, 1000, b"key")
+        buffer = self.cache._entries[next(iter(self.cache._entries))][0]
+        self.now = 60.0
+        self.assertIsNone(self.cache.get("pw", b"s" * 16, 1000))
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(bytes(buffer), b"\0\0\0")
+
+    def test_hits_extend_the_lifetime(self):
+        import modules.file_encryptor as fe_mod
+
+        with patch.object(fe_mod.threading, "Timer") as timer:
+            self.cache.put("pw", b"s" * 16, 1000, b"key")
+            self.now = 50.0
+            self.assertEqual(self.cache.get("pw", b"s" * 16, 1000), b"key")
+            self.now = 100.0
+            self.assertEqual(self.cache.find("pw", 1000), (b"s" * 16, b"key"))
+            self.now = 159.0
+            self.assertEqual(self.cache.get("pw", b"s" * 16, 1000), b"key")
+            self.now = 219.0
+            self.assertIsNone(self.cache.get("pw", b"s" * 16, 1000))
+        # put and every hit rescheduled the wipe, cancelling the previous timer
+        self.assertEqual(timer.call_count, 4)
+        self.assertEqual(timer.return_value.cancel.call_count, 3)
+
+    def test_timer_wipes_after_ttl(self):
+        from modules.file_encryptor import DerivedKeyCache
+
+        cache = DerivedKeyCache(ttl=0.05)
+        cache.put("pw", b"s" * 16, 1000, b"key")
+        deadline = time.monotonic() + 5
+        while len(cache) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(len(cache), 0)
+
+    def test_disabling_clears(self):
+        self.cache.put("pw", b"s" * 16, 1000, b"key")
+        self.cache.configure(0)
+        self.assertEqual(len(self.cache), 0)
+        self.assertFalse(self.cache.enabled)
+
+    def test_decrypt_then_encrypt_derives_once_with_cache(self):
+        import modules.file_encryptor as fe_mod
+
+        with tempfile.TemporaryDirectory() as tmp:
+            folder = os.path.join(tmp, "docs")
+            os.mkdir(folder)
+            Path(folder, "a.txt").write_text("a")
+            with (
+                patch.object(fe_mod, "key_cache", self.cache),
+                patch(
+                    "modules.file_encryptor._derive_key",
+                    side_effect=_derive_key,
+                ) as derive,
+            ):
+                for operation in ("encrypt", "decrypt", "encrypt", "decrypt"):
+                    worker = EncryptionWorker(operation, folder, "pw", is_folder=True)
+                    for signal in (
+                        "finished_signal",
+                        "progress_updated",
+                        "status_updated",
+                        "bytes_progress",
+                        "rate_updated",
+                    ):
+                        setattr(worker, signal, MagicMock())
+                    worker.run()
+                    self.assertTrue(worker.finished_signal.emit.call_args.args[0])
+            self.assertEqual(derive.call_count, 1)
+            self.assertEqual(Path(folder, "a.txt").read_text(), "a")
+
+    def test_setting_configures_the_cache(self):
+        import modules.file_encryptor as fe_mod
+        from modules.file_encryptor import FileEncryptor
+
+        enc = FileEncryptor(MagicMock())
+        with patch.object(fe_mod, "key_cache", self.cache):
+            enc.services.config_manager.get_settings.return_value = {
+                "encryption_key_cache_minutes": 5
+            }
+            enc._configure_key_cache()
+            self.assertEqual(self.cache.ttl, 300)
+            enc.services.config_manager.get_settings.return_value = {}
+            enc._configure_key_cache()
+            self.assertFalse(self.cache.enabled)
+
+
 class TestLegacySaltFallback(unittest.TestCase):
     """Decryption with a legacy 16-byte salt file must succeed using 100 000 iterations."""
 
@@ -331,8 +1164,6 @@ class TestReencryptToCurrentStandard(unittest.TestCase):
         """_reencrypt_to_current_standard must produce a 20-byte .salt and .enc file."""
         import struct
 
-        from cryptography.fernet import Fernet
-
         import modules.file_encryptor as fe_mod
         from modules.file_encryptor import ENC_FILE_SUFFIX, SALT_FILE_SUFFIX
 
@@ -354,6 +1185,8 @@ class TestReencryptToCurrentStandard(unittest.TestCase):
                 patch.object(fe_mod, "PasswordDialog", return_value=mock_dialog),
                 patch.object(fe_mod, "QDialog", mock_qdialog),
                 patch.object(fe_mod.QMessageBox, "information"),
+                # Key derivation must not need a worker thread
+                patch.object(fe_mod, "EncryptionWorker", side_effect=AssertionError),
             ):
                 enc._reencrypt_to_current_standard(plain_file)
 
@@ -370,11 +1203,11 @@ class TestReencryptToCurrentStandard(unittest.TestCase):
             self.assertEqual(iterations, _PBKDF2_ITERATIONS)
 
             salt = salt_content[4:]
-            key = EncryptionWorker("encrypt", enc_file, "newpassword")._derive_key(
-                "newpassword", salt, iterations=_PBKDF2_ITERATIONS
-            )
-            decrypted = Fernet(key).decrypt(Path(enc_file).read_bytes())
-            self.assertEqual(decrypted, b"secret data")
+            key = _derive_key("newpassword", salt, iterations=_PBKDF2_ITERATIONS)
+            out = io.BytesIO()
+            with open(enc_file, "rb") as src:
+                _decrypt_stream(src, out, lambda _salt, _iterations: key)
+            self.assertEqual(out.getvalue(), b"secret data")
 
     def test_reencrypt_atomic_cleanup_on_rename_failure(self):
         """If rename fails after writing temp enc file, original plaintext is preserved."""
@@ -0,0 +1,78 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""Tests for core.file_watcher.DebouncedFileWatcher (Qt watcher is stubbed)."""
+
+from unittest.mock import MagicMock
+
+from core.file_watcher import DebouncedFileWatcher
+
+
+def _make_watcher(callback):
+    watcher = DebouncedFileWatcher(callback)
+    watcher._watcher = MagicMock()
+    watcher._watcher.files.return_value = []
+    watcher._watcher.directories.return_value = []
+    watcher._timer = MagicMock()
+    return watcher
+
+
+def test_watch_directory_requires_existing_dir(tmp_path):
+    watcher = _make_watcher(MagicMock())
+    assert watcher.watch_directory(tmp_path) is True
+    assert watcher.watch_directory(tmp_path / "missing") is False
+    watcher._watcher.addPath.assert_called_once_with(str(tmp_path))
+
+
+def test_directory_change_is_debounced_into_callback(tmp_path):
+    callback = MagicMock()
+    watcher = _make_watcher(callback)
+    watcher.watch_directory(tmp_path)
+    watcher._on_directory_changed(str(tmp_path))
+    watcher._on_directory_changed(str(tmp_path))
+    assert watcher._timer.start.call_count == 2
+    callback.assert_not_called()
+    watcher._flush()
+    callback.assert_called_once_with({str(tmp_path)})
+
+
+def test_unwatched_directory_change_is_ignored(tmp_path):
+    callback = MagicMock()
+    watcher = _make_watcher(callback)
+    watcher._on_directory_changed(str(tmp_path))
+    watcher._flush()
+    callback.assert_not_called()
+
+
+def test_stop_forgets_directories(tmp_path):
+    watcher = _make_watcher(MagicMock())
+    watcher.watch_directory(tmp_path)
+    watcher.stop()
+    watcher._on_directory_changed(str(tmp_path))
+    assert not watcher._pending
+
+
+def test_watch_files_registers_new_paths_in_one_batch(tmp_path):
+    files = [tmp_path / f"{i}.desktop" for i in range(3)]
+    for f in files:
+        f.write_text("")
+    watcher = _make_watcher(MagicMock())
+    watcher.watch_files([*files, tmp_path / "missing.desktop"])
+    watcher._watcher.addPaths.assert_called_once_with([str(tmp_path), *map(str, files)])
+    watcher._watcher.files.assert_not_called()
+
+    watcher.watch_files(files)  # already watched: nothing to register
+    watcher._watcher.addPaths.assert_called_once()
+
+    (tmp_path / "missing.desktop").write_text("")
+    watcher._on_directory_changed(str(tmp_path))
+    watcher._watcher.addPath.assert_called_once_with(str(tmp_path / "missing.desktop"))
+    assert watcher._pending == {str(tmp_path / "missing.desktop")}
+
+
+def test_stop_removes_registered_paths_in_one_batch(tmp_path):
+    (tmp_path / "a").write_text("")
+    watcher = _make_watcher(MagicMock())
+    watcher.watch_files([tmp_path / "a"])
+    watcher.stop()
+    assert sorted(watcher._watcher.removePaths.call_args.args[0]) == sorted(
+        [str(tmp_path), str(tmp_path / "a")]
+    )
@@ -0,0 +1,179 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""Tests for core.frecency.FrecencyStore (decayed launch counts)."""
+
+import datetime
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from core.frecency import FrecencyStore, app_key, command_key
+
+DAY = 86400.0
+
+
+class _Clock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def timer():
+    with patch("core.frecency.threading.Timer") as timer_cls:
+        yield timer_cls
+
+
+@pytest.fixture()
+def cm():
+    with patch("core.frecency.config_manager") as config_manager:
+        config_manager.load_frecency.return_value = {"version": 1, "entries": {}}
+        config_manager.get_history.return_value = []
+        yield config_manager
+
+
+def test_keys_distinguish_commands_and_apps():
+    assert command_key("Firefox", "firefox") != app_key("Firefox")
+
+
+def test_record_increments_and_persists(cm):
+    clock = _Clock()
+    store = FrecencyStore(half_life_days=10, clock=clock)
+    store.record("k")
+    store.record("k")
+    assert store.score("k") == pytest.approx(2.0)
+    store.flush()
+    saved = cm.save_frecency.call_args.args[0]
+    assert saved["version"] == 1 and saved["entries"]["k"][0] == pytest.approx(2.0)
+
+
+def test_record_saves_once_per_burst(cm, timer):
+    store = FrecencyStore(clock=_Clock(), save_delay=3.0)
+    store.record("a")
+    store.record("b")
+    cm.save_frecency.assert_not_called()
+    timer.assert_called_once_with(3.0, store._on_save_timer)
+
+    timer.call_args.args[1]()  # the delayed save fires
+    cm.save_frecency.assert_called_once()
+    store.flush()  # nothing pending any more
+    cm.save_frecency.assert_called_once()
+
+    store.record("a")
+    assert timer.call_count == 2
+
+
+def test_flush_cancels_pending_save(cm, timer):
+    store = FrecencyStore(clock=_Clock())
+    store.record("k")
+    store.flush()
+    timer.return_value.cancel.assert_called_once()
+    assert set(cm.save_frecency.call_args.args[0]["entries"]) == {"k"}
+
+
+def test_corrupt_entries_are_skipped(cm):
+    cm.load_frecency.return_value = {
+        "version": 1,
+        "entries": {
+            "good": [2.0, 1_000_000.0],
+            "text": ["lots", 1_000_000.0],
+            "null": [None, 1_000_000.0],
+            "nan": ["nan", 1_000_000.0],
+            "short": [1.0],
+        },
+    }
+    store = FrecencyStore(clock=_Clock())
+    assert store.scores() == {"good": pytest.approx(2.0)}
+
+
+def test_score_halves_after_half_life(cm):
+    clock = _Clock()
+    store = FrecencyStore(half_life_days=10, clock=clock)
+    store.record("k")
+    clock.now += 10 * DAY
+    assert store.score("k") == pytest.approx(0.5)
+    store.record("k")
+    assert store.score("k") == pytest.approx(1.5)
+
+
+def test_recent_beats_old_frequent(cm):
+    clock = _Clock()
+    store = FrecencyStore(half_life_days=10, clock=clock)
+    for _ in range(3):
+        store.record("old")
+    clock.now += 40 * DAY
+    store.record("new")
+    assert store.scores()["new"] > store.scores()["old"]
+
+
+def test_loads_persisted_entries_without_touching_history(cm):
+    cm.load_frecency.return_value = {"version": 1, "entries": {"k": [4.0, 1_000_000.0]}}
+    store = FrecencyStore(clock=_Clock())
+    assert store.score("k") == pytest.approx(4.0)
+    cm.get_history.assert_not_called()
+
+
+def test_seeds_from_history_when_no_store_exists(cm):
+    cm.load_frecency.return_value = None
+    ts = datetime.datetime.fromtimestamp(1_000_000.0).isoformat()
+    cm.get_history.return_value = [
+        {"title": "Top", "command": "top", "timestamp": ts},
+        {"title": "Bad"},
+    ]
+    store = FrecencyStore(clock=_Clock())
+    assert store.score(command_key("Top", "top")) == pytest.approx(1.0)
+    assert len(store.scores()) == 1
+    store.flush()
+    cm.save_frecency.assert_called_once()
+
+
+def test_concurrent_first_load_waits_for_seeding(cm):
+    cm.load_frecency.return_value = None
+    ts = datetime.datetime.fromtimestamp(1_000_000.0).isoformat()
+    store = FrecencyStore(clock=_Clock())
+    seen = {}
+
+    def history():
+        # The search worker asks for scores while the GUI thread is seeding.
+        worker = threading.Thread(target=lambda: seen.update(store.scores()))
+        worker.start()
+        worker.join(0.2)
+        seen["blocked"] = worker.is_alive()
+        seen["worker"] = worker
+        return [{"title": "Top", "command": "top", "timestamp": ts}]
+
+    cm.get_history.side_effect = history
+    store.record(command_key("Top", "top"), when=1_000_000.0)
+    seen.pop("worker").join(5)
+
+    assert seen.pop("blocked") is True
+    assert seen == {command_key("Top", "top"): pytest.approx(2.0)}
+    cm.get_history.assert_called_once()
+
+
+def test_forget_drops_key(cm):
+    store = FrecencyStore(clock=_Clock())
+    store.record("k")
+    store.forget("k")
+    assert store.score("k") == 0.0
+
+
+def test_config_manager_round_trip(tmp_path):
+    from core.config_manager import ConfigManager
+
+    mgr = ConfigManager.__new__(ConfigManager)
+    mgr.frecency_file = tmp_path / "frecency.json"
+    assert mgr.load_frecency() is None
+    mgr.save_frecency({"version": 1, "entries": {"k": [1.0, 2.0]}})
+    assert mgr.load_frecency()["entries"]["k"] == [1.0, 2.0]
+    mgr.frecency_file.write_text("[not a dict]")
+    assert mgr.load_frecency() is None
+
+
+def test_store_loads_lazily():
+    # FrecencyStore must not touch config_manager until first use.
+    with patch("core.frecency.config_manager", MagicMock()) as config_manager:
+        FrecencyStore()
+    config_manager.load_frecency.assert_not_called()
@@ -0,0 +1,144 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""Tests for core.icon_cache.IconCache (LRU + byte accounting).
+
+QPixmap/QIcon are replaced with a tiny fake so decoding can be counted
+without a display.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from core.icon_cache import FILE_ICON_BYTES, IconCache
+
+
+class _FakePixmap:
+    loads: list[str] = []
+
+    def __init__(self, path_or_pixmap=""):
+        if isinstance(path_or_pixmap, _FakePixmap):
+            self.path, self.side = path_or_pixmap.path, path_or_pixmap.side
+            return
+        _FakePixmap.loads.append(path_or_pixmap)
+        self.path = path_or_pixmap
+        self.side = 0 if "missing" in path_or_pixmap else 64
+
+    def isNull(self):  # noqa: N802
+        return self.side == 0
+
+    def width(self):
+        return self.side
+
+    def height(self):
+        return self.side
+
+    def depth(self):
+        return 32
+
+    def scaled(self, w, h, *_args):
+        scaled = _FakePixmap(self)
+        scaled.side = w
+        return scaled
+
+
+@pytest.fixture(autouse=True)
+def fake_qt():
+    _FakePixmap.loads = []
+    with (
+        patch("core.icon_cache.QPixmap", _FakePixmap),
+        patch("core.icon_cache.QIcon", side_effect=lambda px: ("icon", px)),
+        patch("core.icon_cache.os.path.realpath", side_effect=lambda p: p),
+    ):
+        yield
+
+
+def test_same_path_and_size_decoded_once():
+    cache = IconCache()
+    first = cache.pixmap("/icons/a.png")
+    assert cache.pixmap("/icons/a.png") is first
+    assert _FakePixmap.loads == ["/icons/a.png"]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_sizes_cached_separately_and_accounted():
+    cache = IconCache()
+    cache.pixmap("/icons/a.png")
+    small = cache.pixmap("/icons/a.png", size=16)
+    assert small.width() == 16
+    assert len(cache) == 2
+    assert cache.total_bytes == 64 * 64 * 4 + 16 * 16 * 4
+
+
+def test_fixed_size_icon_reuses_cached_pixmap_and_qicon():
+    cache = IconCache()
+    icon = cache.icon("/icons/a.png", size=16)
+    assert cache.icon("/icons/a.png", size=16) is icon
+    assert icon[1] is cache.pixmap("/icons/a.png", size=16)
+    assert _FakePixmap.loads == ["/icons/a.png"]
+
+
+def test_unsized_and_scalable_icons_built_from_path():
+    cache = IconCache()
+    assert cache.icon("/icons/a.png") == ("icon", "/icons/a.png")
+    svg = cache.icon("/icons/b.svg", size=16)
+    assert svg == ("icon", "/icons/b.svg")
+    assert cache.icon("/icons/b.svg", size=32) is svg
+    assert _FakePixmap.loads == []
+    assert len(cache) == 2
+    assert cache.total_bytes == 2 * FILE_ICON_BYTES
+
+
+def test_unsized_icons_are_evicted_over_budget():
+    cache = IconCache(max_bytes=3 * FILE_ICON_BYTES)
+    first = cache.icon("/icons/0.png")
+    for i in range(1, 10):
+        cache.icon(f"/icons/{i}.png")
+    assert len(cache) == 3
+    assert cache.total_bytes == 3 * FILE_ICON_BYTES
+    assert cache.icon("/icons/9.png") == ("icon", "/icons/9.png")
+    assert cache.icon("/icons/0.png") is not first  # evicted, built again
+    assert cache.misses == 11
+
+
+def test_pixmap_eviction_drops_icon_built_from_it():
+    one = 16 * 16 * 4
+    cache = IconCache(max_bytes=one)
+    cache.icon("/icons/a.png", size=16)
+    cache.pixmap("/icons/b.png", size=16)
+    assert len(cache) == 1
+    assert cache.total_bytes == one
+
+
+def test_path_resolved_only_on_miss():
+    cache = IconCache()
+    with patch("core.icon_cache.os.path.realpath", side_effect=lambda p: p) as realpath:
+        cache.pixmap("/icons/a.png")
+        cache.pixmap("/icons/a.png")
+        cache.pixmap("/icons/a.png", size=16)
+        cache.icon("/icons/a.png")
+    realpath.assert_called_once_with("/icons/a.png")
+
+
+def test_lru_eviction_by_bytes():
+    one = 64 * 64 * 4
+    cache = IconCache(max_bytes=2 * one)
+    cache.pixmap("/a.png")
+    cache.pixmap("/b.png")
+    cache.pixmap("/a.png")  # refresh a; b becomes least recently used
+    cache.pixmap("/c.png")
+    cache.pixmap("/a.png")
+    assert cache.total_bytes == 2 * one
+    cache.pixmap("/b.png")  # was evicted → decoded again
+    assert _FakePixmap.loads.count("/b.png") == 2
+    assert _FakePixmap.loads.count("/a.png") == 1
+
+
+def test_missing_file_cached_as_null_and_clear_resets():
+    cache = IconCache()
+    assert cache.pixmap("/missing.png").isNull()
+    cache.pixmap("/missing.png")
+    assert _FakePixmap.loads == ["/missing.png"]
+    cache.clear()
+    assert len(cache) == 0 and cache.total_bytes == 0
+    cache.pixmap("/missing.png")
+    assert len(_FakePixmap.loads) == 2
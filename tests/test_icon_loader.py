@@ -0,0 +1,78 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""Tests for core.icon_loader.IconLoader."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+from core.icon_loader import IconLoader
+
+
+def _make_loader(resolve):
+    loader = IconLoader(resolve)
+    loader.loaded = MagicMock()
+    return loader
+
+
+def test_loaded_is_emitted_with_decoded_image():
+    done = threading.Event()
+    loader = _make_loader(lambda name: f"/icons/{name}.png")
+    loader.loaded.emit.side_effect = lambda *a: done.set()
+    with patch("core.icon_loader.load_image", return_value="image") as load:
+        loader.request("firefox", 32)
+        assert done.wait(5)
+    loader.stop()
+    load.assert_called_once_with("/icons/firefox.png", 32)
+    loader.loaded.emit.assert_called_once_with("firefox", 32, "image")
+
+
+def test_unresolved_name_emits_none_without_decoding():
+    done = threading.Event()
+    loader = _make_loader(lambda name: None)
+    loader.loaded.emit.side_effect = lambda *a: done.set()
+    with patch("core.icon_loader.load_image") as load:
+        loader.request("nope", 32)
+        assert done.wait(5)
+    loader.stop()
+    load.assert_not_called()
+    loader.loaded.emit.assert_called_once_with("nope", 32, None)
+
+
+def test_resolve_errors_are_reported_as_missing():
+    done = threading.Event()
+    loader = _make_loader(MagicMock(side_effect=OSError("boom")))
+    loader.loaded.emit.side_effect = lambda *a: done.set()
+    loader.request("bad", 16)
+    assert done.wait(5)
+    loader.stop()
+    loader.loaded.emit.assert_called_once_with("bad", 16, None)
+
+
+def test_newest_requests_load_first_and_clear_drops_pending():
+    started = threading.Event()
+    release = threading.Event()
+    order = []
+
+    def resolve(name):
+        if name == "first":
+            started.set()
+            release.wait(5)
+        order.append(name)
+
+    loader = _make_loader(resolve)
+    loader.request("first", 32)
+    assert started.wait(5)
+    loader.request("first", 32)  # already loading: not queued again
+    for name in ("a", "b", "c"):
+        loader.request(name, 32)
+    loader.request("a", 32)  # repainted: moves to the front
+    assert loader.pending() == [("a", 32), ("c", 32), ("b", 32)]
+
+    loader.clear_pending()
+    assert loader.pending() == []
+    done = threading.Event()
+    loader.loaded.emit.side_effect = lambda name, *a: name == "d" and done.set()
+    loader.request("d", 32)
+    release.set()
+    assert done.wait(5)
+    loader.stop()
+    assert order == ["first", "d"]
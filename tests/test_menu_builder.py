@@ -0,0 +1,230 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""Tests for :class:`core.menu_builder.MenuBuilder` incremental updates.
+
+Qt menus are replaced with ``MagicMock`` objects so the tests only verify
+which submenus are created, inserted and removed.  PyQt6 is stubbed in
+``conftest.py``.
+"""
+
+from unittest.mock import MagicMock, patch
+
+from core.config_manager import CommandsDiff
+from core.menu_builder import MenuBuilder
+
+
+def _make_builder():
+    tray_app = MagicMock()
+    tray_app.icon_file = "icon.png"
+    tray_app._resolve_icon_path.return_value = None
+    builder = MenuBuilder(tray_app)
+    return builder, tray_app
+
+
+def _tracked_menus(tray_app, groups):
+    menus = {g: MagicMock(name=f"menu-{g}") for g in groups}
+    tray_app._group_menus = dict(menus)
+    return menus
+
+
+def test_apply_diff_refuses_reordered_trees():
+    builder, tray_app = _make_builder()
+    _tracked_menus(tray_app, ["A", "B"])
+    assert (
+        builder.apply_diff(MagicMock(), {"B": {}, "A": {}}, CommandsDiff(reordered=True)) is False
+    )
+
+
+def test_apply_diff_refuses_untracked_menu():
+    builder, tray_app = _make_builder()
+    tray_app._group_menus = None
+    assert builder.apply_diff(MagicMock(), {}, CommandsDiff(changed=("A",))) is False
+
+
+def test_apply_diff_replaces_only_changed_group():
+    builder, tray_app = _make_builder()
+    menus = _tracked_menus(tray_app, ["A", "B"])
+    root = MagicMock()
+    commands = {"A": {"x": {"command": "x"}}, "B": {"y": {"command": "y2"}}}
+
+    with patch.object(builder, "_create_group_menu") as create:
+        assert builder.apply_diff(root, commands, CommandsDiff(changed=("B",))) is True
+
+    create.assert_called_once_with(root, "B", commands["B"])
+    root.insertMenu.assert_called_once_with(menus["B"].menuAction(), create.return_value)
+    root.removeAction.assert_called_once_with(menus["B"].menuAction())
+    assert tray_app._group_menus["A"] is menus["A"]
+    assert tray_app._group_menus["B"] is create.return_value
+
+
+def test_apply_diff_inserts_added_group_before_following_group():
+    builder, tray_app = _make_builder()
+    menus = _tracked_menus(tray_app, ["A", "C"])
+    root = MagicMock()
+    commands = {"A": {}, "B": {"n": {"command": "n"}}, "C": {}}
+
+    with patch.object(builder, "_create_group_menu") as create:
+        builder.apply_diff(root, commands, CommandsDiff(added=("B",)))
+
+    root.insertMenu.assert_called_once_with(menus["C"].menuAction(), create.return_value)
+
+
+def test_apply_diff_appends_trailing_group_before_favorites():
+    builder, tray_app = _make_builder()
+    _tracked_menus(tray_app, ["A"])
+    root = MagicMock()
+
+    with patch.object(builder, "_create_group_menu") as create:
+        builder.apply_diff(root, {"A": {}, "Z": {}}, CommandsDiff(added=("Z",)))
+
+    root.insertMenu.assert_called_once_with(
+        tray_app.favorites_menu.menuAction(), create.return_value
+    )
+
+
+def test_apply_diff_removes_deleted_group():
+    builder, tray_app = _make_builder()
+    menus = _tracked_menus(tray_app, ["A", "B"])
+    root = MagicMock()
+
+    builder.apply_diff(root, {"A": {}}, CommandsDiff(removed=("B",)))
+
+    root.removeAction.assert_called_once_with(menus["B"].menuAction())
+    assert "B" not in tray_app._group_menus
+
+
+class _FakeMenu:
+    """Ordered stand-in for QMenu: tracks its actions the way Qt does."""
+
+    def __init__(self, title):
+        self.title = title
+        self.actions = []
+        self.deleted = False
+        self._action = MagicMock(name=f"action-{title}")
+        self._action.menu.return_value = self
+
+    def menuAction(self):  # noqa: N802
+        return self._action
+
+    def addMenu(self, submenu):  # noqa: N802
+        self.actions.append(submenu.menuAction())
+
+    def insertMenu(self, before, submenu):  # noqa: N802
+        self.actions.insert(self.actions.index(before), submenu.menuAction())
+
+    def removeAction(self, action):  # noqa: N802
+        self.actions.remove(action)
+
+    def deleteLater(self):  # noqa: N802
+        self.deleted = True
+
+    def titles(self):
+        return [action.menu().title for action in self.actions]
+
+
+def test_apply_diff_keeps_menu_order_for_mixed_changes():
+    builder, tray_app = _make_builder()
+    root = _FakeMenu("root")
+    old = {g: _FakeMenu(g) for g in ["A", "B", "C"]}
+    for submenu in [*old.values(), _FakeMenu("Favorites"), _FakeMenu("History")]:
+        root.addMenu(submenu)
+    tray_app.favorites_menu = root.actions[3].menu()
+    tray_app._group_menus = dict(old)
+    commands = {"N": {}, "A": {"x": {"command": "x2"}}, "C": {}, "D": {}}
+    diff = CommandsDiff(added=("N", "D"), removed=("B",), changed=("A",))
+
+    with patch.object(
+        builder, "_create_group_menu", side_effect=lambda _root, group, _items: _FakeMenu(group)
+    ):
+        assert builder.apply_diff(root, commands, diff) is True
+
+    assert root.titles() == ["N", "A", "C", "D", "Favorites", "History"]
+    assert root.actions[1] is not old["A"].menuAction()
+    assert root.actions[2] is old["C"].menuAction()
+    assert old["A"].deleted and old["B"].deleted and not old["C"].deleted
+    assert list(tray_app._group_menus) == ["A", "C", "N", "D"]
+    assert tray_app._group_menus["A"].menuAction() is root.actions[1]
+
+
+# ---------------------------------------------------------------------------
+# Lazy mode
+# ---------------------------------------------------------------------------
+
+TREE = {
+    "System": {
+        "icon": "sys.png",
+        "Top": {"command": "top"},
+        "Disk": {"Usage": {"command": "df -h"}},
+    },
+    "Git": {"Status": {"command": "git status"}},
+}
+
+
+def _lazy_groups(builder, tray_app):
+    """Build TREE lazily with fresh MagicMock menus; return the root menu."""
+    root = MagicMock()
+    with (
+        patch("core.menu_builder.QMenu", side_effect=lambda *a: MagicMock(name=str(a[0]))),
+        patch("core.menu_builder.icon_cache"),
+        patch("core.menu_builder.QAction"),
+    ):
+        builder.build(root, TREE)
+    return root
+
+
+def _show(menu):
+    """Fire every aboutToShow handler connected to *menu*."""
+    for call in menu.aboutToShow.connect.call_args_list:
+        call.args[0]()
+
+
+def test_lazy_build_defers_group_contents_and_icons():
+    tray_app = MagicMock()
+    tray_app.icon_file = "icon.png"
+    builder = MenuBuilder(tray_app, lazy=True)
+    with patch.object(builder, "_add_menu_items") as add_items:
+        _lazy_groups(builder, tray_app)
+        add_items.assert_not_called()
+    tray_app._resolve_icon_path.assert_not_called()
+
+    system = tray_app._group_menus["System"]
+    system.setIcon.assert_not_called()
+    system.aboutToShow.connect.assert_called_once()
+
+
+def test_lazy_group_populates_once_on_first_show():
+    tray_app = MagicMock()
+    tray_app.icon_file = "icon.png"
+    tray_app._resolve_icon_path.return_value = None
+    builder = MenuBuilder(tray_app, lazy=True)
+    _lazy_groups(builder, tray_app)
+    system = tray_app._group_menus["System"]
+
+    with (
+        patch.object(builder, "_add_command_to_menu") as add_command,
+        patch("core.menu_builder.QMenu", side_effect=lambda *a: MagicMock(name=str(a[0]))),
+        patch("core.menu_builder.icon_cache"),
+    ):
+        _show(system)
+        _show(system)
+
+    # Only the direct command is added; the nested group is itself deferred.
+    add_command.assert_called_once()
+    assert add_command.call_args.args[1] == "Top"
+    nested = system.addMenu.call_args.args[0]
+    nested.aboutToShow.connect.assert_called_once()
+
+
+def test_lazy_root_show_resolves_group_icons_once():
+    tray_app = MagicMock()
+    tray_app.icon_file = "icon.png"
+    tray_app._resolve_icon_path.return_value = None
+    builder = MenuBuilder(tray_app, lazy=True)
+    root = _lazy_groups(builder, tray_app)
+
+    with patch("core.menu_builder.icon_cache"):
+        _show(root)
+        _show(root)
+
+    tray_app._group_menus["System"].setIcon.assert_called_once()
+    tray_app._group_menus["Git"].setIcon.assert_called_once()
+    tray_app._resolve_icon_path.assert_called_once_with("sys.png")
@@ -201,10 +201,11 @@ def _make_services(pinned=None, commands=None, visible=False):
         }
     }
     svc.config_manager.get_settings.return_value = settings
-    svc.get_all_commands.return_value = commands or [
-        {"group": "System", "label": "Terminal", "command": "xterm"},
-        {"group": "System", "label": "Editor", "command": "gedit"},
-    ]
+    from core.command_index import CommandIndex
+
+    svc.get_command_index.return_value = CommandIndex.from_commands(
+        commands or {"System": {"Terminal": {"command": "xterm"}, "Editor": {"command": "gedit"}}}
+    )
     return svc
 
 
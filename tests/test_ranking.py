@@ -0,0 +1,253 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""Tests for core.ranking (fuzzy score blended with frecency)."""
+
+from dataclasses import dataclass, field
+
+import core.ranking as ranking
+from core.command_index import CommandIndex
+from core.frecency import app_key, command_key
+from core.ranking import (
+    FRECENCY_WEIGHT,
+    MATCH_THRESHOLD,
+    SearchSession,
+    app_session,
+    command_session,
+    extract,
+    frecency_boost,
+    fuzzy_score,
+)
+
+
+class _Store:
+    def __init__(self, scores=None):
+        self._scores = scores or {}
+
+    def scores(self):
+        return dict(self._scores)
+
+
+INDEX = CommandIndex.from_commands(
+    {
+        "Git": {"Status": {"command": "git status"}, "Stash": {"command": "git stash"}},
+        "System": {"Terminal": {"command": "xterm"}},
+    }
+)
+
+
+def _reference(query, items, store):
+    """Score every item one by one; what SearchSession must agree with."""
+    scores = store.scores()
+    ranked = []
+    for index, item in enumerate(items):
+        score = fuzzy_score(query, item)
+        if score > MATCH_THRESHOLD or query.lower() in item.lower():
+            ranked.append((score + frecency_boost(scores.get(item, 0.0)), index))
+    ranked.sort(key=lambda entry: (-entry[0], entry[1]))
+    return [items[index] for _score, index in ranked]
+
+
+def _labels(query, store=None, **kwargs):
+    session = command_session(INDEX, store=store or _Store())
+    return [c.label for c in session.search(query, **kwargs)]
+
+
+def test_boost_is_bounded():
+    assert frecency_boost(0) == 0
+    assert 0 < frecency_boost(1) < frecency_boost(10) < FRECENCY_WEIGHT
+
+
+def test_empty_query_orders_by_frecency_and_keeps_order_otherwise():
+    assert _labels("") == ["Status", "Stash", "Terminal"]
+    store = _Store({command_key("Terminal", "xterm"): 5.0})
+    assert _labels("  ", store)[0] == "Terminal"
+
+
+def test_frecency_breaks_near_ties():
+    plain = _labels("git st")
+    assert set(plain[:2]) == {"Status", "Stash"}
+    boosted_label = plain[1]
+    boosted_cmd = next(c for c in INDEX if c.label == boosted_label).command
+    store = _Store({command_key(boosted_label, boosted_cmd): 10.0})
+    assert _labels("git st", store)[0] == boosted_label
+
+
+def test_frecency_does_not_resurrect_non_matches():
+    store = _Store({command_key("Terminal", "xterm"): 1000.0})
+    assert "Terminal" not in _labels("zzqq", store)
+
+
+def test_substring_fallback_keeps_low_fuzzy_matches():
+    items = ["a very long label containing xyz somewhere in the middle of it all"]
+    assert SearchSession(items, text=str, key=str, store=_Store()).search("xyz") == items
+
+
+@dataclass
+class _App:
+    name: str
+    categories: list = field(default_factory=list)
+
+    @property
+    def categories_str(self):
+        return ", ".join(self.categories)
+
+
+def test_rank_apps_uses_app_keys():
+    apps = [_App("Firefox", ["Network"]), _App("Files", ["Utility"])]
+    store = _Store({app_key("Files"): 8.0})
+    assert app_session(apps, store=store).search("")[0].name == "Files"
+    assert app_session(apps, store=store).search("fire")[0].name == "Firefox"
+
+
+def test_extract_returns_best_first_with_indices():
+    results = extract("git", ["xterm", "git stash", "Git status"], score_cutoff=30)
+    assert results[0][0] == "git stash" and results[0][2] == 1
+    assert all(score >= 30 for _c, score, _i in results)
+    assert len(extract("git", ["xterm", "git stash", "Git status"], limit=1)) == 1
+
+
+def test_substring_extract_matches_rapidfuzz_contract(monkeypatch):
+    monkeypatch.setattr(ranking, "_FUZZY_AVAILABLE", False)
+    assert extract("GIT", ["xterm", "git stash", "Git status"]) == [
+        ("git stash", 100.0, 1),
+        ("Git status", 100.0, 2),
+    ]
+    assert _labels("git") == ["Status", "Stash"]
+
+
+def test_index_texts_are_used_as_choices():
+    assert INDEX.texts == tuple(c.text for c in INDEX)
+
+
+def test_limit_is_a_prefix_of_the_full_ranking():
+    store = _Store({command_key("Terminal", "xterm"): 2.0})
+    full = _labels("t", store)
+    for n in range(1, len(full) + 1):
+        assert _labels("t", store, limit=n) == full[:n]
+
+
+CATALOGUE = [f"tool {i}" for i in range(50)] + ["docker ps", "docker compose up", "dock app"]
+
+
+def _session(store=None, **kwargs):
+    return SearchSession(CATALOGUE, text=str, key=str, store=store or _Store(), **kwargs)
+
+
+def _spy_extract(monkeypatch):
+    sizes = []
+    real = ranking.extract
+
+    def spy(query, choices, **kwargs):
+        sizes.append(len(choices))
+        return real(query, choices, **kwargs)
+
+    monkeypatch.setattr(ranking, "extract", spy)
+    return sizes
+
+
+def test_session_matches_full_ranking():
+    session = _session()
+    for query in ("dock", "docke", "docker", "dock", "tool 1"):
+        assert session.search(query) == _reference(query, CATALOGUE, _Store())
+
+
+def test_session_narrowing_skips_candidates_dropped_by_prefix():
+    session = _session()
+    session.search("d")
+    narrowed = session.search("do")
+    assert set(narrowed) <= set(_reference("d", CATALOGUE, _Store()))
+
+
+def test_session_narrows_extended_queries(monkeypatch):
+    session = _session()
+    sizes = _spy_extract(monkeypatch)
+    session.search("dock")
+    session.search("docke")
+    assert sizes[0] == len(CATALOGUE)
+    assert sizes[1] == len(_reference("dock", CATALOGUE, _Store()))
+
+
+def test_session_reuses_cached_query_on_backspace(monkeypatch):
+    session = _session()
+    sizes = _spy_extract(monkeypatch)
+    first = session.search("dock")
+    session.search("docke")
+    assert session.search("dock") == first
+    assert len(sizes) == 2
+
+
+def test_session_cache_is_bounded():
+    session = _session(max_queries=2)
+    for query in ("a", "b", "c"):
+        session.search(query)
+    assert list(session._cache) == ["b", "c"]
+
+
+def test_session_applies_current_frecency():
+    store = _Store()
+    session = _session(store=store)
+    assert session.search("docker")[0] == "docker ps"
+    store._scores["docker compose up"] = 50.0
+    assert session.search("docker")[0] == "docker compose up"
+    assert session.search("docker", limit=1) == ["docker compose up"]
+
+
+def test_command_session_uses_index():
+    session = command_session(INDEX, store=_Store())
+    assert session.items is INDEX
+    assert [c.text for c in session.search("git st")] == _reference(
+        "git st", list(INDEX.texts), _Store()
+    )
+
+
+def test_session_limit_is_a_prefix_of_the_full_ranking():
+    store = _Store({"tool 7": 3.0, "dock app": 40.0})
+    for query in ("d", "dock", "tool", "o", "zzqq", "up"):
+        full = _reference(query, CATALOGUE, store)
+        assert _session(store=store).search(query) == full
+        for n in (1, 2, 3, 10, 60):
+            assert _session(store=store).search(query, limit=n) == full[:n], (query, n)
+
+
+def test_session_limit_is_passed_to_extract(monkeypatch):
+    calls = []
+    real = ranking.extract
+
+    def spy(query, choices, **kwargs):
+        calls.append((len(choices), kwargs.get("limit")))
+        return real(query, choices, **kwargs)
+
+    monkeypatch.setattr(ranking, "extract", spy)
+    session = _session()
+    session.search("tool", limit=5)
+    assert calls == [(len(CATALOGUE), 5)]
+    # A full top-N may be missing matches, so it is not used for narrowing.
+    assert "tool" not in session._cache
+
+
+def test_short_top_n_is_complete_and_cached():
+    session = _session()
+    result = session.search("docker", limit=10)
+    assert result[:2] == ["docker ps", "docker compose up"]
+    assert "docker" in session._cache
+
+
+def test_boosted_item_outside_fuzzy_top_n_is_found():
+    items = ["alpha build", "alpha builds", "alpha b"]
+    plain = SearchSession(items, text=str, key=str, store=_Store()).search("alpha build")
+    store = _Store({plain[-1]: 1000.0})
+    limited = SearchSession(items, text=str, key=str, store=store).search("alpha build", limit=1)
+    assert limited == [plain[-1]]
+
+
+def test_substring_hits_are_found_in_one_pass():
+    session = SearchSession(
+        ["Foo bar", "xyz", "abc xyz", "nothing"],
+        text=str,
+        key=str,
+        substring_text=lambda s: s.lower(),
+        store=_Store(),
+    )
+    assert session._substring_hits("xyz") == [1, 2]
+    assert session._substring_hits("o") == [0, 3]
+    assert session._substring_hits("\x00") == []
+    assert session._substring_hits("missing") == []
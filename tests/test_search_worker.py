@@ -0,0 +1,92 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""Tests for core.search_worker.SearchWorker."""
+
+import threading
+from unittest.mock import MagicMock
+
+from core.search_worker import SearchWorker
+
+
+def _make_worker():
+    worker = SearchWorker()
+    worker.results_ready = MagicMock()
+    return worker
+
+
+def test_results_are_posted_with_generation():
+    worker = _make_worker()
+    done = threading.Event()
+    worker.results_ready.emit.side_effect = lambda *a: done.set()
+    generation = worker.submit(lambda q: [q.upper()], "abc")
+    assert done.wait(5)
+    worker.results_ready.emit.assert_called_once_with(generation, ["ABC"])
+    assert worker.is_current(generation)
+    worker.stop()
+
+
+def test_pending_job_is_replaced_by_newer_query():
+    worker = _make_worker()
+    release = threading.Event()
+    started = threading.Event()
+    done = threading.Event()
+    calls = []
+
+    def slow(q):
+        started.set()
+        release.wait(5)
+        calls.append(q)
+        return q
+
+    def fast(q):
+        calls.append(q)
+        done.set()
+        return q
+
+    first = worker.submit(slow, "a")
+    assert started.wait(5)
+    worker.submit(fast, "ab")  # queued behind the running job…
+    last = worker.submit(fast, "abc")  # …and replaced before it starts
+    release.set()
+    assert done.wait(5)
+    worker.stop()
+
+    assert calls == ["a", "abc"]
+    posted = [c.args[0] for c in worker.results_ready.emit.call_args_list]
+    assert first not in posted
+    assert posted == [last]
+
+
+def test_cancel_suppresses_running_results():
+    worker = _make_worker()
+    release = threading.Event()
+    started = threading.Event()
+    finished = threading.Event()
+
+    def job():
+        started.set()
+        release.wait(5)
+        finished.set()
+        return []
+
+    generation = worker.submit(job)
+    assert started.wait(5)
+    worker.cancel()
+    release.set()
+    assert finished.wait(5)
+    worker.stop()
+    assert not worker.is_current(generation)
+    worker.results_ready.emit.assert_not_called()
+
+
+def test_failing_job_does_not_kill_worker():
+    worker = _make_worker()
+    done = threading.Event()
+    worker.results_ready.emit.side_effect = lambda *a: done.set()
+
+    def boom():
+        raise ValueError("bad")
+
+    worker.submit(boom)
+    worker.submit(lambda: "ok")
+    assert done.wait(5)
+    worker.stop()
@@ -218,11 +218,8 @@ def test_update_badge_hides_running_action_when_zero():
     app = object.__new__(TrayApp)
     app._running_processes = {}
     app._running_action = MagicMock()
-    app.icon_file = "icon.png"
-    app.tray_icon = MagicMock()
-    with patch("core.tray_app.QPixmap") as qpix:
-        qpix.return_value.isNull.return_value = True
-        app._update_tray_badge()
+    app._badge_timer = MagicMock()
+    app._update_tray_badge()
     app._running_action.setVisible.assert_any_call(False)
     app._running_action.setText.assert_not_called()
 
@@ -232,15 +229,40 @@ def test_update_badge_shows_count_when_running():
     app = object.__new__(TrayApp)
     app._running_processes = {"a": MagicMock(), "b": MagicMock()}
     app._running_action = MagicMock()
-    app.icon_file = "icon.png"
-    app.tray_icon = MagicMock()
-    with patch("core.tray_app.QPixmap") as qpix:
-        qpix.return_value.isNull.return_value = True
-        app._update_tray_badge()
+    app._badge_timer = MagicMock()
+    app._badge_timer.isActive.return_value = False
+    app._update_tray_badge()
     app._running_action.setText.assert_any_call("Running: 2")
+    app._badge_timer.start.assert_called_once()
     app._running_action.setVisible.assert_any_call(True)
 
 
+def test_update_badge_coalesces_while_repaint_pending():
+    """A repaint already scheduled for this frame is not restarted."""
+    app = object.__new__(TrayApp)
+    app._running_processes = {"a": MagicMock()}
+    app._running_action = None
+    app._badge_timer = MagicMock()
+    app._badge_timer.isActive.return_value = True
+    app._update_tray_badge()
+    app._badge_timer.start.assert_not_called()
+
+
+def test_repaint_badge_sets_icon_only_when_count_changes():
+    """_repaint_tray_badge uses the renderer and skips redundant setIcon calls."""
+    app = object.__new__(TrayApp)
+    app._running_processes = {"a": MagicMock(), "b": MagicMock()}
+    app._badge_count = 0
+    app._badge_renderer = MagicMock()
+    app.tray_icon = MagicMock()
+
+    app._repaint_tray_badge()
+    app._repaint_tray_badge()
+
+    app._badge_renderer.icon.assert_called_once_with(2)
+    app.tray_icon.setIcon.assert_called_once_with(app._badge_renderer.icon.return_value)
+
+
 # --------------------------------------------------------------------------- #
 # show_command_output() lifecycle / _on_finished                                #
 # --------------------------------------------------------------------------- #
@@ -295,3 +317,143 @@ def test_reregister_bar_hotkey_swallows_exception():
     app.quick_launch_bar.unregister_hotkey.side_effect = RuntimeError("boom")
     # Must not raise.
     app._reregister_bar_hotkey("ctrl+y")
+
+
+# --------------------------------------------------------------------------- #
+# _on_commands_file_changed() — watcher-driven incremental reload              #
+# --------------------------------------------------------------------------- #
+
+
+def _make_watch_app(command_menu):
+    app = object.__new__(TrayApp)
+    app.command_menu = command_menu
+    app.menu = MagicMock()
+    app.tray_icon = MagicMock()
+    app.quick_launch_bar = MagicMock()
+    app.reload_favorites_commands = MagicMock()
+    app._update_tray_tooltip = MagicMock()
+    return app
+
+
+def test_commands_file_change_applies_diff_incrementally(tmp_path):
+    """A changed group is patched via MenuBuilder.apply_diff without a full rebuild."""
+    old = {"A": {"x": {"command": "x"}}, "B": {"y": {"command": "y"}}}
+    new = {"A": {"x": {"command": "x"}}, "B": {"y": {"command": "y2"}}}
+    app = _make_watch_app(old)
+    active = tmp_path / "commands.json"
+    active.write_text("{}")
+    with (
+        patch("core.tray_app.config_manager") as cm,
+        patch("core.tray_app.MenuBuilder") as builder_cls,
+    ):
+        cm.get_active_commands_file.return_value = active
+        cm.get_commands.return_value = new
+        builder_cls.return_value.apply_diff.return_value = True
+        app._on_commands_file_changed()
+
+    diff = builder_cls.return_value.apply_diff.call_args[0][2]
+    assert diff.changed == ("B",)
+    builder_cls.return_value.build.assert_not_called()
+    app.menu.clear.assert_not_called()
+    app.quick_launch_bar.refresh.assert_called_once()
+    assert app.command_menu is new
+
+
+def test_commands_file_change_identical_tree_is_noop(tmp_path):
+    """An unchanged command tree (e.g. our own save) touches nothing."""
+    tree = {"A": {"x": {"command": "x"}}}
+    app = _make_watch_app(tree)
+    active = tmp_path / "commands.json"
+    active.write_text("{}")
+    with (
+        patch("core.tray_app.config_manager") as cm,
+        patch("core.tray_app.MenuBuilder") as builder_cls,
+    ):
+        cm.get_active_commands_file.return_value = active
+        cm.get_commands.return_value = {"A": {"x": {"command": "x"}}}
+        app._on_commands_file_changed()
+
+    builder_cls.assert_not_called()
+    app.quick_launch_bar.refresh.assert_not_called()
+
+
+def test_commands_file_change_invalid_file_keeps_menu(tmp_path):
+    """A file that fails validation keeps the current tree and notifies the user."""
+    from core.config_manager import ConfigurationError
+
+    tree = {"A": {"x": {"command": "x"}}}
+    app = _make_watch_app(tree)
+    app.notify_user = MagicMock()
+    active = tmp_path / "commands.json"
+    active.write_text("{")
+    with (
+        patch("core.tray_app.config_manager") as cm,
+        patch("core.tray_app.MenuBuilder") as builder_cls,
+    ):
+        cm.get_active_commands_file.return_value = active
+        cm.get_commands.side_effect = ConfigurationError("bad json")
+        app._on_commands_file_changed()
+
+    assert app.command_menu is tree
+    app.notify_user.assert_called_once()
+    builder_cls.assert_not_called()
+
+
+def test_commands_file_written_by_us_is_not_reparsed(tmp_path):
+    """A notification for our own save skips the reload the saver already did."""
+    app = _make_watch_app({"A": {}})
+    active = tmp_path / "commands.json"
+    active.write_text("{}")
+    with (
+        patch("core.tray_app.config_manager") as cm,
+        patch("core.tray_app.MenuBuilder") as builder_cls,
+    ):
+        cm.get_active_commands_file.return_value = active
+        cm.commands_changed_on_disk.return_value = False
+        app._on_commands_file_changed()
+
+    cm.get_commands.assert_not_called()
+    builder_cls.assert_not_called()
+
+
+def test_commands_watcher_follows_active_file_and_setting(tmp_path):
+    """The watch is re-pointed when the active file changes and dropped when disabled."""
+    app = object.__new__(TrayApp)
+    first, second = tmp_path / "commands.json", tmp_path / "custom.json"
+    settings = {"auto_reload_commands": True}
+    with (
+        patch("core.tray_app.config_manager") as cm,
+        patch("core.tray_app.DebouncedFileWatcher") as watcher_cls,
+    ):
+        cm.get_settings.return_value = settings
+        cm.get_active_commands_file.return_value = first
+        app._setup_commands_watcher()
+        app._setup_commands_watcher()
+        cm.get_active_commands_file.return_value = second
+        app._setup_commands_watcher()
+        settings["auto_reload_commands"] = False
+        app._setup_commands_watcher()
+
+    watcher = watcher_cls.return_value
+    watcher_cls.assert_called_once()
+    assert [c.args[0] for c in watcher.watch_file.call_args_list] == [str(first), str(second)]
+    assert watcher.stop.call_count == 2
+
+
+def test_build_menu_uses_commands_loaded_by_build_services():
+    """Startup builds the first menu without reading the commands file again."""
+    app = object.__new__(TrayApp)
+    app.command_menu = {"A": {"x": {"command": "x"}}}
+    app.menu = MagicMock()
+    app.tray_icon = MagicMock()
+    app._update_tray_tooltip = MagicMock()
+    app._setup_commands_watcher = MagicMock()
+    with (
+        patch("core.tray_app.config_manager") as cm,
+        patch("core.tray_app.MenuBuilder") as builder_cls,
+    ):
+        app._build_menu()
+
+    cm.get_commands.assert_not_called()
+    builder_cls.return_value.build.assert_called_once_with(app.menu, app.command_menu)
+    app._setup_commands_watcher.assert_called_once()
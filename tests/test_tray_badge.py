@@ -0,0 +1,57 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""Tests for core.tray_badge (memoised tray badge rendering)."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from core.tray_badge import TrayBadgeRenderer, badge_text
+
+
+@pytest.mark.parametrize(("count", "text"), [(1, "1"), (42, "42"), (99, "99"), (100, "99+")])
+def test_badge_text_caps_at_99_plus(count, text):
+    assert badge_text(count) == text
+
+
+@pytest.fixture()
+def cache():
+    with patch("core.tray_badge.icon_cache") as icon_cache:
+        icon_cache.pixmap.return_value.isNull.return_value = False
+        yield icon_cache
+
+
+def test_each_label_rendered_once(cache):
+    renderer = TrayBadgeRenderer("icon.png")
+    with (
+        patch.object(TrayBadgeRenderer, "_render") as render,
+        patch("core.tray_badge.QIcon", side_effect=lambda px: MagicMock()),
+    ):
+        first = renderer.icon(3)
+        assert renderer.icon(3) is first
+        renderer.icon(150)
+        renderer.icon(200)  # same "99+" label as 150
+    assert [c.args[1] for c in render.call_args_list] == ["3", "99+"]
+    cache.pixmap.assert_called_once_with("icon.png")
+
+
+def test_zero_count_returns_plain_cached_icon(cache):
+    renderer = TrayBadgeRenderer("icon.png")
+    assert renderer.icon(0) is cache.icon.return_value
+
+
+def test_null_base_returns_none(cache):
+    cache.pixmap.return_value.isNull.return_value = True
+    assert TrayBadgeRenderer("missing.png").icon(2) is None
+
+
+def test_clear_reloads_base_and_rerenders(cache):
+    renderer = TrayBadgeRenderer("icon.png")
+    with (
+        patch.object(TrayBadgeRenderer, "_render") as render,
+        patch("core.tray_badge.QIcon"),
+    ):
+        renderer.icon(1)
+        renderer.clear()
+        renderer.icon(1)
+    assert render.call_count == 2
+    assert cache.pixmap.call_count == 2